@@ -10,6 +10,7 @@ from aim.cli.reindex import commands as reindex_commands
 from aim.cli.runs import commands as runs_commands
 from aim.cli.convert import commands as convert_commands
 from aim.cli.storage import commands as storage_commands
+from aim.cli.export import commands as export_commands
 
 core._verify_python3_env = lambda: None
 
@@ -29,3 +30,4 @@ cli_entry_point.add_command(reindex_commands.reindex, REINDEX_NAME)
 cli_entry_point.add_command(runs_commands.runs, RUNS_NAME)
 cli_entry_point.add_command(convert_commands.convert, CONVERT)
 cli_entry_point.add_command(storage_commands.storage, STORAGE)
+cli_entry_point.add_command(export_commands.export, EXPORT_NAME)
@@ -6,3 +6,4 @@ SERVER_NAME = 'server'
 RUNS_NAME = 'runs'
 CONVERT = 'convert'
 STORAGE = 'storage'
+EXPORT_NAME = 'export'
@@ -0,0 +1,53 @@
+import click
+import time
+
+from aim.sdk.repo import Repo
+from aim.sdk.utils import clean_repo_path
+
+
+@click.command()
+@click.option('--repo', required=False, type=click.Path(exists=True,
+                                                        file_okay=False,
+                                                        dir_okay=True))
+@click.option('-q', '--query', required=False, type=str, default='',
+              help='Query expression selecting the exported metrics or runs')
+@click.option('--runs', 'export_runs', required=False, is_flag=True, default=False,
+              help='Export runs props and params instead of metrics values')
+@click.option('--only-last', required=False, is_flag=True, default=False,
+              help='Export only the last value of each metric')
+@click.option('-f', '--format', 'output_format', required=False, type=click.Choice(['parquet', 'arrow']),
+              default='parquet', help='Output format: Parquet file or Arrow IPC stream')
+@click.option('-w', '--workers', required=False, type=click.IntRange(min=1), default=1,
+              help='Number of worker processes evaluating the query')
+@click.argument('output', type=click.Path(dir_okay=False, writable=True))
+def export(repo, query, export_runs, only_last, output_format, workers, output):
+    """
+    Export metrics or runs matching the query to a Parquet file or Arrow IPC stream.
+    """
+    repo_path = clean_repo_path(repo) or Repo.default_repo_path()
+    repo_inst = Repo.from_path(repo_path)
+
+    if export_runs:
+        collection = repo_inst.query_runs(query, workers=workers)
+    else:
+        collection = repo_inst.query_metrics(query, workers=workers)
+
+    start_time = time.time()
+    try:
+        if output_format == 'parquet':
+            n_rows = collection.to_parquet(output, only_last=only_last)
+        else:
+            reader = collection.to_arrow(only_last=only_last)
+            import pyarrow as pa
+
+            n_rows = 0
+            with pa.OSFile(output, 'wb') as sink, pa.ipc.new_stream(sink, reader.schema) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    n_rows += batch.num_rows
+    except ModuleNotFoundError as e:
+        click.echo(str(e), err=True)
+        exit(1)
+    elapsed_time = time.time() - start_time
+
+    click.echo(f'Exported {n_rows} rows to \'{output}\' in {elapsed_time:.2f}s.')
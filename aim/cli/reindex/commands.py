@@ -1,4 +1,11 @@
 import click
+import time
+
+from tqdm import tqdm
+
+from aim.sdk.index_manager import RepoIndexManager
+from aim.sdk.repo import Repo
+from aim.sdk.utils import clean_repo_path
 
 
 @click.command()
@@ -7,12 +14,37 @@ import click
                                                         dir_okay=True,
                                                         writable=True))
 @click.option('--finalize-only', required=False, is_flag=True, default=False)
-def reindex(repo, finalize_only):
+@click.option('-w', '--workers', required=False, type=click.IntRange(min=1), default=1,
+              help='Number of worker processes reading runs data')
+@click.option('-y', '--yes', is_flag=True, help='Automatically confirm prompt')
+def reindex(repo, finalize_only, workers, yes):
     """
     Process runs left in 'in progress' state.
     """
-    from aim.utils.deprecation import deprecation_warning
+    repo_path = clean_repo_path(repo) or Repo.default_repo_path()
+    repo_inst = Repo.from_path(repo_path)
+    index_manager = RepoIndexManager.get_index_manager(repo_inst)
+
+    run_hashes = index_manager._runs_with_progress()
+    if not run_hashes:
+        click.echo('Index is up to date.')
+        return
+
+    click.secho(f'This command will index {len(run_hashes)} Runs left in progress in Aim Repo \'{repo_path}\'. '
+                f'Please make sure Runs are not active. Data corruption may occur otherwise.')
+    if yes:
+        confirmed = True
+    else:
+        confirmed = click.confirm('Do you want to proceed?')
+    if not confirmed:
+        return
+
+    start_time = time.time()
+    indexed_runs = 0
+    indexed_runs_iterator = index_manager.index_runs(run_hashes, workers=workers, optimize=not finalize_only)
+    for _ in tqdm(indexed_runs_iterator, desc='Indexing runs', total=len(run_hashes)):
+        indexed_runs += 1
+    elapsed_time = time.time() - start_time
 
-    deprecation_warning(remove_version='3.16', msg='`aim reindex` is deprecated! '
-                                                   'Use `aim runs close` command instead.')
-    return
+    click.echo(f'Indexed {indexed_runs} runs in {elapsed_time:.2f}s '
+               f'({indexed_runs / max(elapsed_time, 1e-6):.2f} runs/s).')
@@ -68,9 +68,11 @@ def remove_runs(ctx, hashes, yes):
 
 @runs.command(name='cp')
 @click.option('--destination', required=True, type=str)
+@click.option('--workers', required=False, type=int, default=None,
+              help='Number of threads copying Runs data. Defaults to the number of CPU cores.')
 @click.argument('hashes', nargs=-1, type=str)
 @click.pass_context
-def copy_runs(ctx, destination, hashes):
+def copy_runs(ctx, destination, workers, hashes):
     """Copy Run data for given run hashes to destination Repo."""
     if len(hashes) == 0:
         click.echo('Please specify at least one Run to copy.')
@@ -80,7 +82,8 @@ def copy_runs(ctx, destination, hashes):
     destination_repo = Repo.from_path(destination)
 
     matched_hashes = match_runs(source_repo, hashes)
-    success, remaining_runs = source_repo.copy_runs(matched_hashes, destination_repo)
+    workers = workers or cpu_count(logical=False) or 1
+    success, remaining_runs = source_repo.copy_runs(matched_hashes, destination_repo, workers=workers)
     if success:
         click.echo(f'Successfully copied {len(matched_hashes)} runs.')
     else:
@@ -91,9 +94,11 @@ def copy_runs(ctx, destination, hashes):
 @runs.command(name='mv')
 @click.option('--destination', required=True,
               type=str)
+@click.option('--workers', required=False, type=int, default=None,
+              help='Number of threads copying Runs data. Defaults to the number of CPU cores.')
 @click.argument('hashes', nargs=-1, type=str)
 @click.pass_context
-def move_runs(ctx, destination, hashes):
+def move_runs(ctx, destination, workers, hashes):
     """Move Run data for given run hashes to destination Repo."""
     if len(hashes) == 0:
         click.echo('Please specify at least one Run to move.')
@@ -104,7 +109,8 @@ def move_runs(ctx, destination, hashes):
 
     matched_hashes = match_runs(source_repo, hashes)
 
-    success, remaining_runs = source_repo.move_runs(matched_hashes, destination_repo)
+    workers = workers or cpu_count(logical=False) or 1
+    success, remaining_runs = source_repo.move_runs(matched_hashes, destination_repo, workers=workers)
     if success:
         click.echo(f'Successfully moved {len(matched_hashes)} runs.')
     else:
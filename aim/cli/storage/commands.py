@@ -6,6 +6,7 @@ from aim.cli.runs.utils import match_runs
 from aim.cli.upgrade.utils import convert_2to3
 
 from aim.sdk.maintenance_run import MaintenanceRun as Run
+from aim.sdk.tracker import METRIC_SEQUENCE_VERSION
 from aim.sdk.utils import backup_run, restore_run_backup
 from aim.sdk.repo import Repo
 from aim.sdk.index_manager import RepoIndexManager
@@ -45,6 +46,19 @@ def v2to3(ctx, drop_existing, skip_failed_runs, skip_checks):
 @click.option('-y', '--yes', is_flag=True, help='Automatically confirm prompt')
 def to_3_11(ctx, hashes, yes):
     """Optimize Runs Metrics data for read access."""
+    _upgrade_metrics(ctx, hashes, yes, version=2)
+
+
+@upgrade.command(name='3.18+')
+@click.argument('hashes', nargs=-1, type=str)
+@click.pass_context
+@click.option('-y', '--yes', is_flag=True, help='Automatically confirm prompt')
+def to_3_18(ctx, hashes, yes):
+    """Store Runs Metrics data in step order for range reads and sampling."""
+    _upgrade_metrics(ctx, hashes, yes, version=METRIC_SEQUENCE_VERSION)
+
+
+def _upgrade_metrics(ctx, hashes, yes, version):
     if len(hashes) == 0:
         click.echo('Please specify at least one Run to update.')
         exit(1)
@@ -66,8 +80,8 @@ def to_3_11(ctx, hashes, yes):
     for run_hash in tqdm(matched_hashes):
         try:
             run = Run(run_hash, repo=repo)
-            if run.check_metrics_version():
-                backup_run(run)
+            if run.check_metrics_version(version):
+                backup_run(repo, run_hash)
                 run.update_metrics()
                 index_manager.index(run_hash)
             else:
@@ -11,7 +11,8 @@ from aim.web.configs import (
     AIM_UI_DEFAULT_PORT,
     AIM_UI_MOUNTED_REPO_PATH,
     AIM_PROXY_URL,
-    AIM_PROFILER_KEY
+    AIM_PROFILER_KEY,
+    AIM_QUERY_WORKERS_KEY
 )
 from aim.sdk.repo import Repo, RepoStatus
 from aim.sdk.utils import clean_repo_path
@@ -45,11 +46,13 @@ from aim.web.utils import ShellCommandException
 @click.option('--force-init', is_flag=True, default=False)
 @click.option('--profiler', is_flag=True, default=False)
 @click.option('--log-level', required=False, default='', type=str)
+@click.option('--query-workers', required=False, default=1, type=int,
+              help='Number of worker processes evaluating search queries.')
 def up(dev, host, port, workers, uds,
        repo, tf_logs,
        ssl_keyfile, ssl_certfile,
        base_path, force_init,
-       profiler, log_level):
+       profiler, log_level, query_workers):
     if dev:
         os.environ[AIM_ENV_MODE_KEY] = 'dev'
         log_level = log_level or 'debug'
@@ -128,6 +131,9 @@ def up(dev, host, port, workers, uds,
     if profiler:
         os.environ[AIM_PROFILER_KEY] = '1'
 
+    if query_workers > 1:
+        os.environ[AIM_QUERY_WORKERS_KEY] = str(query_workers)
+
     try:
         server_cmd = build_uvicorn_command(host, port, workers, uds, ssl_keyfile, ssl_certfile, log_level)
         exec_cmd(server_cmd, stream_output=True)
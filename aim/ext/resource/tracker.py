@@ -1,12 +1,12 @@
-import io
 import logging
 import re
 import sys
 import time
 import weakref
 
+from collections import deque
 from psutil import Process, cpu_percent
-from threading import Thread
+from threading import Lock, Thread
 from typing import Union
 from weakref import WeakValueDictionary
 
@@ -17,6 +17,34 @@ from aim.ext.resource.stat import Stat
 logger = logging.getLogger(__name__)
 
 
+class LogBuffer(object):
+    """Bounded buffer of the captured terminal output.
+
+    Writes never wait for the storage: once more than `max_size` bytes are pending, the oldest
+    chunks are dropped.
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.dropped = 0
+        self._chunks = deque()
+        self._size = 0
+        self._lock = Lock()
+
+    def write(self, data: bytes):
+        with self._lock:
+            self._chunks.append(data)
+            self._size += len(data)
+            while self._size > self.max_size and len(self._chunks) > 1:
+                self._size -= len(self._chunks.popleft())
+                self.dropped += 1
+
+    def read(self) -> bytes:
+        with self._lock:
+            chunks, self._chunks = self._chunks, deque()
+            self._size = 0
+        return b''.join(chunks)
+
+
 class ResourceTracker(object):
     _buffer_registry = WeakValueDictionary()
     _old_out_write = None
@@ -53,6 +81,8 @@ class ResourceTracker(object):
     STAT_INTERVAL_MAX = 24 * 60 * 60.0
     STAT_INTERVAL_DEFAULT = 60.0
 
+    LOG_BUFFER_MAX_SIZE = 8 * 1024 * 1024
+
     @classmethod
     def check_interval(cls, interval, warn=True):
         if interval is None:
@@ -90,7 +120,8 @@ class ResourceTracker(object):
         self._log_capture_interval = 1
         self._old_out = None
         self._old_err = None
-        self._io_buffer = io.BytesIO()
+        self._io_buffer = LogBuffer(self.LOG_BUFFER_MAX_SIZE)
+        self._last_line = b''
         self._line_counter = log_offset
 
         try:
@@ -190,17 +221,17 @@ class ResourceTracker(object):
                 log_capture_time_counter = 0
 
     def _store_buffered_logs(self):
-        _buffer_size = self._io_buffer.tell()
-        if not _buffer_size:
+        # read and reset the buffer
+        data = self._io_buffer.read()
+        if not data:
             return
 
-        self._io_buffer.seek(0)
-        # read and reset the buffer
-        data = self._io_buffer.read(_buffer_size)
-        self._io_buffer.seek(0)
-        # handle the buffered data and store
+        if self._io_buffer.dropped:
+            logger.debug(f'Dropped {self._io_buffer.dropped} chunks of the terminal logs.')
+            self._io_buffer.dropped = 0
 
-        lines = data.split(b'\n')
+        # handle the buffered data and store
+        lines = (self._last_line + data).split(b'\n')
         ansi_csi_re = re.compile(b"\001?\033\\[((?:\\d|;)*)([a-dA-D])\002?")
 
         def _handle_csi(line):
@@ -217,17 +248,21 @@ class ResourceTracker(object):
 
             return _remove_csi(line)
 
+        log_lines = []
+        steps = []
         line = None
         for line in lines:
             # handle cursor up and down symbols
             line = _handle_csi(line)
             # handle each line for carriage returns
             line = line.rsplit(b'\r')[-1]
-            self._tracker()(LogLine(line.decode()), name='logs', step=self._line_counter)
+            log_lines.append(LogLine(line.decode(errors='replace')))
+            steps.append(self._line_counter)
             self._line_counter += 1
 
         self._line_counter -= 1
+        # the lines captured within the interval are stored as a single batch
+        self._tracker().track_objects('logs', log_lines, steps)
 
-        # if there was no b'\n' at the end of the data keep the last line in buffer for further writing
-        if line != b'':
-            self._io_buffer.write(line)
+        # if there was no b'\n' at the end of the data keep the last line for further writing
+        self._last_line = line
@@ -1,18 +1,37 @@
 import threading
 import queue
+import time
 import atexit
 import logging
 
+from contextlib import nullcontext
+
 logger = logging.getLogger(__name__)
 
 
 class TaskQueue(object):
-    def __init__(self, name, num_workers=1, max_backlog=0):
+    """Queue of the tasks executed by the pool of worker threads.
+
+    The tasks of the same object (the `self` of the bound method tasks) are executed by the
+    same worker, in the order of registration. A worker drains up to `max_batch_size` pending
+    tasks at once; the consecutive tasks of the same object are executed within the
+    `batch_context(obj)` context, if given.
+    """
+    def __init__(self, name, num_workers=1, max_backlog=0, max_batch_size=1, batch_context=None):
         self.name = name
         self.max_backlog = max_backlog
         self.num_workers = num_workers
+        self.max_batch_size = max_batch_size
+        self.batch_context = batch_context
+
+        self._queues = [queue.Queue(maxsize=max_backlog) for _ in range(self.num_workers)]
 
-        self._queue = queue.Queue(maxsize=max_backlog)
+        self._stats_lock = threading.Lock()
+        self._tasks_count = 0
+        self._batches_count = 0
+        self._max_batch_size = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
 
         self._threads = []
         self._shutdown = False
@@ -20,7 +39,7 @@ class TaskQueue(object):
         atexit.register(self.stop_workers)
 
         for thread_num in range(self.num_workers):
-            thread = threading.Thread(target=self.worker)
+            thread = threading.Thread(target=self.worker, args=(self._queues[thread_num],))
             thread.daemon = True
             self._threads.append(thread)
             thread.start()
@@ -30,35 +49,101 @@ class TaskQueue(object):
         if self._stopped:
             logger.debug('Cannot register task: task queue is stopped.')
         else:
-            backlog_size = self._queue.qsize()
+            task_queue = self._queues[self._worker_idx(task_func)]
+            backlog_size = task_queue.qsize()
             if backlog_size > self.max_backlog * 0.8:  # queue is 80% full
                 warn_queue_full = True
-            self._queue.put((task_func, args, kwargs))
+            task_queue.put((task_func, args, kwargs, time.monotonic()))
         return warn_queue_full
 
-    def worker(self):
+    def _worker_idx(self, task_func):
+        if self.num_workers == 1:
+            return 0
+        owner = getattr(task_func, '__self__', task_func)
+        # object addresses are aligned to 16 bytes
+        return (id(owner) >> 4) % self.num_workers
+
+    def worker(self, task_queue):
         while True:
             if self._shutdown:
                 logger.debug(f'Shutting down worker thread {threading.get_ident()}.')
                 break
-            task_f, args, kwargs = self._queue.get()
-            task_f(*args, **kwargs)
+            tasks = [task_queue.get()]
+            while len(tasks) < self.max_batch_size:
+                try:
+                    tasks.append(task_queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._exec_tasks(tasks)
+            self._report_batch([registered_at for *_, registered_at in tasks])
+            for _ in tasks:
+                task_queue.task_done()
             # clear the unnecessary references to Run objects
-            task_f, args, kwargs = None, None, None
-            self._queue.task_done()
+            tasks = None
+
+    def _exec_tasks(self, tasks):
+        group_start = 0
+        for idx in range(1, len(tasks) + 1):
+            if idx < len(tasks) and self._owner(tasks[idx]) is self._owner(tasks[group_start]):
+                continue
+            owner = self._owner(tasks[group_start])
+            try:
+                context = self.batch_context(owner) if self.batch_context and owner is not None else nullcontext()
+                with context:
+                    for task_f, args, kwargs, _ in tasks[group_start:idx]:
+                        try:
+                            task_f(*args, **kwargs)
+                        except Exception:
+                            logger.exception(f'Failed to execute task in queue \'{self.name}\'.')
+            except Exception:
+                logger.exception(f'Failed to execute tasks batch in queue \'{self.name}\'.')
+            group_start = idx
+
+    @staticmethod
+    def _owner(task):
+        return getattr(task[0], '__self__', None)
+
+    def _report_batch(self, registration_times):
+        now = time.monotonic()
+        latencies = [now - registered_at for registered_at in registration_times]
+        with self._stats_lock:
+            self._tasks_count += len(latencies)
+            self._batches_count += 1
+            self._max_batch_size = max(self._max_batch_size, len(latencies))
+            self._total_latency += sum(latencies)
+            self._max_latency = max(self._max_latency, max(latencies))
+
+    @property
+    def stats(self) -> dict:
+        """Queue depth, executed tasks/batches counts, batch sizes and task latencies (in seconds)."""
+        with self._stats_lock:
+            tasks_count, batches_count = self._tasks_count, self._batches_count
+            return {
+                'queue_depth': sum(task_queue.qsize() for task_queue in self._queues),
+                'tasks': tasks_count,
+                'batches': batches_count,
+                'avg_batch_size': tasks_count / batches_count if batches_count else 0,
+                'max_batch_size': self._max_batch_size,
+                'avg_latency': self._total_latency / tasks_count if tasks_count else 0,
+                'max_latency': self._max_latency,
+            }
+
+    def wait_for_finish(self):
+        for task_queue in self._queues:
+            task_queue.join()
 
     def stop_workers(self):
         if self._stopped:
             return
 
         self._stopped = True
-        pending_task_count = self._queue.qsize()
+        pending_task_count = sum(task_queue.qsize() for task_queue in self._queues)
         if pending_task_count:
             logger.warning(f'Processing {pending_task_count} pending tasks in queue \'{self.name}\'... '
                            f'Please do not kill the process.')
-            self._queue.join()
+            self.wait_for_finish()
         self._shutdown = True
-        logger.debug('No pending tasks left.')
+        logger.debug(f'No pending tasks left. Task queue \'{self.name}\' stats: {self.stats}.')
 
     def __del__(self):
         self.stop_workers()
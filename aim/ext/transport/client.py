@@ -5,7 +5,7 @@ import uuid
 import weakref
 from collections import defaultdict
 from copy import deepcopy
-from typing import Tuple
+from typing import List, Tuple
 
 import aim.ext.transport.proto.remote_tracking_pb2 as rpc_messages
 import aim.ext.transport.proto.remote_router_pb2 as router_messages
@@ -20,7 +20,12 @@ from aim.ext.transport.config import (
     AIM_RT_MAX_MESSAGE_SIZE,
     AIM_RT_DEFAULT_MAX_MESSAGE_SIZE,
     AIM_CLIENT_QUEUE_MAX_MEMORY,
+    AIM_CLIENT_QUEUE_COALESCE_SIZE,
+    AIM_CLIENT_QUEUE_COALESCE_WINDOW,
+    AIM_CLIENT_QUEUE_DEFAULT_COALESCE_SIZE,
+    AIM_CLIENT_QUEUE_DEFAULT_COALESCE_WINDOW,
 )
+from aim.storage import encoding as E
 from aim.storage.treeutils import encode_tree, decode_tree
 
 
@@ -36,7 +41,9 @@ class Client:
     # per run queues. based on run's hash
     _queues = defaultdict(lambda: RpcQueueWithRetry(
         'remote_tracker', max_queue_memory=os.getenv(AIM_CLIENT_QUEUE_MAX_MEMORY, 1024 * 1024 * 1024),
-        retry_count=DEFAULT_RETRY_COUNT, retry_interval=DEFAULT_RETRY_INTERVAL))
+        retry_count=DEFAULT_RETRY_COUNT, retry_interval=DEFAULT_RETRY_INTERVAL,
+        coalesce_size=int(os.getenv(AIM_CLIENT_QUEUE_COALESCE_SIZE, AIM_CLIENT_QUEUE_DEFAULT_COALESCE_SIZE)),
+        coalesce_window=float(os.getenv(AIM_CLIENT_QUEUE_COALESCE_WINDOW, AIM_CLIENT_QUEUE_DEFAULT_COALESCE_WINDOW))))
 
     def __init__(self, remote_path: str):
         # temporary workaround for M1 build
@@ -285,13 +292,20 @@ class Client:
             raise_exception(status_msg.header.exception)
         return decode_tree(unpack_stream(resp))
 
-    def _run_write_instructions(self, instructions: [Tuple[bytes, bytes]]):
-        stream = pack_stream(iter(instructions))
+    def _run_write_instructions(self, *instructions: [Tuple[bytes, bytes]]):
+        # the instruction lists coalesced by the queue are sent as a list of lists,
+        # which is applied by the server in a single write batch
+        if len(instructions) == 1:
+            version = '0.1'
+            stream = pack_stream(iter(instructions[0]))
+        else:
+            version = '0.2'
+            stream = pack_stream(self._merge_write_instructions(instructions))
 
         def message_stream_generator():
             for chunk in stream:
                 yield rpc_messages.WriteInstructionsRequest(
-                    version='0.1',
+                    version=version,
                     client_uri=self.uri,
                     message=chunk
                 )
@@ -300,6 +314,19 @@ class Client:
         if response.status == rpc_messages.WriteInstructionsResponse.Status.ERROR:
             raise_exception(response.exception)
 
+    @staticmethod
+    def _merge_write_instructions(instructions: Tuple[List[Tuple[bytes, bytes]], ...]):
+        # encoded instruction lists are re-rooted under the list indices, without decoding
+        yield from encode_tree([])
+        for idx, encoded_list in enumerate(instructions):
+            prefix = E.encode_path((idx,))
+            for key, val in encoded_list:
+                yield prefix + key, val
+
+    @property
+    def in_instructions_batch(self) -> bool:
+        return getattr(self._thread_local, 'atomic_instructions', None) is not None
+
     def start_instructions_batch(self):
         self._thread_local.atomic_instructions = []
 
@@ -7,6 +7,12 @@ AIM_SERVER_MOUNTED_REPO_PATH = '__AIM_SERVER_MOUNT_REPO_PATH__'
 # The path of the PEM-encoded root certificates. Used for secure channel establishment
 AIM_CLIENT_SSL_CERTIFICATES_FILE = '__AIM_CLIENT_SSL_CERTIFICATES_FILE__'
 AIM_CLIENT_QUEUE_MAX_MEMORY = '__AIM_CLIENT_QUEUE_MAX_MEMORY__'
+# The pending write instructions of a Run are sent in a single request up to the given size (in bytes),
+# waiting for the new instructions for at most the given window (in seconds)
+AIM_CLIENT_QUEUE_COALESCE_SIZE = '__AIM_CLIENT_QUEUE_COALESCE_SIZE__'
+AIM_CLIENT_QUEUE_COALESCE_WINDOW = '__AIM_CLIENT_QUEUE_COALESCE_WINDOW__'
+AIM_CLIENT_QUEUE_DEFAULT_COALESCE_SIZE = 4 * 1024 * 1024  # 4MB
+AIM_CLIENT_QUEUE_DEFAULT_COALESCE_WINDOW = 0
 
 # GRPC OPTIONS
 AIM_RT_MAX_MESSAGE_SIZE = '__AIM_RT_MAX_MESSAGE_SIZE__'
@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Dict, Union
 
 import aim.ext.transport.proto.remote_tracking_pb2 as tracking_rpc
@@ -5,6 +6,7 @@ import aim.ext.transport.proto.remote_tracking_pb2_grpc as tracking_pb2_grpc
 import aim.ext.transport.message_utils as utils
 
 from aim.ext.transport.handlers import get_handler
+from aim.storage.rockscontainer import batched_writes
 from aim.storage.treeutils import encode_tree, decode_tree
 
 
@@ -143,33 +145,19 @@ class RemoteTrackingServicer(tracking_pb2_grpc.RemoteTrackingServiceServicer):
         try:
             raw_message = []
             client_uri = None  # TODO [AD] move to header interface?
+            version = '0.1'
             # TODO [AD] raw_message = [request.message for request in request_iterator]
             for request in request_iterator:
                 raw_message.append(request.message)
                 client_uri = request.client_uri
+                version = request.version
             write_instructions = decode_tree(utils.unpack_bytes(raw_message))
-            for instruction in write_instructions:
-                resource_handler, method_name, args = instruction
-
-                self._verify_resource_handler(resource_handler, client_uri)
-
-                checked_args = []
-                for arg in args:
-                    if isinstance(arg, utils.ResourceObject):
-                        handler = arg.storage['handler']
-                        self._verify_resource_handler(handler, client_uri)
-                        checked_args.append(self.resource_pool[handler][1].ref)
-                    else:
-                        checked_args.append(arg)
-
-                resource = self.resource_pool[resource_handler][1].ref
-                if method_name.endswith('.setter'):
-                    attr_name = method_name.split('.')[0]
-                    setattr(resource, attr_name, checked_args[0])
-                else:
-                    attr = getattr(resource, method_name)
-                    assert callable(attr)
-                    attr(*checked_args)
+            if version == '0.2':
+                # instruction lists coalesced by the client queue
+                write_instructions = chain.from_iterable(write_instructions)
+            with batched_writes():
+                for instruction in write_instructions:
+                    self._run_write_instruction(instruction, client_uri)
 
             return tracking_rpc.WriteInstructionsResponse(status=tracking_rpc.WriteInstructionsResponse.Status.OK)
         except Exception as e:
@@ -179,6 +167,29 @@ class RemoteTrackingServicer(tracking_pb2_grpc.RemoteTrackingServiceServicer):
                 exception=utils.build_exception(e),
             )
 
+    def _run_write_instruction(self, instruction, client_uri):
+        resource_handler, method_name, args = instruction
+
+        self._verify_resource_handler(resource_handler, client_uri)
+
+        checked_args = []
+        for arg in args:
+            if isinstance(arg, utils.ResourceObject):
+                handler = arg.storage['handler']
+                self._verify_resource_handler(handler, client_uri)
+                checked_args.append(self.resource_pool[handler][1].ref)
+            else:
+                checked_args.append(arg)
+
+        resource = self.resource_pool[resource_handler][1].ref
+        if method_name.endswith('.setter'):
+            attr_name = method_name.split('.')[0]
+            setattr(resource, attr_name, checked_args[0])
+        else:
+            attr = getattr(resource, method_name)
+            assert callable(attr)
+            attr(*checked_args)
+
     def _verify_resource_handler(self, resource_handler, client_uri):
         res_info = self.resource_pool.get(resource_handler, None)
         if not res_info or res_info[0] != client_uri:
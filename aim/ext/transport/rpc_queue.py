@@ -8,8 +8,15 @@ logger = logging.getLogger(__name__)
 
 
 class RpcQueueWithRetry(object):
+    """Queue of the tasks executed in order by a worker thread, retrying the unavailable remote calls.
+
+    If `coalesce_size` is set, the consecutive tasks of the same function, pending in the queue or
+    registered within `coalesce_window` seconds, are executed as a single call with the arguments of
+    the tasks concatenated, until the size of the arguments reaches `coalesce_size` bytes.
+    """
     def __init__(self, name, max_queue_memory=0,
-                 retry_count=0, retry_interval=0):
+                 retry_count=0, retry_interval=0,
+                 coalesce_size=0, coalesce_window=0):
 
         self._client = None
 
@@ -20,6 +27,9 @@ class RpcQueueWithRetry(object):
         self.max_memory_usage = max_queue_memory
         self.current_memory_usage = 0
 
+        self.coalesce_size = coalesce_size
+        self.coalesce_window = coalesce_window
+
         self._shutdown = False
         self._queue = queue.Queue()
         self._name = name
@@ -51,16 +61,42 @@ class RpcQueueWithRetry(object):
             if self._shutdown:
                 logger.debug(f'Shutting down worker thread {threading.get_ident()}.')
                 break
-            task_f, args = self._queue.get()
+            tasks = self._get_tasks()
+            task_f = tasks[0][0]
+            args = tuple(arg for _, task_args in tasks for arg in task_args)
             if self._try_exec_task(task_f, *args):
-                arg_size = self._calculate_size(args)
+                arg_size = sum(self._calculate_size(task_args) for _, task_args in tasks)
                 with self._queue.mutex:
                     self.current_memory_usage -= arg_size
                 # clear the unnecessary references
                 task_f, args = None, None
-                self._queue.task_done()
+                for _ in tasks:
+                    self._queue.task_done()
+                tasks = None
             else:
-                self._put_front(task_f, args)
+                for task_f, task_args in reversed(tasks):
+                    self._put_front(task_f, task_args)
+
+    def _get_tasks(self):
+        task = self._queue.get()
+        tasks = [task]
+        if not self.coalesce_size:
+            return tasks
+
+        size = self._calculate_size(task[1])
+        deadline = time.monotonic() + self.coalesce_window
+        while size < self.coalesce_size:
+            timeout = deadline - time.monotonic()
+            try:
+                next_task = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if next_task[0] != task[0]:
+                self._put_front(*next_task)
+                break
+            tasks.append(next_task)
+            size += self._calculate_size(next_task[1])
+        return tasks
 
     def _try_exec_task(self, task_f, *args):
         # temporary workaround for M1 build
@@ -1,4 +1,5 @@
 import logging
+import numpy as np
 from typing import Dict, Optional, Union
 from typing import TYPE_CHECKING
 import pathlib
@@ -8,7 +9,9 @@ from aim.storage.treeview import TreeView
 from aim.sdk.utils import generate_run_hash
 from aim.sdk.repo_utils import get_repo
 from aim.sdk.errors import MissingRunError
-from aim.sdk.tracker import STEP_HASH_FUNCTIONS
+from aim.sdk.tracker import (
+    STEP_HASH_FUNCTIONS, STEP_KEY_OFFSET, METRIC_SEQUENCE_VERSION, LOD_LEVELS, lod_buckets, lod_views, step_key
+)
 
 if TYPE_CHECKING:
     from aim.sdk.repo import Repo
@@ -74,43 +77,69 @@ class BaseRun:
                     self._series_run_trees[version] = series_tree.subtree((f'v{version}', 'chunks', self.hash))
         return self._series_run_trees
 
-    def check_metrics_version(self) -> bool:
+    def check_metrics_version(self, version: int = 2) -> bool:
+        """Check if the Run has metrics stored in a format older than the given `version`."""
         metric_dtypes = ('float', 'float64', 'int')
         traces_tree = self.meta_run_tree.get('traces', {})
 
-        v1_metric_found = False
+        old_metric_found = False
         for ctx_metadata in traces_tree.values():
             for seq_metadata in ctx_metadata.values():
                 if seq_metadata.get('dtype', 'float') in metric_dtypes:
-                    if seq_metadata.get('version', 1) == 1:
-                        v1_metric_found = True
+                    if seq_metadata.get('version', 1) < version:
+                        old_metric_found = True
                         break
-        return v1_metric_found
+        return old_metric_found
 
     def update_metrics(self):
+        """Convert the Run metrics to the latest, step-ordered format."""
         metric_dtypes = ('float', 'float64', 'int')
         series_meta_tree = self.meta_run_tree.subtree('traces')
 
         for ctx_id, ctx_traces in series_meta_tree.items():
             for name, trace_info in ctx_traces.items():
-                if (trace_info.get('dtype', 'float') in metric_dtypes) and (trace_info.get('version', 1) == 1):
-                    series = self.series_run_trees[1].subtree((ctx_id, name))
-                    new_series = self.series_run_trees[2].subtree((ctx_id, name))
-                    step_view = new_series.array('step', dtype='int64').allocate()
-                    val_view = new_series.array('val').allocate()
-                    epoch_view = new_series.array('epoch', dtype='int64').allocate()
-                    time_view = new_series.array('time', dtype='int64').allocate()
-                    for (step, val), (_, epoch), (_, timestamp) in zip(
-                            series.subtree('val').items(),
-                            series.subtree('epoch').items(),
-                            series.subtree('time').items()):
-                        step_hash = hash_auto(step)
-                        step_view[step_hash] = step
-                        val_view[step_hash] = val
-                        epoch_view[step_hash] = epoch
-                        time_view[step_hash] = timestamp
-                    self.meta_run_tree['traces', ctx_id, name, 'version'] = 2
-                    del self.series_run_trees[1][(ctx_id, name)]
+                if trace_info.get('dtype', 'float') not in metric_dtypes:
+                    continue
+                version = trace_info.get('version', 1)
+                if version >= METRIC_SEQUENCE_VERSION:
+                    continue
+                series = self.series_run_trees[version].subtree((ctx_id, name))
+                new_series = self.series_run_trees[METRIC_SEQUENCE_VERSION].subtree((ctx_id, name))
+                val_view = new_series.array('val').allocate()
+                epoch_view = new_series.array('epoch', dtype='int64').allocate()
+                time_view = new_series.array('time', dtype='int64').allocate()
+                # v1 metrics are keyed by step, v2 metrics by step hash with an explicit step column
+                if version == 1:
+                    steps = (step for step, _ in series.subtree('val').items())
+                else:
+                    steps = (step for _, step in series.subtree('step').items())
+                for step, (_, val), (_, epoch), (_, timestamp) in zip(
+                        steps,
+                        series.subtree('val').items(),
+                        series.subtree('epoch').items(),
+                        series.subtree('time').items()):
+                    key = step_key(step)
+                    val_view[key] = val
+                    epoch_view[key] = epoch
+                    time_view[key] = timestamp
+                self._write_metric_summaries(ctx_id, name, new_series)
+                self.meta_run_tree['traces', ctx_id, name, 'version'] = METRIC_SEQUENCE_VERSION
+                del self.series_run_trees[version][(ctx_id, name)]
+
+    def _write_metric_summaries(self, ctx_id: int, name: str, series: TreeView):
+        keys, values = series.array('val').tree.items_numpy(dtype=np.float64)
+        if not len(keys):
+            return
+        steps = keys - STEP_KEY_OFFSET
+        views = lod_views(series, LOD_LEVELS, allocate=True)
+        for level in LOD_LEVELS:
+            for bucket in lod_buckets(steps, values, level):
+                bucket.write(views[level])
+        bounds = values[~np.isnan(values)]
+        if len(bounds):
+            self.meta_run_tree['traces', ctx_id, name, 'min'] = bounds.min().item()
+            self.meta_run_tree['traces', ctx_id, name, 'max'] = bounds.max().item()
+        self.meta_run_tree['traces', ctx_id, name, 'lod_levels'] = list(LOD_LEVELS)
 
     def _calc_hash(self) -> int:
         # TODO maybe take read_only flag into account?
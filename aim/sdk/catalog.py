@@ -0,0 +1,221 @@
+"""Catalog of the params and sequences tracked in the repository, updated from an append-only log."""
+import os
+import struct
+import threading
+import uuid
+
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import logging
+
+from aim.storage import encoding as E
+from aim.storage import treeutils
+from aim.storage.treeview import TreeView
+from aim.storage.types import AimObject, AimObjectPath
+
+logger = logging.getLogger(__name__)
+
+
+class RepoCatalog(object):
+    """In-memory records of the meta subtrees `CATALOG_TREES`, kept up to date with the log `.aim/meta/catalog`.
+
+    The catalogs are shared within the process, use `RepoCatalog.get(path)` to get one.
+    """
+    # `traces` is the subtree of the sequences tracked before the sequence data types were stored
+    CATALOG_TREES = ('attrs', 'traces_types', 'contexts', 'traces')
+    LOG_NAME = 'catalog'
+    # The log starts with a random identifier, which changes when the log is replaced
+    HEADER_SIZE = 16
+    # The log is replaced by the next catalog build once it has grown larger
+    MAX_LOG_SIZE = 64 * 2**20
+
+    # The header of the `(key length, value length, key, value)` records of the log
+    _RECORD_HEADER = struct.Struct('<II')
+
+    _pool: Dict[str, 'RepoCatalog'] = {}
+    _pool_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, path: str) -> 'RepoCatalog':
+        path = os.path.abspath(path)
+        with cls._pool_lock:
+            catalog = cls._pool.get(path)
+            if catalog is None:
+                catalog = cls._pool[path] = cls(path)
+            return catalog
+
+    def __init__(self, path: str):
+        self.log_path = os.path.join(path, 'meta', self.LOG_NAME)
+        self._prefixes = {name: E.encode_path(name) for name in self.CATALOG_TREES}
+        self._records: Dict[str, Dict[bytes, bytes]] = {name: {} for name in self.CATALOG_TREES}
+        self._trees: Dict[Tuple[str, bool], AimObject] = {}
+        self._log_id: Optional[bytes] = None
+        self._offset: Optional[int] = None
+        self._build_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def append(self, path: AimObjectPath, value: AimObject, strict: bool = True):
+        """Append the records of the `value` set at the meta tree `path` to the catalog log."""
+        if isinstance(path, (int, str)):
+            path = (path,)
+        if path[0] not in self._prefixes:
+            return
+        prefix = E.encode_path(path)
+        self.append_records((prefix + key, val) for key, val in treeutils.encode_tree(value, strict=strict))
+
+    def append_records(self, records: Iterable[Tuple[bytes, bytes]]):
+        """Append the `(key, value)` records of the meta tree to the catalog log.
+
+        The records out of the catalog subtrees are skipped. The catalog is a best-effort cache,
+        failing to update it never fails the caller.
+        """
+        data = b''.join(
+            self._RECORD_HEADER.pack(len(key), len(value)) + key + value
+            for key, value in records
+            if isinstance(value, bytes) and self._tree_name(key) is not None
+        )
+        if not data:
+            return
+        try:
+            self._create_log()
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f'Cannot update params catalog \'{self.log_path}\': {e}')
+
+    def append_container(self, container, prefix: bytes = b''):
+        """Append the catalog subtrees' records of the meta tree stored in the `container`."""
+        for name, tree_prefix in self._prefixes.items():
+            self.append_records((tree_prefix + key, value)
+                                for key, value in container.items(prefix + tree_prefix))
+
+    def invalidate(self):
+        """Replace the catalog log, so that the catalogs are rebuilt from the meta tree.
+
+        Used once the records were removed from the meta tree (e.g. by `aim prune`), as the log only adds records.
+        """
+        try:
+            os.replace(self._write_header(), self.log_path)
+        except OSError as e:
+            logger.debug(f'Cannot invalidate params catalog \'{self.log_path}\': {e}')
+
+    def generation(self, meta_tree_fn: Callable[[], TreeView]) -> str:
+        """Bring the catalog up to date and return its generation tag.
+
+        The catalog is built from the meta tree returned by `meta_tree_fn` if needed.
+
+        The tag changes whenever the catalog content may have changed.
+        """
+        with self._lock:
+            self._sync(meta_tree_fn)
+            # the catalog changes only once it is rebuilt or the log has grown
+            return f'{self._build_id}-{self._offset}'
+
+    def tree(self, name: str, meta_tree_fn: Callable[[], TreeView], strict: bool = True) -> AimObject:
+        """Bring the catalog up to date and return the decoded catalog subtree `name`.
+
+        The decoded subtrees are cached until their records change, the result must not be modified.
+        """
+        with self._lock:
+            self._sync(meta_tree_fn)
+            tree = self._trees.get((name, strict))
+            if tree is None:
+                records = self._records[name]
+                if records:
+                    tree = treeutils.decode_tree(((key, records[key]) for key in sorted(records)), strict=strict)
+                else:
+                    tree = {}
+                self._trees[name, strict] = tree
+            return tree
+
+    def _tree_name(self, key: bytes) -> Optional[str]:
+        for name, prefix in self._prefixes.items():
+            if key.startswith(prefix):
+                return name
+        return None
+
+    def _write_header(self) -> str:
+        tmp_path = f'{self.log_path}.{uuid.uuid4().hex}'
+        with open(tmp_path, 'wb') as fh:
+            fh.write(uuid.uuid4().bytes)
+        return tmp_path
+
+    def _create_log(self):
+        if os.path.exists(self.log_path):
+            return
+        # the log is linked with its header written, so that no record is appended before the header
+        tmp_path = self._write_header()
+        try:
+            os.link(tmp_path, self.log_path)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_path)
+
+    def _read_header(self) -> Tuple[Optional[bytes], int]:
+        try:
+            with open(self.log_path, 'rb') as fh:
+                log_id = fh.read(self.HEADER_SIZE)
+                return log_id, os.fstat(fh.fileno()).st_size
+        except FileNotFoundError:
+            return None, 0
+
+    def _sync(self, meta_tree_fn: Callable[[], TreeView]):
+        log_id, size = self._read_header()
+        if log_id is None:
+            try:
+                self._create_log()
+            except OSError as e:
+                logger.debug(f'Cannot create params catalog \'{self.log_path}\': {e}')
+            log_id, size = self._read_header()
+        if self._offset is None or log_id != self._log_id or size < self._offset:
+            if size > self.MAX_LOG_SIZE:
+                # the log is not needed to build the catalog, start over to bound its size
+                self.invalidate()
+                log_id, size = self._read_header()
+            self._build(meta_tree_fn, log_id, size)
+            log_id, size = self._read_header()
+            if log_id != self._log_id:
+                return
+        if size > self._offset:
+            self._read_log(size)
+
+    def _build(self, meta_tree_fn: Callable[[], TreeView], log_id: Optional[bytes], size: int):
+        # records appended to the log while the meta tree is read are applied afterwards
+        meta_tree = meta_tree_fn()
+        for name, prefix in self._prefixes.items():
+            self._records[name] = dict(meta_tree.container.view(prefix).items())
+        self._trees.clear()
+        self._log_id = log_id
+        self._offset = max(size, self.HEADER_SIZE)
+        self._build_id = uuid.uuid4().hex[:8]
+
+    def _read_log(self, size: int):
+        with open(self.log_path, 'rb') as fh:
+            fh.seek(self._offset)
+            data = fh.read(size - self._offset)
+        for name, key, value in self._iter_records(data):
+            prefix = self._prefixes[name]
+            self._records[name][key[len(prefix):]] = value
+            self._trees.pop((name, True), None)
+            self._trees.pop((name, False), None)
+
+    def _iter_records(self, data: bytes) -> Iterator[Tuple[str, bytes, bytes]]:
+        # only the complete records are applied, the rest is read once written
+        offset = 0
+        header_size = self._RECORD_HEADER.size
+        while offset + header_size <= len(data):
+            key_len, value_len = self._RECORD_HEADER.unpack_from(data, offset)
+            end = offset + header_size + key_len + value_len
+            if end > len(data):
+                break
+            key = data[offset + header_size:offset + header_size + key_len]
+            value = data[offset + header_size + key_len:end]
+            offset = end
+            name = self._tree_name(key)
+            if name is not None:
+                yield name, key, value
+        self._offset += offset
@@ -1,8 +1,11 @@
 import os
 
 AIM_ENABLE_TRACKING_THREAD = '__AIM_ENABLE_TRACKING_THREAD__'
+AIM_TRACKING_THREAD_WORKERS = '__AIM_TRACKING_THREAD_WORKERS__'
+AIM_TRACKING_BATCH_SIZE = '__AIM_TRACKING_BATCH_SIZE__'
 AIM_REPO_NAME = '__AIM_REPO_NAME__'
 AIM_RUN_INDEXING_TIMEOUT = '__AIM_RUN_INDEXING_TIMEOUT_SECONDS__'
+AIM_BLOB_CACHE_SIZE = '__AIM_BLOB_CACHE_SIZE__'
 
 
 def get_aim_repo_name():
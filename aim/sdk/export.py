@@ -0,0 +1,214 @@
+"""Export of the queried Runs and metrics as Apache Arrow record batches.
+
+The data is streamed: the record batches are built one Run (or one group of Runs) at a time,
+so that the memory usage is bounded by the size of the largest Run rather than the whole query
+result. The Run and metric identifying columns are dictionary-encoded, the Run params and the
+metric contexts are stored as JSON strings, as their structure varies from Run to Run.
+"""
+import json
+
+import numpy as np
+
+from typing import Iterator, List, TYPE_CHECKING
+
+from aim.sdk.sequences.metric import Metric
+
+if TYPE_CHECKING:
+    from pyarrow import RecordBatch, RecordBatchReader, Schema
+
+    from aim.sdk.run import Run
+    from aim.sdk.sequence_collection import SequenceCollection
+
+# Number of Runs written in a single record batch by the Runs export
+RUNS_PER_BATCH = 1024
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError('pyarrow is required to export data in Arrow/Parquet format. '
+                                  'Please install it with command: \n pip install pyarrow')
+    return pyarrow
+
+
+def _dictionary_type():
+    pa = _pyarrow()
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def _run_params(run: 'Run') -> str:
+    return json.dumps(run[...], default=str)
+
+
+def metrics_schema(
+    include_run: bool = True,
+    include_name: bool = True,
+    include_context: bool = True,
+) -> 'Schema':
+    pa = _pyarrow()
+    fields = []
+    if include_run:
+        fields.append(pa.field('run.hash', _dictionary_type()))
+        fields.append(pa.field('run.params', _dictionary_type()))
+    if include_name:
+        fields.append(pa.field('metric.name', _dictionary_type()))
+    if include_context:
+        fields.append(pa.field('metric.context', _dictionary_type()))
+    fields.extend([
+        pa.field('idx', pa.int64()),
+        pa.field('step', pa.int64()),
+        pa.field('value', pa.float64()),
+        pa.field('epoch', pa.float64()),
+        pa.field('time', pa.timestamp('us', tz='UTC')),
+    ])
+    return pa.schema(fields)
+
+
+def runs_schema(include_props: bool = True, include_params: bool = True) -> 'Schema':
+    pa = _pyarrow()
+    fields = [pa.field('hash', pa.string())]
+    if include_props:
+        fields.extend([
+            pa.field('name', pa.string()),
+            pa.field('description', pa.string()),
+            pa.field('archived', pa.bool_()),
+            pa.field('creation_time', pa.timestamp('us', tz='UTC')),
+            pa.field('end_time', pa.timestamp('us', tz='UTC')),
+            pa.field('active', pa.bool_()),
+            pa.field('experiment', pa.string()),
+            pa.field('tags', pa.list_(pa.string())),
+        ])
+    if include_params:
+        fields.append(pa.field('params', pa.string()))
+    return pa.schema(fields)
+
+
+def _metric_columns(metric: Metric, only_last: bool) -> List[np.ndarray]:
+    if only_last:
+        last_key, last_value = metric.values.last()
+        return [np.array([metric.data.step_at(last_key)], dtype=np.int64),
+                np.array([last_value], dtype=np.float64),
+                np.array([metric.epochs[last_key]], dtype=np.float64),
+                np.array([metric.timestamps[last_key]], dtype=np.float64)]
+    steps, (values, epochs, timestamps) = metric.data.numpy()
+    return [steps.astype(np.int64, copy=False),
+            values.astype(np.float64, copy=False),
+            epochs.astype(np.float64, copy=False),
+            timestamps.astype(np.float64, copy=False)]
+
+
+def _dictionary_column(lengths: List[int], dictionary: List[str]):
+    pa = _pyarrow()
+    indices = np.repeat(np.arange(len(dictionary), dtype=np.int32), lengths)
+    return pa.DictionaryArray.from_arrays(indices, pa.array(dictionary, type=pa.string()))
+
+
+def metrics_record_batch(
+    metrics: List[Metric],
+    schema: 'Schema',
+    only_last: bool = False,
+) -> 'RecordBatch':
+    """Record batch of the data points of the given metrics, which belong to the same Run.
+
+    The metrics list must not be empty.
+    """
+    pa = _pyarrow()
+    columns = [_metric_columns(metric, only_last) for metric in metrics]
+    lengths = [len(steps) for steps, *_ in columns]
+    steps, values, epochs, timestamps = (np.concatenate(column) for column in zip(*columns))
+    data = {}
+    if 'run.hash' in schema.names:
+        run = metrics[0].run
+        data['run.hash'] = _dictionary_column([len(steps)], [run.hash])
+        data['run.params'] = _dictionary_column([len(steps)], [_run_params(run)])
+    if 'metric.name' in schema.names:
+        data['metric.name'] = _dictionary_column(lengths, [metric.name for metric in metrics])
+    if 'metric.context' in schema.names:
+        data['metric.context'] = _dictionary_column(
+            lengths, [json.dumps(metric.context.to_dict(), sort_keys=True) for metric in metrics])
+    data['idx'] = pa.array(np.concatenate([np.arange(length, dtype=np.int64) for length in lengths]))
+    data['step'] = pa.array(steps, type=pa.int64())
+    data['value'] = pa.array(values, type=pa.float64())
+    # epochs of the points tracked without epoch are stored as None
+    data['epoch'] = pa.array(epochs, type=pa.float64(), from_pandas=True)
+    data['time'] = pa.array((timestamps * 1e6).astype(np.int64), type=pa.timestamp('us', tz='UTC'))
+    return pa.RecordBatch.from_arrays([data[name] for name in schema.names], schema=schema)
+
+
+def runs_record_batch(runs: List['Run'], schema: 'Schema') -> 'RecordBatch':
+    """Record batch of the props and params of the given Runs, one row per Run."""
+    pa = _pyarrow()
+    data = {'hash': [run.hash for run in runs]}
+    if 'name' in schema.names:
+        props = [run.props for run in runs]
+        data['name'] = [p.name for p in props]
+        data['description'] = [p.description for p in props]
+        data['archived'] = [p.archived for p in props]
+        data['creation_time'] = [int(p.creation_time * 1e6) if p.creation_time else None for p in props]
+        data['end_time'] = [int(run.end_time * 1e6) if run.end_time else None for run in runs]
+        data['active'] = [run.active for run in runs]
+        data['experiment'] = [p.experiment for p in props]
+        data['tags'] = [list(p.tags) for p in props]
+    if 'params' in schema.names:
+        data['params'] = [_run_params(run) for run in runs]
+    return pa.RecordBatch.from_arrays([pa.array(data[field.name], type=field.type) for field in schema],
+                                      schema=schema)
+
+
+def iter_record_batches(
+    collection: 'SequenceCollection',
+    schema: 'Schema',
+    only_last: bool = False,
+) -> Iterator['RecordBatch']:
+    if collection._item == 'run':
+        runs = []
+        for run_collection in collection._run_collections():
+            runs.append(run_collection.run)
+            if len(runs) == RUNS_PER_BATCH:
+                yield runs_record_batch(runs, schema)
+                runs = []
+        if runs:
+            yield runs_record_batch(runs, schema)
+        return
+
+    for run_collection in collection._run_collections():
+        metrics = list(run_collection)
+        if metrics:
+            yield metrics_record_batch(metrics, schema, only_last=only_last)
+
+
+def record_batch_reader(
+    collection: 'SequenceCollection',
+    only_last: bool = False,
+    include_run: bool = True,
+    include_name: bool = True,
+    include_context: bool = True,
+    include_props: bool = True,
+    include_params: bool = True,
+) -> 'RecordBatchReader':
+    pa = _pyarrow()
+    if collection._item == 'run':
+        schema = runs_schema(include_props=include_props, include_params=include_params)
+    else:
+        if not issubclass(collection.seq_cls, Metric):
+            raise ValueError(f'Cannot export \'{collection.seq_cls.sequence_name()}\' sequences. '
+                             f'Only metrics can be exported in Arrow format.')
+        schema = metrics_schema(include_run=include_run, include_name=include_name, include_context=include_context)
+    return pa.RecordBatchReader.from_batches(schema, iter_record_batches(collection, schema, only_last=only_last))
+
+
+def write_parquet(reader: 'RecordBatchReader', path: str, **kwargs) -> int:
+    """Write the record batches of the `reader` to the Parquet file, one row group per batch.
+
+    Returns the number of written rows.
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    n_rows = 0
+    with pq.ParquetWriter(path, reader.schema, **kwargs) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+    return n_rows
@@ -4,16 +4,25 @@ import datetime
 import pytz
 import logging
 import os
+import pickle
+import tempfile
 
+from itertools import islice
 from threading import Thread
 from pathlib import Path
 
-from typing import Iterable
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 
+from aim.sdk import query_pool
+from aim.sdk.params_index import index_run_params
 from aim.sdk.repo import Repo
+from aim.sdk.reporter.check_in_index import CheckInIndex
 from aim.sdk.run_status_watcher import Event
+from aim.storage import encoding as E
+from aim.storage import rockscontainer
 from aim.storage.locking import RefreshLock
+from aim.storage.rockscontainer import RocksContainer
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +30,8 @@ logger = logging.getLogger(__name__)
 class RepoIndexManager:
     index_manager_pool = {}
     INDEXING_GRACE_PERIOD = 10
+    # Max number of Runs indexed per index lock acquisition
+    RUNS_PER_LOCK = 16
 
     @classmethod
     def get_index_manager(cls, repo: Repo):
@@ -37,6 +48,7 @@ class RepoIndexManager:
         self.progress_dir.mkdir(parents=True, exist_ok=True)
 
         self.heartbeat_dir = Path(self.repo_path) / 'check_ins'
+        self.check_ins = CheckInIndex.get(self.heartbeat_dir)
         self.run_heartbeat_cache = {}
 
         self._indexing_in_progress = False
@@ -64,16 +76,13 @@ class RepoIndexManager:
         idle_cycles = 0
         while True:
             self._indexing_in_progress = False
-            for run_hash in self._next_stalled_run():
-                logger.info(f'Found un-indexed run {run_hash}. Indexing...')
+            stalled_runs = list(self._next_stalled_run())
+            if stalled_runs:
+                logger.info(f'Found {len(stalled_runs)} un-indexed runs. Indexing...')
                 self._indexing_in_progress = True
                 idle_cycles = 0
-                self.index(run_hash)
-
-                # sleep for small interval to release index db lock in between and allow
-                # other running jobs to properly finalize and index Run.
-                sleep_interval = .1
-                time.sleep(sleep_interval)
+                for _ in self.index_runs(stalled_runs):
+                    pass
             if not self._indexing_in_progress:
                 idle_cycles += 1
                 sleep_interval = 2 * idle_cycles if idle_cycles < 5 else 10
@@ -93,9 +102,9 @@ class RepoIndexManager:
 
     def _is_run_stalled(self, run_hash: str) -> bool:
         stalled = False
-        heartbeat_files = list(sorted(self.heartbeat_dir.glob(f'{run_hash}-*-progress-*-*'), reverse=True))
-        if heartbeat_files:
-            last_heartbeat = Event(heartbeat_files[0].name)
+        last_heartbeat_file = self.check_ins.latest(run_hash, 'progress')
+        if last_heartbeat_file:
+            last_heartbeat = Event(last_heartbeat_file)
             last_recorded_heartbeat = self.run_heartbeat_cache.get(run_hash)
             if last_recorded_heartbeat is None:
                 self.run_heartbeat_cache[run_hash] = last_heartbeat
@@ -167,11 +176,144 @@ class RepoIndexManager:
     def index(self, run_hash, ) -> bool:
         lock = RefreshLock(self._index_lock_path(), timeout=10)
         with self.lock_index(lock):
-            index = self.repo._get_index_tree('meta', 0).view(())
+            self._index_run(run_hash)
+            return True
+
+    def index_runs(
+        self,
+        run_hashes: Iterable[str],
+        *,
+        workers: int = 1,
+        optimize: bool = False
+    ) -> Iterator[str]:
+        """Index the given Runs, up to `RUNS_PER_LOCK` Runs per index lock acquisition.
+
+        If `workers > 1`, the Runs' records are read (and the Runs' storage is optimized, if `optimize`
+        is set) in a pool of worker processes, while the records of the Runs read so far are written
+        to the index. The records are passed through temporary files, see :obj:`read_runs_records`.
+        Yields the hashes of the indexed Runs. Runs which are already indexed are skipped.
+        """
+        run_hashes = list(run_hashes)
+        if workers > 1:
+            runs_records = query_pool.imap_shards(workers, read_runs_records, (self.repo.root_path, optimize),
+                                                  run_hashes, run_hash=lambda run_hash: run_hash)
+        else:
+            runs_records = ((run_hash, None) for run_hash in run_hashes)
+
+        processed_count = 0
+        while True:
+            group: List[Tuple[str, Optional[str]]] = list(islice(runs_records, self.RUNS_PER_LOCK))
+            if not group:
+                break
+            if processed_count:
+                # sleep for small interval to release index db lock in between and allow
+                # other running jobs to properly finalize and index Run.
+                time.sleep(.1)
+            if optimize and workers <= 1:
+                for run_hash, _ in group:
+                    if self.run_needs_indexing(run_hash):
+                        self.repo._optimize_run(run_hash)
+
+            indexed_runs: List[str] = []
+            lock = RefreshLock(self._index_lock_path(), timeout=10)
+            try:
+                with self.lock_index(lock):
+                    for run_hash, records_path in group:
+                        # the Run might be indexed by another process meanwhile
+                        if self.run_needs_indexing(run_hash):
+                            self._index_run(run_hash, records_path)
+                            indexed_runs.append(run_hash)
+            finally:
+                for _, records_path in group:
+                    if records_path is not None:
+                        os.remove(records_path)
+            processed_count += len(group)
+            yield from indexed_runs
+
+    def _index_run(self, run_hash: str, records_path: Optional[str] = None):
+        index = self.repo._get_index_tree('meta', 0).view(())
+        if records_path is None:
             meta_tree = self.repo.request_tree(
                 'meta', run_hash, read_only=True, from_union=False, no_cache=True).subtree('meta')
             meta_run_tree = meta_tree.subtree('chunks').subtree(run_hash)
             meta_run_tree.finalize(index=index)
-            if meta_run_tree['end_time'] is None:
-                index['meta', 'chunks', run_hash, 'end_time'] = datetime.datetime.now(pytz.utc).timestamp()
-            return True
+            self.repo.catalog.append_container(meta_tree.container)
+        else:
+            self._write_run_records(run_hash, records_path)
+            meta_run_tree = index.subtree(('meta', 'chunks', run_hash))
+            # the records are keyed by the full path, the catalog ones by the path in the meta tree
+            meta_prefix = E.encode_path('meta')
+            self.repo.catalog.append_records((key[len(meta_prefix):], value)
+                                             for key, value in iter_records(records_path)
+                                             if key.startswith(meta_prefix))
+        if meta_run_tree['end_time'] is None:
+            index['meta', 'chunks', run_hash, 'end_time'] = datetime.datetime.now(pytz.utc).timestamp()
+        index_run_params(self.repo._get_index_container('meta', 0), run_hash,
+                         meta_run_tree.get('attrs', {}))
+
+    def _write_run_records(self, run_hash: str, records_path: str):
+        # Same as finalizing the Run's container, but the records are written in a single batch,
+        # so that the Run is never indexed partially
+        index = self.repo._get_index_container('meta', 0)
+        prefix = E.encode_path(('meta', 'chunks', run_hash))
+        batch = index.batch()
+        # Shadowing
+        index.delete_range(prefix, prefix + b'\xff', store_batch=batch)
+        for key, value in iter_records(records_path):
+            index.set(key, value, store_batch=batch)
+        index.commit(batch)
+        try:
+            (self.progress_dir / run_hash).unlink()
+        except FileNotFoundError:
+            # the Run was indexed by another process meanwhile
+            pass
+
+
+def read_runs_records(repo_path: str, optimize: bool, run_hashes: List[str]) -> List[Optional[str]]:
+    """Dump the `(key, value)` records of the Runs' meta containers in a worker process.
+
+    The records are written to temporary files in pickled chunks of up to `FINALIZE_BATCH_SIZE` records,
+    so that neither the worker nor the parent process hold all the records of a Run as Python objects.
+    Returns the paths of the files, which are read with :obj:`iter_records` and removed by the caller,
+    or `None` for the Runs which are already indexed.
+    """
+    repo = Repo.from_path(repo_path)
+    progress_dir = os.path.join(repo.path, 'meta', 'progress')
+    paths = []
+    try:
+        for run_hash in run_hashes:
+            if not os.path.exists(os.path.join(progress_dir, run_hash)):
+                # the Run is already indexed and its storage is left as is
+                paths.append(None)
+                continue
+            if optimize:
+                repo._optimize_run(run_hash)
+            container = RocksContainer(os.path.join(repo.path, 'meta', 'chunks', run_hash), read_only=True)
+            try:
+                with tempfile.NamedTemporaryFile('wb', prefix=f'aim-{run_hash}-', suffix='.records',
+                                                 delete=False) as records_file:
+                    paths.append(records_file.name)
+                    records = iter(container.items())
+                    while True:
+                        chunk = list(islice(records, rockscontainer.FINALIZE_BATCH_SIZE))
+                        if not chunk:
+                            break
+                        pickle.dump(chunk, records_file, protocol=pickle.HIGHEST_PROTOCOL)
+            finally:
+                container.close()
+    except Exception:
+        for path in paths:
+            if path is not None:
+                os.remove(path)
+        raise
+    return paths
+
+
+def iter_records(records_path: str) -> Iterator[Tuple[bytes, bytes]]:
+    with open(records_path, 'rb') as records_file:
+        while True:
+            try:
+                chunk = pickle.load(records_file)
+            except EOFError:
+                return
+            yield from chunk
@@ -0,0 +1,329 @@
+"""Inverted index of Run params.
+
+When a Run is indexed (see :obj:`RepoIndexManager.index`), each primitive param value
+found in the Run attributes is recorded in the repo index container under the key
+
+    `params_index` / <param path> / <value type> <ordered value encoding> / <run hash>
+
+Numbers (including bools) and strings are encoded so that the byte order of the keys
+matches the Python order of the values, hence equality and range predicates over a param
+become scans of a single key range. The predicates of this kind found in a query are
+translated into such scans, so that Runs which can not match the query are skipped
+before their containers are opened.
+"""
+import ast
+import os
+import struct
+import sys
+
+from typing import Iterator, Optional, Set, Tuple, TYPE_CHECKING
+
+from aim.sdk.query_utils import RunView
+from aim.storage import encoding as E
+from aim.storage.containertreeview import ContainerTreeView
+from aim.storage.structured.sql_engine.entities import ModelMappedRun
+
+if TYPE_CHECKING:
+    from aim.sdk.repo import Repo
+    from aim.storage.container import Container
+    from aim.storage.query import RestrictedPythonQuery
+    from aim.storage.types import AimObject, AimObjectPath
+
+# (param path, value) entries
+PARAMS_INDEX = E.encode_path('params_index')
+# entry keys of each Run, so that the Run entries can be removed on re-indexing
+PARAMS_INDEX_KEYS = E.encode_path('params_index_keys')
+# Runs whose params are indexed
+PARAMS_INDEX_RUNS = E.encode_path('params_index_runs')
+
+# Value type tags; these never start an encoded path key
+_NUMBER = b'\x80'
+_STRING = b'\x81'
+# Values which are not ordered by the index (e.g. long strings), but
+# still may match a predicate, hence are included in every scan of the param
+_UNORDERED = b'\x82'
+
+MAX_STRING_SIZE = 256
+
+_SIGN_BIT = 1 << 63
+_ALL_BITS = (1 << 64) - 1
+
+# `run.<name>` attributes which are not resolved to Run params by `RunView`
+_RUN_PROPERTIES = frozenset((
+    'metrics', 'finalized_at', 'end_time', 'created_at', 'active', 'duration',
+    'db', 'hash', 'structured_run_cls', 'meta_run_tree', 'meta_run_attrs_tree', 'run', 'proxy_cache',
+))
+
+if sys.version_info >= (3, 8):
+    _CONSTANT_NODES = (ast.Constant,)
+else:
+    _CONSTANT_NODES = (ast.Str, ast.Num, ast.NameConstant)
+
+_FLIPPED_OPS = {ast.Eq: ast.Eq, ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE}
+
+
+class _NotIndexed(Exception):
+    pass
+
+
+def index_run_params(index: 'Container', run_hash: str, attrs: 'AimObject'):
+    """Replace the index entries of the Run with the entries of the given `attrs`."""
+    run_key = E.encode_path(run_hash)
+    batch = index.batch()
+    _delete_run_entries(index, run_key, batch)
+    if isinstance(attrs, dict):
+        for path, value in _iter_params(attrs):
+            entry = E.encode_path(path) + _value_key(value) + run_key
+            index.set(PARAMS_INDEX + entry, run_key, store_batch=batch)
+            index.set(PARAMS_INDEX_KEYS + run_key + entry, b'', store_batch=batch)
+    index.set(PARAMS_INDEX_RUNS + run_key, b'', store_batch=batch)
+    index.commit(batch)
+
+
+def remove_run_params(index: 'Container', run_hash: str):
+    batch = index.batch()
+    _delete_run_entries(index, E.encode_path(run_hash), batch)
+    index.commit(batch)
+
+
+def _delete_run_entries(index: 'Container', run_key: bytes, batch):
+    prefix = PARAMS_INDEX_KEYS + run_key
+    for key, _ in index.items(prefix):
+        index.delete(PARAMS_INDEX + key[len(prefix):], store_batch=batch)
+        index.delete(key, store_batch=batch)
+    index.delete(PARAMS_INDEX_RUNS + run_key, store_batch=batch)
+
+
+def _iter_params(attrs: dict, path: tuple = ()) -> Iterator[Tuple['AimObjectPath', 'AimObject']]:
+    for key, value in attrs.items():
+        if not path and isinstance(key, str) and key.startswith('__'):
+            # system params are not indexed
+            continue
+        if isinstance(value, dict):
+            yield from _iter_params(value, path + (key,))
+        elif isinstance(value, (int, float, str)):
+            # containers and `None` never compare equal or ordered to a primitive value
+            yield path + (key,), value
+
+
+def _value_key(value) -> bytes:
+    encoded = _encode_value(value)
+    return _UNORDERED if encoded is None else encoded
+
+
+def _encode_value(value) -> Optional[bytes]:
+    """Order-preserving encoding of the number or string, or `None` if the value can not be encoded."""
+    if isinstance(value, (int, float)):
+        try:
+            # `-0.0 == 0.0`, hence both share the encoding
+            number = float(value) or 0.0
+        except OverflowError:
+            return None
+        bits, = struct.unpack('>Q', struct.pack('>d', number))
+        # flip the sign bit of positive numbers and all the bits of negative ones
+        bits = bits ^ _ALL_BITS if bits & _SIGN_BIT else bits | _SIGN_BIT
+        return _NUMBER + struct.pack('>Q', bits)
+    if isinstance(value, str):
+        try:
+            encoded = value.encode('utf-8')
+        except UnicodeEncodeError:
+            return None
+        # UTF-8 preserves the order of code points; the terminating zero byte orders
+        # the string before the strings it is a prefix of
+        if len(encoded) > MAX_STRING_SIZE or b'\x00' in encoded:
+            return None
+        return _STRING + encoded + b'\x00'
+    return None
+
+
+def params_run_filter(expr: str) -> Optional[tuple]:
+    """Build the params index filter implied by the query expression.
+
+    Comparisons (`==`, `<`, `<=`, `>`, `>=` and `in` a literal collection) of Run params
+    (e.g. `run.hparams.lr` or `run['hparams', 'batch_size']`) to numbers and strings
+    are translated into params index scans. Operands of `and` which can not be translated
+    are ignored, hence the filter is a necessary condition for the Run to match the query.
+
+    Returns:
+        The filter tree of `('and' | 'or', filters)` and `('scan', path, op, value key)`
+        nodes, or `None` if the expression can not be translated.
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode='eval')
+    except SyntaxError:
+        return None
+    try:
+        return _translate(tree.body)
+    except _NotIndexed:
+        return None
+
+
+def params_run_hashes(repo: 'Repo', query: 'RestrictedPythonQuery') -> Optional[Set[str]]:
+    """Hashes of the Runs which may pass the part of the query referring to Run params.
+
+    Runs whose params are not indexed (e.g. Runs in progress) are always included.
+    Returns `None` if there is no such part of the query.
+    """
+    if repo.is_remote_repo:
+        return None
+    params_filter = params_run_filter(query.expr)
+    if params_filter is None:
+        return None
+
+    container = repo.request('meta', read_only=True, from_union=True)
+    indexed = {key[len(PARAMS_INDEX_RUNS):-1].decode() for key, _ in container.items(PARAMS_INDEX_RUNS)}
+    # the params of resumed Runs might have changed since the Runs have been indexed
+    progress_dir = os.path.join(repo.path, 'meta', 'progress')
+    if os.path.isdir(progress_dir):
+        indexed.difference_update(os.listdir(progress_dir))
+
+    run_hashes = set(repo.meta_tree.subtree('chunks').keys())
+    run_hashes.difference_update(indexed)
+    run_hashes.update(_run_hashes(container, params_filter))
+    return run_hashes
+
+
+def _run_hashes(container: 'Container', params_filter: tuple) -> Set[str]:
+    kind = params_filter[0]
+    if kind == 'and':
+        return set.intersection(*(_run_hashes(container, f) for f in params_filter[1]))
+    if kind == 'or':
+        return set().union(*(_run_hashes(container, f) for f in params_filter[1]))
+
+    _, path, op, value_key = params_filter
+    prefix = PARAMS_INDEX + E.encode_path(path)
+    tag = value_key[:1]
+    # the bounds are inclusive: the index is a pre-filter and the rounding of large integers
+    # to float64 may map distinct values to the same key
+    if op is ast.Eq:
+        start, stop = value_key, value_key + b'\xff'
+    elif op in (ast.Lt, ast.LtE):
+        start, stop = tag, value_key + b'\xff'
+    else:
+        start, stop = value_key, None
+    return _scan(container, prefix, start, stop) | _scan(container, prefix, _UNORDERED, None)
+
+
+def _scan(container: 'Container', prefix: bytes, start: bytes, stop: Optional[bytes]) -> Set[str]:
+    run_hashes = set()
+    items = container.items(prefix + start[:1])
+    items.seek(prefix + start)
+    stop = None if stop is None else prefix + stop
+    for key, run_key in items:
+        if stop is not None and key >= stop:
+            break
+        run_hashes.add(run_key[:-1].decode())
+    return run_hashes
+
+
+def _translate(node: ast.expr) -> tuple:
+    if isinstance(node, ast.BoolOp):
+        if isinstance(node.op, ast.Or):
+            return 'or', [_translate(value) for value in node.values]
+        return 'and', _translate_any(node.values)
+    if isinstance(node, ast.Compare):
+        # `a < b < c` is `a < b and b < c`
+        lefts = [node.left] + node.comparators[:-1]
+        return 'and', _translate_any([(left, op, right)
+                                      for left, op, right in zip(lefts, node.ops, node.comparators)])
+    raise _NotIndexed
+
+
+def _translate_any(operands: list) -> list:
+    filters = []
+    for operand in operands:
+        try:
+            if isinstance(operand, tuple):
+                filters.append(_translate_compare(*operand))
+            else:
+                filters.append(_translate(operand))
+        except _NotIndexed:
+            continue
+    if not filters:
+        raise _NotIndexed
+    return filters
+
+
+def _translate_compare(left: ast.expr, op: ast.cmpop, right: ast.expr) -> tuple:
+    if isinstance(op, ast.In):
+        path = _param_path(left)
+        return 'or', [_scan_filter(path, ast.Eq, value) for value in _constants(right)]
+    if type(op) not in _FLIPPED_OPS:
+        # `!=` and `not in` are true for Runs missing the param
+        raise _NotIndexed
+    op = type(op)
+    if _is_param_path(right):
+        left, right, op = right, left, _FLIPPED_OPS[op]
+    return _scan_filter(_param_path(left), op, _constant(right))
+
+
+def _scan_filter(path: tuple, op: type, value) -> tuple:
+    if not isinstance(value, (int, float, str)):
+        raise _NotIndexed
+    value_key = _encode_value(value)
+    if value_key is None:
+        raise _NotIndexed
+    return 'scan', path, op, value_key
+
+
+def _is_param_path(node: ast.expr) -> bool:
+    try:
+        _param_path(node)
+    except _NotIndexed:
+        return False
+    return True
+
+
+def _param_path(node: ast.expr) -> tuple:
+    path = _attrs_path(node)
+    if not path or (isinstance(path[0], str) and path[0].startswith('__')):
+        raise _NotIndexed
+    return path
+
+
+def _attrs_path(node: ast.expr) -> tuple:
+    if isinstance(node, ast.Attribute):
+        name = node.attr
+        if _is_run(node.value):
+            if name.startswith('_') or name in _RUN_PROPERTIES or name in ModelMappedRun.fields() \
+                    or hasattr(RunView, name):
+                raise _NotIndexed
+            return name,
+        # attributes of the tree views take precedence over the params
+        if name.startswith('_') or name == 'container' or hasattr(ContainerTreeView, name):
+            raise _NotIndexed
+        return _attrs_path(node.value) + (name,)
+    if isinstance(node, ast.Subscript):
+        key = node.slice
+        if isinstance(key, getattr(ast, 'Index', ())):
+            key = key.value
+        keys = tuple(_constant(k) for k in key.elts) if isinstance(key, ast.Tuple) else (_constant(key),)
+        if not all(isinstance(k, str) for k in keys):
+            raise _NotIndexed
+        if _is_run(node.value):
+            return keys
+        return _attrs_path(node.value) + keys
+    raise _NotIndexed
+
+
+def _is_run(node: ast.expr) -> bool:
+    return isinstance(node, ast.Name) and node.id == 'run'
+
+
+def _constant(node: ast.expr):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _constant(node.operand)
+        if type(value) not in (int, float):
+            raise _NotIndexed
+        return -value if isinstance(node.op, ast.USub) else value
+    if not isinstance(node, _CONSTANT_NODES):
+        raise _NotIndexed
+    if isinstance(node, ast.Constant):
+        return node.value
+    return node.s if isinstance(node, ast.Str) else getattr(node, 'value', getattr(node, 'n', None))
+
+
+def _constants(node: ast.expr) -> list:
+    if not isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        raise _NotIndexed
+    return [_constant(elt) for elt in node.elts]
@@ -0,0 +1,137 @@
+"""Evaluation of repository queries in a pool of worker processes.
+
+Query evaluation is dominated by opening Run containers and running the query checker for
+every Run, which is CPU-bound. Run hashes are split into shards which are evaluated by the
+worker processes, each holding its own read-only view of the repository. The results are
+yielded in the original order, with a bounded number of shards in flight.
+"""
+import multiprocessing
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aim.sdk.repo import Repo
+
+T = TypeVar('T')
+
+RUNS_PER_SHARD = 32
+# Shards submitted per worker ahead of the consumer
+SHARDS_PER_WORKER = 2
+
+_executors: Dict[int, ProcessPoolExecutor] = {}
+
+# Worker process state
+_repos: Dict[str, 'Repo'] = {}
+_scans: Dict[str, str] = {}
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    executor = _executors.get(workers)
+    if executor is None:
+        # RocksDB handles and threads do not survive `fork()`
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        _executors[workers] = executor
+    return executor
+
+
+def imap_shards(
+    workers: int,
+    fn: Callable,
+    args: tuple,
+    items: Iterable[T],
+    run_hash: Callable[[T], Optional[str]]
+) -> Iterator[Tuple[T, object]]:
+    """Yield `(item, result)` pairs, where the results for the shards of items are computed in worker processes.
+
+    `fn` must be a module-level function, which is called as `fn(*args, run_hashes)` and returns the list of
+    results for the given run hashes. Items for which `run_hash()` returns `None` are not sent to the workers
+    and are yielded with `None` result.
+    """
+    executor = get_executor(workers)
+    pending = deque()
+    try:
+        for shard in _shards(items, RUNS_PER_SHARD):
+            run_hashes = [run_hash(item) for item in shard]
+            future = executor.submit(fn, *args, [h for h in run_hashes if h is not None])
+            pending.append((shard, run_hashes, future))
+            if len(pending) >= workers * SHARDS_PER_WORKER:
+                yield from _shard_results(*pending.popleft())
+        while pending:
+            yield from _shard_results(*pending.popleft())
+    except BrokenProcessPool:
+        _executors.pop(workers, None)
+        raise
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+
+
+def _shard_results(shard: List[T], run_hashes: List[Optional[str]], future: Future) -> Iterator[Tuple[T, object]]:
+    results = iter(future.result())
+    for item, run_hash in zip(shard, run_hashes):
+        yield item, next(results) if run_hash is not None else None
+
+
+def _shards(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    shard = []
+    for item in items:
+        shard.append(item)
+        if len(shard) == size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def _get_repo(repo_path: str, scan_id: str) -> 'Repo':
+    from aim.sdk.repo import Repo
+
+    repo = _repos.get(repo_path)
+    if repo is None:
+        repo = _repos[repo_path] = Repo.from_path(repo_path)
+    if _scans.get(repo_path) != scan_id:
+        # structured Run data is cached once per scan
+        repo._prepare_runs_cache()
+        _scans[repo_path] = scan_id
+    return repo
+
+
+def match_runs(
+    repo_path: str,
+    scan_id: str,
+    query: str,
+    timezone_offset: int,
+    run_hashes: List[str]
+) -> List[bool]:
+    from aim.sdk.query_utils import RunView
+    from aim.sdk.run import Run
+    from aim.storage.query import RestrictedPythonQuery
+
+    repo = _get_repo(repo_path, scan_id)
+    query = RestrictedPythonQuery(query)
+    return [query.check(run=RunView(Run(run_hash, repo=repo, read_only=True), timezone_offset=timezone_offset))
+            for run_hash in run_hashes]
+
+
+def match_sequences(
+    repo_path: str,
+    scan_id: str,
+    query: str,
+    seq_cls: type,
+    timezone_offset: int,
+    run_hashes: List[str]
+) -> List[List[Tuple[str, dict]]]:
+    from aim.sdk.run import Run
+    from aim.sdk.sequence_collection import SingleRunSequenceCollection
+
+    repo = _get_repo(repo_path, scan_id)
+    results = []
+    for run_hash in run_hashes:
+        run = Run(run_hash, repo=repo, read_only=True)
+        collection = SingleRunSequenceCollection(run, seq_cls, query, runs_proxy_cache={},
+                                                 timezone_offset=timezone_offset)
+        results.append([(seq.name, seq.context.to_dict()) for seq in collection])
+    return results
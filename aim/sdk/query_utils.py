@@ -25,6 +25,7 @@ class RunView:
         self.run = run
         self.proxy_cache = None
         self._timezone_offset = timezone_offset
+        self._attrs_prefetched = False
         if runs_proxy_cache is not None:
             if runs_proxy_cache.get(run.hash) is None:
                 runs_proxy_cache[run.hash] = {}
@@ -57,6 +58,11 @@ class RunView:
             return self[item]
 
     def __getitem__(self, key):
+        if not self._attrs_prefetched:
+            # the params of a remote Run are fetched in a single round trip, for the lifetime of the view
+            self.meta_run_attrs_tree.prefetch()
+            self._attrs_prefetched = True
+
         def safe_collect():
             res = None
             if self.proxy_cache is not None:
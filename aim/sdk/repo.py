@@ -14,20 +14,27 @@ from aim.ext.task_queue.queue import TaskQueue
 from aim.ext.cleanup import AutoClean
 from aim.ext.transport.client import Client
 
-from aim.sdk.configs import get_aim_repo_name, AIM_ENABLE_TRACKING_THREAD
+from aim.sdk.configs import (
+    get_aim_repo_name,
+    AIM_ENABLE_TRACKING_THREAD,
+    AIM_TRACKING_THREAD_WORKERS,
+    AIM_TRACKING_BATCH_SIZE,
+)
 from aim.sdk.errors import RepoIntegrityError
 from aim.sdk.run import Run
+from aim.sdk.catalog import RepoCatalog
 from aim.sdk.utils import search_aim_repo, clean_repo_path
 from aim.sdk.sequence_collection import QuerySequenceCollection, QueryRunSequenceCollection
 from aim.sdk.sequence import Sequence
 from aim.sdk.types import QueryReportMode
 from aim.sdk.data_version import DATA_VERSION
+from aim.sdk.params_index import index_run_params, remove_run_params
 from aim.sdk.remote_repo_proxy import RemoteRepoProxy
 from aim.sdk.lock_manager import LockManager, RunLock
 
 from aim.storage.locking import SoftFileLock
 from aim.storage.container import Container
-from aim.storage.rockscontainer import RocksContainer
+from aim.storage.rockscontainer import RocksContainer, batched_writes
 from aim.storage.union import RocksUnionContainer
 from aim.storage.treeviewproxy import ProxyTree
 from aim.storage.lock_proxy import ProxyLock
@@ -56,7 +63,11 @@ class RepoStatus(Enum):
 
 def _get_tracking_queue():
     if os.getenv(AIM_ENABLE_TRACKING_THREAD, False):
-        return TaskQueue('metric_tracking', max_backlog=10_000_000)  # single thread task queue for Run.track
+        # task queue for Run.track; the values tracked for a Run are written in batches, in order
+        return TaskQueue('metric_tracking', max_backlog=10_000_000,
+                         num_workers=int(os.getenv(AIM_TRACKING_THREAD_WORKERS, 1)),
+                         max_batch_size=int(os.getenv(AIM_TRACKING_BATCH_SIZE, 1000)),
+                         batch_context=lambda tracker: tracker.batch())
     return None
 
 
@@ -280,6 +291,9 @@ class Repo:
                 self.persistent_pool[container_config] = container
             else:
                 container = RocksContainer(path, read_only=read_only)
+                if not read_only:
+                    # make the new chunk visible to the union reads right away
+                    RocksUnionContainer.invalidate_listing()
             self.container_pool[container_config] = container
 
         return container
@@ -356,8 +370,12 @@ class Repo:
         assert self.structured_db
         _props = None
 
-        if self.run_props_cache_hint:
-            _props = self.structured_db.caches[self.run_props_cache_hint][hash_]
+        cache = self.structured_db.caches.get(self.run_props_cache_hint) if self.run_props_cache_hint else None
+        if cache is None:
+            # the hinted cache was invalidated
+            self.run_props_cache_hint = None
+        else:
+            _props = cache[hash_]
         if not _props:
             _props = self.structured_db.find_run(hash_)
             if not _props:
@@ -366,8 +384,8 @@ class Repo:
                 else:
                     with self._sdb_lock:
                         _props = self.structured_db.create_run(hash_, created_at)
-            if self.run_props_cache_hint:
-                self.structured_db.caches[self.run_props_cache_hint][hash_] = _props
+            if cache is not None:
+                cache[hash_] = _props
 
         return _props
 
@@ -461,7 +479,8 @@ class Repo:
                    query: str = '',
                    paginated: bool = False,
                    offset: str = None,
-                   report_mode: QueryReportMode = QueryReportMode.PROGRESS_BAR) -> QueryRunSequenceCollection:
+                   report_mode: QueryReportMode = QueryReportMode.PROGRESS_BAR,
+                   workers: int = 1) -> QueryRunSequenceCollection:
         """Get runs satisfying query expression.
 
         Args:
@@ -471,11 +490,13 @@ class Repo:
              offset (:obj:`str`, optional): `hash` of Run to skip to.
              report_mode(:obj:`QueryReportMode`, optional): indicates report mode
                 (0: DISABLED, 1: PROGRESS BAR, 2: PROGRESS TUPLE). QueryReportMode.PROGRESS_BAR if not specified.
+             workers (:obj:`int`, optional): number of worker processes evaluating the query in parallel.
+                1 if not specified, meaning the query is evaluated in the current process.
         Returns:
             :obj:`SequenceCollection`: Iterable for runs/metrics matching query expression.
         """
         self._prepare_runs_cache()
-        return QueryRunSequenceCollection(self, Sequence, query, paginated, offset, report_mode)
+        return QueryRunSequenceCollection(self, Sequence, query, paginated, offset, report_mode, workers=workers)
 
     def delete_run(self, run_hash: str) -> bool:
         """Delete Run data from aim repository
@@ -521,72 +542,59 @@ class Repo:
         else:
             return True, []
 
-    def copy_runs(self, run_hashes: List[str], dest_repo: 'Repo') -> Tuple[bool, List[str]]:
+    def copy_runs(self, run_hashes: List[str], dest_repo: 'Repo', workers: int = 1) -> Tuple[bool, List[str]]:
         """Copy multiple Runs data from current aim repository to destination aim repository
 
+        If both repositories are local, the raw records of the Runs' containers are copied as is,
+        in `workers` threads.
+
         Args:
             run_hashes (:obj:`str`): list of Runs to be copied.
             dest_repo (:obj:`Repo`): destination Repo instance to copy Runs
+            workers (:obj:`int`, optional): number of threads copying Runs data. 1 by default.
 
         Returns:
             (True, []) if all runs were copied successfully,
             (False, :obj:`list`) with list of remaining runs otherwise.
         """
-        from tqdm import tqdm
-        remaining_runs = []
-        for run_hash in tqdm(run_hashes):
-            try:
-                self._copy_run(run_hash, dest_repo)
-            except Exception as e:
-                logger.warning(f'Error while trying to copy run \'{run_hash}\'. {str(e)}.')
-                remaining_runs.append(run_hash)
+        return self._transfer_runs(run_hashes, dest_repo, workers=workers, move=False)
 
-        if remaining_runs:
-            return False, remaining_runs
-        else:
-            return True, []
-
-    def move_runs(self, run_hashes: List[str], dest_repo: 'Repo') -> Tuple[bool, List[str]]:
+    def move_runs(self, run_hashes: List[str], dest_repo: 'Repo', workers: int = 1) -> Tuple[bool, List[str]]:
         """Move multiple Runs data from current aim repository to destination aim repository
 
+        If both repositories are on the same filesystem, the Runs' containers are renamed into the
+        destination repository. Otherwise the Runs are copied, in `workers` threads, and deleted.
+
         Args:
             run_hashes (:obj:`str`): list of Runs to be moved.
             dest_repo (:obj:`Repo`): destination Repo instance to move Runs
+            workers (:obj:`int`, optional): number of threads copying Runs data. 1 by default.
 
         Returns:
             (True, []) if all runs were moved successfully,
             (False, :obj:`list`) with list of remaining runs otherwise.
         """
-        from tqdm import tqdm
-        remaining_runs = []
-        for run_hash in tqdm(run_hashes):
-            try:
-                self._copy_run(run_hash, dest_repo)
-                self._delete_run(run_hash)
-            except Exception as e:
-                logger.warning(f'Error while trying to move run \'{run_hash}\'. {str(e)}.')
-                remaining_runs.append(run_hash)
-
-        if remaining_runs:
-            return False, remaining_runs
-        else:
-            return True, []
+        return self._transfer_runs(run_hashes, dest_repo, workers=workers, move=True)
 
     def query_metrics(self,
                       query: str = '',
-                      report_mode: QueryReportMode = QueryReportMode.PROGRESS_BAR) -> QuerySequenceCollection:
+                      report_mode: QueryReportMode = QueryReportMode.PROGRESS_BAR,
+                      workers: int = 1) -> QuerySequenceCollection:
         """Get metrics satisfying query expression.
 
         Args:
              query (:obj:`str`): query expression.
              report_mode(:obj:`QueryReportMode`, optional): indicates report mode
                 (0: DISABLED, 1: PROGRESS BAR, 2: PROGRESS TUPLE). QueryReportMode.PROGRESS_BAR if not specified.
+             workers (:obj:`int`, optional): number of worker processes evaluating the query in parallel.
+                1 if not specified, meaning the query is evaluated in the current process.
         Returns:
             :obj:`SequenceCollection`: Iterable for metrics matching query expression.
         """
         self._prepare_runs_cache()
         from aim.sdk.sequences.metric import Metric
-        return QuerySequenceCollection(repo=self, seq_cls=Metric, query=query, report_mode=report_mode)
+        return QuerySequenceCollection(repo=self, seq_cls=Metric, query=query, report_mode=report_mode,
+                                       workers=workers)
 
     def query_images(self,
                      query: str = '',
@@ -722,10 +730,11 @@ class Repo:
         Returns:
             :obj:`dict`: Tree of sequences and their contexts groupped by sequence type.
         """
-        meta_tree = self._get_meta_tree()
         sequence_traces = {}
         if isinstance(sequence_types, str):
             sequence_types = (sequence_types,)
+        traces_types = self._collect_catalog_tree('traces_types')
+        contexts = self._collect_catalog_tree('contexts')
         for seq_type in sequence_types:
             seq_cls = Sequence.registry.get(seq_type, None)
             if seq_cls is None:
@@ -734,24 +743,16 @@ class Repo:
             dtypes = seq_cls.allowed_dtypes()
             dtype_traces = set()
             for dtype in dtypes:
-                try:
-                    dtype_trace_tree = meta_tree.collect(('traces_types', dtype))
-                    for ctx_id, seqs in dtype_trace_tree.items():
-                        for seq_name in seqs.keys():
-                            dtype_traces.add((ctx_id, seq_name))
-                except KeyError:
-                    pass
+                for ctx_id, seqs in traces_types.get(dtype, {}).items():
+                    for seq_name in seqs.keys():
+                        dtype_traces.add((ctx_id, seq_name))
             if 'float' in dtypes:  # old sequences without dtype set are considered float sequences
-                try:
-                    dtype_trace_tree = meta_tree.collect('traces')
-                    for ctx_id, seqs in dtype_trace_tree.items():
-                        for seq_name in seqs.keys():
-                            dtype_traces.add((ctx_id, seq_name))
-                except KeyError:
-                    pass
+                for ctx_id, seqs in self._collect_catalog_tree('traces').items():
+                    for seq_name in seqs.keys():
+                        dtype_traces.add((ctx_id, seq_name))
             traces_info = defaultdict(list)
             for ctx_id, seq_name in dtype_traces:
-                traces_info[seq_name].append(meta_tree['contexts', ctx_id])
+                traces_info[seq_name].append(contexts[ctx_id])
             sequence_traces[seq_type] = traces_info
         return sequence_traces
 
@@ -761,9 +762,27 @@ class Repo:
         Returns:
             :obj:`dict`: All runs meta-parameters.
         """
-        meta_tree = self._get_meta_tree()
+        return self._collect_catalog_tree('attrs', strict=False)
+
+    @property
+    def catalog(self) -> Optional[RepoCatalog]:
+        """The params and sequences catalog of the repo. `None` for remote repos."""
+        if self.is_remote_repo:
+            return None
+        return RepoCatalog.get(self.path)
+
+    def catalog_generation(self) -> Optional[str]:
+        """Tag of the current params and sequences catalog content. `None` if the catalog is not used."""
+        if self.is_remote_repo:
+            return None
+        return self.catalog.generation(self._get_meta_tree)
+
+    def _collect_catalog_tree(self, name: str, strict: bool = True) -> dict:
+        # the catalog subtrees are served from memory for local repos, see :obj:`RepoCatalog`
+        if not self.is_remote_repo:
+            return self.catalog.tree(name, self._get_meta_tree, strict=strict)
         try:
-            return meta_tree.collect('attrs', strict=False)
+            return self._get_meta_tree().collect(name, strict=strict)
         except KeyError:
             return {}
 
@@ -775,17 +794,23 @@ class Repo:
         if self.is_remote_repo:
             self._remote_repo_proxy.prune()
         prune(self)
+        if not self.is_remote_repo:
+            self.catalog.invalidate()
 
     def _prepare_runs_cache(self):
         if self.is_remote_repo:
             return
 
-        db = self.structured_db
         cache_name = 'runs_cache'
-        db.invalidate_cache(cache_name)
-        db.init_cache(cache_name, db.runs, lambda run: run.hash)
+        self.structured_db.init_runs_cache(cache_name)
         self.run_props_cache_hint = cache_name
 
+    def _invalidate_run_props(self, hash_: str):
+        # called once the structured props of the Run are updated, see :obj:`RunsCache`
+        if self.is_remote_repo:
+            return
+        self.structured_db.runs_cache.invalidate(hash_)
+
     def _delete_run(self, run_hash):
         if self.is_remote_repo:
             return self._remote_repo_proxy.delete_run(run_hash)
@@ -799,8 +824,7 @@ class Repo:
             self.structured_db.delete_run(run_hash)
 
             # remove data from index container
-            index_tree = self._get_index_container('meta', timeout=0).tree()
-            del index_tree.subtree(('meta', 'chunks'))[run_hash]
+            self._remove_run_index(run_hash, timeout=0)
 
             # delete rocksdb containers data
             sub_dirs = ('chunks', 'progress', 'locks')
@@ -815,76 +839,154 @@ class Repo:
                     os.remove(seqs_path)
                 else:
                     shutil.rmtree(seqs_path, ignore_errors=True)
+        self._invalidate_run_props(run_hash)
 
-    def _copy_run(self, run_hash, dest_repo):
-        def copy_trees():
-            # copy run meta tree
-            source_meta_tree = self.request_tree(
-                'meta', run_hash, read_only=True, from_union=False, no_cache=True
-            ).subtree('meta')
-            dest_meta_tree = dest_repo.request_tree(
-                'meta', run_hash, read_only=False, from_union=False, no_cache=True
-            ).subtree('meta')
-            dest_meta_run_tree = dest_meta_tree.subtree('chunks').subtree(run_hash)
-            dest_meta_tree[...] = source_meta_tree[...]
-            dest_index = dest_repo._get_index_tree('meta', timeout=10).view(())
-            dest_meta_run_tree.finalize(index=dest_index)
-
-            # copy run series tree
-            source_series_run_tree = self.request_tree(
-                'seqs', run_hash, read_only=True, no_cache=True
-            ).subtree('seqs')
-            dest_series_run_tree = dest_repo.request_tree(
-                'seqs', run_hash, read_only=False, no_cache=True
-            ).subtree('seqs')
-
-            # copy v2 sequences
-            source_v2_tree = source_series_run_tree.subtree(('v2', 'chunks', run_hash))
-            dest_v2_tree = dest_series_run_tree.subtree(('v2', 'chunks', run_hash))
-            for ctx_id in source_v2_tree.keys():
-                for metric_name in source_v2_tree.subtree(ctx_id).keys():
-                    source_val_view = source_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('val')
-                    source_step_view = source_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('step', dtype='int64')
-                    source_epoch_view = source_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('epoch', dtype='int64')
-                    source_time_view = source_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('time', dtype='int64')
+    def _transfer_runs(self, run_hashes: List[str], dest_repo: 'Repo', *, workers: int, move: bool):
+        from multiprocessing.pool import ThreadPool
+        from tqdm import tqdm
 
-                    dest_val_view = dest_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('val').allocate()
-                    dest_step_view = dest_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('step', dtype='int64').allocate()
-                    dest_epoch_view = dest_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('epoch', dtype='int64').allocate()
-                    dest_time_view = dest_v2_tree.\
-                        subtree((ctx_id, metric_name)).array('time', dtype='int64').allocate()
+        local_copy = not (self.is_remote_repo or dest_repo.is_remote_repo)
+        remaining_runs = []
 
-                    for key, val in source_val_view.items():
-                        dest_val_view[key] = val
-                        dest_step_view[key] = source_step_view[key]
-                        dest_epoch_view[key] = source_epoch_view[key]
-                        dest_time_view[key] = source_time_view[key]
+        def log_error(run_hash, error):
+            action = 'move' if move else 'copy'
+            logger.warning(f'Error while trying to {action} run \'{run_hash}\'. {str(error)}.')
+            remaining_runs.append(run_hash)
+
+        copied_runs = []
+        for run_hash in run_hashes:
+            if move and self._can_rename_run(run_hash, dest_repo):
+                try:
+                    self._rename_run(run_hash, dest_repo)
+                except Exception as e:
+                    log_error(run_hash, e)
+            else:
+                copied_runs.append(run_hash)
+
+        def copy_run_data(run_hash):
+            try:
+                if local_copy:
+                    self._copy_run_chunks(run_hash, dest_repo)
+                else:
+                    self._copy_run(run_hash, dest_repo)
+            except Exception as e:
+                return run_hash, e
+            return run_hash, None
+
+        pool = None
+        if local_copy and workers > 1 and len(copied_runs) > 1:
+            pool = ThreadPool(min(workers, len(copied_runs)))
+            results = pool.imap_unordered(copy_run_data, copied_runs)
+        else:
+            results = map(copy_run_data, copied_runs)
+        try:
+            # the structured DB and the index are updated in the current thread
+            for run_hash, error in tqdm(results, total=len(copied_runs)):
+                if error is None:
+                    try:
+                        if local_copy:
+                            self._index_run_copy(run_hash, dest_repo)
+                        if move:
+                            self._delete_run(run_hash)
+                    except Exception as e:
+                        error = e
+                if error is not None:
+                    log_error(run_hash, error)
+        finally:
+            if pool is not None:
+                pool.close()
 
-            # copy v1 sequences
-            source_v1_tree = source_series_run_tree.subtree(('chunks', run_hash))
-            dest_v1_tree = dest_series_run_tree.subtree(('chunks', run_hash))
-            for ctx_id in source_v1_tree.keys():
-                for metric_name in source_v1_tree.\
+        if remaining_runs:
+            return False, remaining_runs
+        else:
+            return True, []
+
+    def _copy_run(self, run_hash, dest_repo):
+        # check run lock info. in progress runs can't be copied
+        if self._lock_manager.get_run_lock_info(run_hash).locked:
+            raise RuntimeError(f'Cannot copy Run \'{run_hash}\'. Run is locked.')
+
+        if dest_repo.is_remote_repo:
+            # create remote run
+            self._copy_run_trees(run_hash, dest_repo)
+            self._copy_structured_props(run_hash, dest_repo)
+        else:
+            with dest_repo.structured_db:  # rollback destination db entity if subsequent actions fail.
+                # copy run structured data
+                self._copy_structured_props(run_hash, dest_repo)
+                self._copy_run_trees(run_hash, dest_repo)
+
+    def _copy_run_trees(self, run_hash, dest_repo):
+        # copy run meta tree
+        source_meta_tree = self.request_tree(
+            'meta', run_hash, read_only=True, from_union=False, no_cache=True
+        ).subtree('meta')
+        dest_meta_tree = dest_repo.request_tree(
+            'meta', run_hash, read_only=False, from_union=False, no_cache=True
+        ).subtree('meta')
+        dest_meta_run_tree = dest_meta_tree.subtree('chunks').subtree(run_hash)
+        dest_meta_tree[...] = source_meta_tree[...]
+        dest_index = dest_repo._get_index_tree('meta', timeout=10).view(())
+        dest_meta_run_tree.finalize(index=dest_index)
+        index_run_params(dest_repo._get_index_container('meta', timeout=10), run_hash,
+                         dest_meta_run_tree.get('attrs', {}))
+
+        # copy run series tree
+        source_series_run_tree = self.request_tree(
+            'seqs', run_hash, read_only=True, no_cache=True
+        ).subtree('seqs')
+        dest_series_run_tree = dest_repo.request_tree(
+            'seqs', run_hash, read_only=False, no_cache=True
+        ).subtree('seqs')
+
+        # copy v2 sequences
+        source_v2_tree = source_series_run_tree.subtree(('v2', 'chunks', run_hash))
+        dest_v2_tree = dest_series_run_tree.subtree(('v2', 'chunks', run_hash))
+        for ctx_id in source_v2_tree.keys():
+            for metric_name in source_v2_tree.subtree(ctx_id).keys():
+                source_val_view = source_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('val')
+                source_step_view = source_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('step', dtype='int64')
+                source_epoch_view = source_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('epoch', dtype='int64')
+                source_time_view = source_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('time', dtype='int64')
+
+                dest_val_view = dest_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('val').allocate()
+                dest_step_view = dest_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('step', dtype='int64').allocate()
+                dest_epoch_view = dest_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('epoch', dtype='int64').allocate()
+                dest_time_view = dest_v2_tree.\
+                    subtree((ctx_id, metric_name)).array('time', dtype='int64').allocate()
+
+                for key, val in source_val_view.items():
+                    dest_val_view[key] = val
+                    dest_step_view[key] = source_step_view[key]
+                    dest_epoch_view[key] = source_epoch_view[key]
+                    dest_time_view[key] = source_time_view[key]
+
+        # copy v1 and v3 sequences (both keyed by step)
+        for chunks_path in (('chunks', run_hash), ('v3', 'chunks', run_hash)):
+            source_tree = source_series_run_tree.subtree(chunks_path)
+            dest_tree = dest_series_run_tree.subtree(chunks_path)
+            for ctx_id in source_tree.keys():
+                for metric_name in source_tree.\
                         subtree(ctx_id).keys():
-                    source_val_view = source_v1_tree.\
+                    source_val_view = source_tree.\
                         subtree((ctx_id, metric_name)).array('val')
-                    source_epoch_view = source_v1_tree.\
+                    source_epoch_view = source_tree.\
                         subtree((ctx_id, metric_name)).array('epoch', dtype='int64')
-                    source_time_view = source_v1_tree.\
+                    source_time_view = source_tree.\
                         subtree((ctx_id, metric_name)).array('time', dtype='int64')
 
-                    dest_val_view = dest_v1_tree.\
+                    dest_val_view = dest_tree.\
                         subtree((ctx_id, metric_name)).array('val').allocate()
-                    dest_epoch_view = dest_v1_tree.\
+                    dest_epoch_view = dest_tree.\
                         subtree((ctx_id, metric_name)).array('epoch', dtype='int64').allocate()
-                    dest_time_view = dest_v1_tree.\
+                    dest_time_view = dest_tree.\
                         subtree((ctx_id, metric_name)).array('time', dtype='int64').allocate()
 
                     for key, val in source_val_view.items():
@@ -892,34 +994,85 @@ class Repo:
                         dest_epoch_view[key] = source_epoch_view[key]
                         dest_time_view[key] = source_time_view[key]
 
-        def copy_structured_props():
-            source_structured_run = self.structured_db.find_run(run_hash)
-            dest_structured_run = dest_repo.request_props(run_hash,
-                                                          read_only=False,
-                                                          created_at=source_structured_run.created_at)
-            dest_structured_run.name = source_structured_run.name
-            dest_structured_run.experiment = source_structured_run.experiment
-            dest_structured_run.description = source_structured_run.description
-            dest_structured_run.archived = source_structured_run.archived
-            for source_tag in source_structured_run.tags:
-                dest_structured_run.add_tag(source_tag)
-
+    def _copy_structured_props(self, run_hash, dest_repo):
+        source_structured_run = self.structured_db.find_run(run_hash)
+        dest_structured_run = dest_repo.request_props(run_hash,
+                                                      read_only=False,
+                                                      created_at=source_structured_run.created_at)
+        dest_structured_run.name = source_structured_run.name
+        dest_structured_run.experiment = source_structured_run.experiment
+        dest_structured_run.description = source_structured_run.description
+        dest_structured_run.archived = source_structured_run.archived
+        for source_tag in source_structured_run.tags:
+            dest_structured_run.add_tag(source_tag)
+
+    def _copy_run_chunks(self, run_hash, dest_repo):
         # check run lock info. in progress runs can't be copied
         if self._lock_manager.get_run_lock_info(run_hash).locked:
             raise RuntimeError(f'Cannot copy Run \'{run_hash}\'. Run is locked.')
 
-        if dest_repo.is_remote_repo:
-            # create remote run
-            try:
-                copy_trees()
-                copy_structured_props()
-            except Exception as e:
-                raise e
-        else:
+        # copy the raw records of the run containers, without decoding the run data
+        for name in ('meta', 'seqs'):
+            if not os.path.exists(os.path.join(self.path, name, 'chunks', run_hash)):
+                continue
+            source_container = self.request(name, run_hash, read_only=True, no_cache=True)
+            dest_container = dest_repo.request(name, run_hash, read_only=False, no_cache=True)
+            source_container.copy_to(dest_container)
+
+    def _index_run_copy(self, run_hash, dest_repo):
+        try:
             with dest_repo.structured_db:  # rollback destination db entity if subsequent actions fail.
-                # copy run structured data
-                copy_structured_props()
-                copy_trees()
+                self._copy_structured_props(run_hash, dest_repo)
+                dest_meta_tree = dest_repo.request_tree(
+                    'meta', run_hash, read_only=False, from_union=False, no_cache=True
+                ).subtree('meta')
+                dest_meta_run_tree = dest_meta_tree.subtree(('chunks', run_hash))
+                dest_index = dest_repo._get_index_tree('meta', timeout=10).view(())
+                dest_meta_run_tree.finalize(index=dest_index)
+                index_run_params(dest_repo._get_index_container('meta', timeout=10), run_hash,
+                                 dest_meta_run_tree.get('attrs', {}))
+                dest_repo.catalog.append_container(dest_meta_tree.container)
+        except Exception:
+            # the index entries are not covered by the db rollback
+            dest_repo._remove_run_index(run_hash, timeout=10)
+            raise
+
+    def _remove_run_index(self, run_hash, timeout: int):
+        index_container = self._get_index_container('meta', timeout=timeout)
+        del index_container.tree().subtree(('meta', 'chunks'))[run_hash]
+        remove_run_params(index_container, run_hash)
+
+    def _can_rename_run(self, run_hash, dest_repo) -> bool:
+        if self.is_remote_repo or dest_repo.is_remote_repo:
+            return False
+        if os.stat(self.path).st_dev != os.stat(dest_repo.path).st_dev:
+            return False
+        return not any(os.path.exists(os.path.join(dest_repo.path, name, 'chunks', run_hash))
+                       for name in ('meta', 'seqs'))
+
+    def _rename_run(self, run_hash, dest_repo):
+        # check run lock info. in progress runs can't be moved
+        if self._lock_manager.get_run_lock_info(run_hash).locked:
+            raise RuntimeError(f'Cannot move Run \'{run_hash}\'. Run is locked.')
+
+        renamed = []
+        try:
+            for name in ('meta', 'seqs'):
+                source_path = os.path.join(self.path, name, 'chunks', run_hash)
+                if not os.path.exists(source_path):
+                    continue
+                dest_path = os.path.join(dest_repo.path, name, 'chunks', run_hash)
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                os.rename(source_path, dest_path)
+                renamed.append((source_path, dest_path))
+            RocksUnionContainer.invalidate_listing()
+            self._index_run_copy(run_hash, dest_repo)
+        except Exception:
+            for source_path, dest_path in reversed(renamed):
+                os.rename(dest_path, source_path)
+            RocksUnionContainer.invalidate_listing()
+            raise
+        self._delete_run(run_hash)
 
     def close(self):
         if self._resources is None:
@@ -933,10 +1086,16 @@ class Repo:
     @contextmanager
     def atomic_track(self, queue_id):
         if self.is_remote_repo:
+            if self._client.in_instructions_batch:
+                # nested batches are merged into the outermost one
+                yield
+                return
             self._client.start_instructions_batch()
-        yield
-        if self.is_remote_repo:
+            yield
             self._client.flush_instructions_batch(queue_id)
+        else:
+            with batched_writes():
+                yield
 
     def _backup_run(self, run_hash):
         from aim.sdk.utils import backup_run
@@ -952,11 +1111,17 @@ class Repo:
         else:
             restore_run_backup(self, run_hash)
 
-    def _close_run(self, run_hash):
+    def _optimize_run(self, run_hash):
         def optimize_container(path, extra_options):
             rc = RocksContainer(path, read_only=True, **extra_options)
             rc.optimize_for_read()
 
+        meta_db_path = os.path.join(self.path, 'meta', 'chunks', run_hash)
+        seqs_db_path = os.path.join(self.path, 'seqs', 'chunks', run_hash)
+        optimize_container(meta_db_path, extra_options={'compaction': True})
+        optimize_container(seqs_db_path, extra_options={})
+
+    def _close_run(self, run_hash):
         if self.is_remote_repo:
             self._remote_repo_proxy._close_run(run_hash)
 
@@ -966,9 +1131,6 @@ class Repo:
 
         if lock_manager.release_locks(run_hash, force=True):
             # Run rocksdb optimizations if container locks are removed
-            meta_db_path = os.path.join(self.path, 'meta', 'chunks', run_hash)
-            seqs_db_path = os.path.join(self.path, 'seqs', 'chunks', run_hash)
-            optimize_container(meta_db_path, extra_options={'compaction': True})
-            optimize_container(seqs_db_path, extra_options={})
+            self._optimize_run(run_hash)
         if index_manager.run_needs_indexing(run_hash):
             index_manager.index(run_hash)
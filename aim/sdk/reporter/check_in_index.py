@@ -0,0 +1,242 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Union
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Inotify(object):
+    """Minimal non-blocking inotify(7) watch of the directory entries creation and removal."""
+
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+
+    WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF
+    ADDED = IN_CREATE | IN_MOVED_TO
+    REMOVED = IN_DELETE | IN_MOVED_FROM
+    # the events after which the watch is not valid anymore
+    INVALIDATED = IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF
+
+    _EVENT_HEADER = struct.Struct('iIII')
+    _libc = None
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                libc.inotify_init1, libc.inotify_add_watch  # noqa
+            except (OSError, AttributeError):
+                cls._libc = False
+            else:
+                cls._libc = libc
+        return bool(cls._libc)
+
+    def __init__(self, path: Path):
+        if not self.available():
+            raise OSError('inotify is not available.')
+        self.fd = None
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.fd = fd
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), self.WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            self.close()
+            raise OSError(errno, f'inotify_add_watch failed for \'{path}\'')
+
+    def read_events(self) -> Iterator[tuple]:
+        """Yield the pending (mask, name) events without blocking."""
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                _, mask, _, name_len = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += self._EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b'\0').decode()
+                offset += name_len
+                yield mask, name
+
+    def wait(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        return bool(readable)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __del__(self):
+        self.close()
+
+
+class CheckInIndex(object):
+    """
+    In-memory index of the check-in files of the directory:
+    run hash -> flag name -> check-in file names.
+
+    On Linux the index is updated with the inotify events of the directory. As inotify does not
+    report the changes made by the other hosts of a shared (e.g. NFS) filesystem, the directory is
+    still re-listed every `RESCAN_INTERVAL` seconds. Elsewhere the directory is re-listed once the
+    index is older than `POLL_INTERVAL` seconds.
+
+    The indices are shared within the process, use `CheckInIndex.get(path)` to get one.
+    """
+    POLL_INTERVAL = 1.0
+    RESCAN_INTERVAL = 30.0
+
+    _pool: Dict[Path, 'CheckInIndex'] = {}
+    _pool_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, path: Union[Path, str]) -> 'CheckInIndex':
+        path = Path(path).absolute()
+        with cls._pool_lock:
+            index = cls._pool.get(path)
+            if index is None:
+                index = cls._pool[path] = cls(path)
+            return index
+
+    def __init__(self, path: Union[Path, str], use_inotify: bool = True):
+        self.path = Path(path)
+        self.use_inotify = use_inotify and Inotify.available()
+        self._check_ins: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._inotify: Optional[Inotify] = None
+        self._last_scan = None
+        self._lock = threading.RLock()
+
+    @property
+    def event_driven(self) -> bool:
+        return self._inotify is not None
+
+    def latest(self, run_hash: str, flag_name: str) -> Optional[str]:
+        """The latest check-in file name of the Run with the given flag, if any."""
+        with self._lock:
+            self._sync()
+            names = self._check_ins.get(run_hash, {}).get(flag_name)
+            return max(names) if names else None
+
+    def latest_by_run(self, flag_name: str) -> Dict[str, str]:
+        """The latest check-in file names with the given flag of all the Runs."""
+        with self._lock:
+            self._sync()
+            return {
+                run_hash: max(flags[flag_name])
+                for run_hash, flags in self._check_ins.items() if flags.get(flag_name)
+            }
+
+    def run_check_ins(self, run_hash: str) -> List[str]:
+        """All the check-in file names of the Run."""
+        with self._lock:
+            self._sync()
+            return [name for names in self._check_ins.get(run_hash, {}).values() for name in names]
+
+    def add(self, name: str):
+        """Record the check-in written by this process without waiting for the directory events."""
+        with self._lock:
+            self._add(name)
+
+    def discard(self, name: str):
+        """Record the check-in removed by this process without waiting for the directory events."""
+        with self._lock:
+            self._discard(name)
+
+    def wait(self, timeout: float):
+        """Wait for `timeout` seconds, returning early once the directory has changed."""
+        inotify = self._inotify
+        if inotify is None:
+            time.sleep(timeout)
+            return
+        try:
+            inotify.wait(timeout)
+        except (OSError, ValueError):
+            # the watch has been closed in the meantime
+            time.sleep(timeout)
+
+    def refresh(self):
+        """Re-list the directory."""
+        with self._lock:
+            self._rescan()
+
+    def _sync(self):
+        now = time.monotonic()
+        if self._inotify is not None:
+            for mask, name in self._inotify.read_events():
+                if mask & Inotify.INVALIDATED:
+                    self._close_watch()
+                    break
+                if mask & Inotify.ADDED:
+                    self._add(name)
+                elif mask & Inotify.REMOVED:
+                    self._discard(name)
+            if self._inotify is not None and now - self._last_scan < self.RESCAN_INTERVAL:
+                return
+        elif self._last_scan is not None and now - self._last_scan < self.POLL_INTERVAL:
+            return
+        self._rescan()
+
+    def _rescan(self):
+        if self.use_inotify and self._inotify is None and self.path.is_dir():
+            # start watching before listing the directory, so that no change is missed
+            try:
+                self._inotify = Inotify(self.path)
+            except OSError as e:
+                logger.debug(f'Cannot watch check-ins directory \'{self.path}\': {e}. Falling back to polling.')
+                self.use_inotify = False
+        self._last_scan = time.monotonic()
+        self._check_ins.clear()
+        try:
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    self._add(entry.name)
+        except FileNotFoundError:
+            pass
+
+    def _close_watch(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _add(self, name: str):
+        parts = name.rsplit('-', maxsplit=4)
+        if len(parts) != 5:
+            return
+        run_hash, _, flag_name, _, _ = parts
+        self._check_ins[run_hash][flag_name].add(name)
+
+    def _discard(self, name: str):
+        parts = name.rsplit('-', maxsplit=4)
+        if len(parts) != 5:
+            return
+        run_hash, _, flag_name, _, _ = parts
+        flags = self._check_ins.get(run_hash)
+        if flags is None or flag_name not in flags:
+            return
+        flags[flag_name].discard(name)
+        if not flags[flag_name]:
+            del flags[flag_name]
+            if not flags:
+                del self._check_ins[run_hash]
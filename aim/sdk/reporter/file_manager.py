@@ -1,7 +1,10 @@
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Union, Optional
+from typing import List, Union, Optional
 from abc import abstractmethod
 
+from aim.sdk.reporter.check_in_index import CheckInIndex
+
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,26 +26,30 @@ class LocalFileManager(FileManager):
             base_dir = Path(base_dir)
 
         self.base_dir = base_dir / watch_dir_name
+        self.check_ins = CheckInIndex.get(self.base_dir)
 
     def __repr__(self):
         return repr(self.base_dir)
 
     def poll(self, pattern: str) -> Optional[str]:
-        paths = list(self.base_dir.glob(pattern))
-        if not paths:
+        names = self._matching_names(pattern)
+        if not names:
             return None
-        return max(paths).name
+        return max(names)
 
     def touch(self, filename: str, cleanup_file_pattern: Optional[str] = None):
         self.base_dir.mkdir(parents=True, exist_ok=True)
         new_path = self.base_dir / filename
         logger.debug(f"touching check-in: {new_path}")
         new_path.touch(exist_ok=True)
+        self.check_ins.add(filename)
         if cleanup_file_pattern is not None:
             self._cleanup(cleanup_file_pattern)
 
     def _cleanup(self, pattern: str) -> Path:
-        *paths_to_remove, max_path = sorted(self.base_dir.glob(pattern))
+        *names_to_remove, max_name = sorted(self._matching_names(pattern))
+        paths_to_remove = [self.base_dir / name for name in names_to_remove]
+        max_path = self.base_dir / max_name
         logger.debug(f"found {len(paths_to_remove)} check-ins:")
         logger.debug(f"the acting one: {max_path}")
 
@@ -53,6 +60,12 @@ class LocalFileManager(FileManager):
                 path.unlink()
             except OSError:
                 pass
+            self.check_ins.discard(path.name)
             logger.debug(f"check-in {path} removed")
 
         return max_path
+
+    def _matching_names(self, pattern: str) -> List[str]:
+        # the check-in patterns start with the Run hash
+        run_hash = pattern.split('-', 1)[0]
+        return [name for name in self.check_ins.run_check_ins(run_hash) if fnmatchcase(name, pattern)]
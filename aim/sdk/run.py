@@ -135,6 +135,7 @@ class StructuredRunMixin:
     @name.setter
     def name(self, value):
         self.props.name = value
+        self._props_updated()
 
     @property
     def description(self):
@@ -149,6 +150,7 @@ class StructuredRunMixin:
     @description.setter
     def description(self, value):
         self.props.description = value
+        self._props_updated()
 
     @property
     def archived(self):
@@ -163,6 +165,7 @@ class StructuredRunMixin:
     @archived.setter
     def archived(self, value):
         self.props.archived = value
+        self._props_updated()
 
     @property
     def creation_time(self):
@@ -236,6 +239,7 @@ class StructuredRunMixin:
     @experiment.setter
     def experiment(self, value):
         self.props.experiment = value
+        self._props_updated()
 
     @property
     def tags(self):
@@ -251,7 +255,9 @@ class StructuredRunMixin:
         Args:
             value (:obj:`str`): Tag to add.
         """
-        return self.props.add_tag(value)
+        tag = self.props.add_tag(value)
+        self._props_updated()
+        return tag
 
     def remove_tag(self, tag_name):
         """Remove run tag.
@@ -259,7 +265,15 @@ class StructuredRunMixin:
         Args:
             tag_name (:obj:`str`): :obj:`name` of tag to be removed.
         """
-        return self.props.remove_tag(tag_name)
+        tag_removed = self.props.remove_tag(tag_name)
+        self._props_updated()
+        return tag_removed
+
+    def _props_updated(self):
+        # the cached structured props of the Run are outdated, see `Repo._invalidate_run_props`
+        if not self.repo.is_remote_repo:
+            self._props = None
+            self.repo._invalidate_run_props(self.hash)
 
 
 class BasicRun(BaseRun, StructuredRunMixin):
@@ -289,7 +303,7 @@ class BasicRun(BaseRun, StructuredRunMixin):
                     raise RuntimeError
                 else:
                     logger.warning(f'Detected sub-optimal format metrics for Run {self.hash}. Upgrading...')
-                    backup_path = backup_run(self)
+                    backup_path = backup_run(self.repo, self.hash)
                     try:
                         self.update_metrics()
                         logger.warning(f'Successfully converted Run {self.hash}')
@@ -351,6 +365,7 @@ class BasicRun(BaseRun, StructuredRunMixin):
         """
         self.meta_run_attrs_tree[key] = val
         self.meta_attrs_tree[key] = val
+        self._add_to_catalog(key, val)
 
     def __getitem__(self, key):
         """Get run meta-parameter by key.
@@ -370,6 +385,20 @@ class BasicRun(BaseRun, StructuredRunMixin):
     def set(self, key, val: Any, strict: bool = True):
         self.meta_run_attrs_tree.set(key, val, strict)
         self.meta_attrs_tree.set(key, val, strict)
+        self._add_to_catalog(key, val, strict)
+
+    def _add_to_catalog(self, key, val: Any, strict: bool = True):
+        # the repo-level params are listed from the catalog, see `aim.sdk.catalog`
+        catalog = self.repo.catalog
+        if catalog is None:
+            return
+        if key is Ellipsis:
+            path = ('attrs',)
+        elif isinstance(key, tuple):
+            path = ('attrs',) + key
+        else:
+            path = ('attrs', key)
+        catalog.append(path, val, strict=strict)
 
     def get(self, key, default: Any = None, strict: bool = True, resolve_objects=False):
         try:
@@ -413,6 +442,31 @@ class BasicRun(BaseRun, StructuredRunMixin):
 
         self._tracker(value, name, step, epoch, context=context)
 
+    def track_many(
+        self,
+        name: str,
+        values,
+        steps=None,
+        epochs=None,
+        timestamps=None,
+        *,
+        context: AimObject = None,
+    ):
+        """Track an array of numeric values at once.
+
+        Args:
+             name (:obj:`str`): Tracked sequence name.
+             values: One-dimensional array of the tracked numbers.
+             steps (optional): Array of the sequence tracking iterations. Continue the sequence if not specified.
+             epochs (optional): Array of the training epochs.
+             timestamps (optional): Array of the tracking timestamps (in seconds). Current time if not specified.
+             context (:obj:`dict`, optional): Sequence tracking context.
+
+        Equivalent to calling :obj:`Run.track` for each of the values, while the values are validated
+        once for the whole array, written in a single batch and the sequence info is updated once.
+        """
+        self._tracker.track_many(name, values, steps, epochs, timestamps, context=context)
+
     # logging API
     def _log_message(self, level: int, msg: str, **params):
         frame_info = getframeinfo(currentframe().f_back)
@@ -482,7 +536,7 @@ class BasicRun(BaseRun, StructuredRunMixin):
         Examples:
             >>> run = Run('3df703c')
             >>> for metric in run.metrics():
-            >>>     metric.values.sparse_numpy()
+            >>>     steps, values = metric.values.sparse_numpy()
         """
         from aim.sdk.sequences.metric import Metric
         self.repo._prepare_runs_cache()
@@ -12,6 +12,7 @@ from collections import OrderedDict
 
 from aim.sdk.repo import Repo
 from aim.sdk.run import Run
+from aim.sdk.reporter.check_in_index import CheckInIndex
 from aim.storage.locking import AutoFileLock
 from aim.ext.notifier import get_config, get_notifier, Notifier, NotificationSendError
 from aim.ext.notifier.utils import get_working_directory
@@ -255,6 +256,7 @@ class RunStatusWatcher:
 
         self._status_watch_dir: Path = self.repo_path / 'check_ins'
         self._status_watch_dir.mkdir(exist_ok=True)
+        self._check_ins = CheckInIndex.get(self._status_watch_dir)
 
         self._notifications_cache_path: Path = work_dir / 'last_run_notifications'
         self._notifications_cache_path.touch(exist_ok=True)
@@ -300,7 +302,8 @@ class RunStatusWatcher:
     def run_forever(self):
         while True:
             self.check_for_new_events()
-            time.sleep(1)
+            # wakes up early on the check-in directory changes
+            self._check_ins.wait(1)
 
     def check_for_new_events(self):
         status_events = self.poll_status_events()
@@ -351,8 +354,8 @@ class RunStatusWatcher:
     def _poll(self, event_types) -> EventSet:
         events = EventSet()
         for event_type in event_types:
-            for check_in_file_path in sorted(self._status_watch_dir.glob(f'*-*-{event_type}-*-*')):
-                events.add(Event(check_in_file_path.name))
+            for check_in_name in sorted(self._check_ins.latest_by_run(event_type).values()):
+                events.add(Event(check_in_name))
         return events
 
     def _processed_log_records(self, log_records_data) -> Dict:
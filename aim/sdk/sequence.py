@@ -1,11 +1,11 @@
 from typing import Generic, Union, Tuple, TypeVar, Dict, Iterator, Any, List
-from itertools import islice
 import numpy as np
 import logging
 
-from aim.sdk.tracker import STEP_HASH_FUNCTIONS
+from aim.sdk.tracker import STEP_HASH_FUNCTIONS, STEP_KEY_OFFSET, lod_bucket_idx, lod_buckets, step_key
 from aim.storage.treeview import TreeView
 from aim.storage.arrayview import ArrayView
+from aim.storage.treearrayview import TreeArrayView
 from aim.storage.context import Context
 from aim.storage.hashing import hash_auto
 
@@ -22,6 +22,21 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+def align_to_steps(seq_steps: np.ndarray, values: np.ndarray, steps: np.ndarray) -> np.ndarray:
+    """Align the `values` of the sequence recorded at `seq_steps` to `steps`; NaN for the missing steps."""
+    steps = np.asarray(steps, dtype=np.int64)
+    aligned = np.full(len(steps), np.nan)
+    if not len(seq_steps):
+        return aligned
+    if np.any(seq_steps[1:] < seq_steps[:-1]):
+        order = np.argsort(seq_steps, kind='stable')
+        seq_steps, values = seq_steps[order], values[order]
+    positions = np.minimum(np.searchsorted(seq_steps, steps), len(seq_steps) - 1)
+    found = seq_steps[positions] == steps
+    aligned[found] = values[positions[found]]
+    return aligned
+
+
 class SequenceData:
     def __init__(self, series_tree, version: int, columns: List[Tuple[str, str]]):
         if len(columns) == 0:
@@ -38,6 +53,10 @@ class SequenceData:
     def step_hash(self, step):
         return self._step_hash_fn(step)
 
+    def step_at(self, key) -> int:
+        """Get the step of the record stored at the array `key`."""
+        return key
+
     def _checked_columns(self, columns: Union[str, List[str]]) -> List[Tuple[str, str]]:
         if isinstance(columns, str):
             columns = [columns]
@@ -87,6 +106,16 @@ class SequenceData:
             numpy_list.append(np.array(vals, dtype=self.arrays[col_idx].dtype))
         return np.array(steps, np.intp), numpy_list
 
+    def values_at(self, steps: np.ndarray, column: str = 'val') -> np.ndarray:
+        """Values of the numeric `column` at the given `steps`.
+
+        Returns:
+            float64 array aligned with `steps`, with NaN for the steps missing from the sequence.
+        """
+        # default implementation
+        seq_steps, (values,) = self.view(column).numpy()
+        return align_to_steps(seq_steps, values, steps)
+
 
 class SequenceV1Data(SequenceData):
     def __init__(
@@ -111,40 +140,43 @@ class SequenceV1Data(SequenceData):
         return SequenceV1Data(self.series_tree, columns=self.columns, step_range=self.step_range, n_items=k)
 
     def items_list(self) -> Tuple[List[int], List[Any]]:
+        if self.step_range is None and self.n_items <= 0:
+            return self._read_all()
+
+        # Both range selection and sampling are done by seeking to the selected steps,
+        # so that only the selected records are read and decoded.
+        steps = self._selected_steps().tolist()
+        columns = [[arr[step] for step in steps] for arr in self.arrays]
+        return steps, columns
+
+    def indices_list(self) -> List[int]:
+        return self._selected_steps().tolist()
+
+    def _selected_steps(self) -> np.ndarray:
+        start, stop = self.step_range if self.step_range is not None else (None, None)
+        if start is not None and (stop <= start or start < 0 or stop < 0):
+            return np.array([], dtype=np.intp)
+        # Only the keys are read; the records are sampled by their position,
+        # as the steps of the sequence are not necessarily contiguous.
+        steps = self.arrays[0].tree.keys_numpy(start=start, stop=stop)
+        stride = len(steps) // self.n_items if self.n_items > 0 else 1
+        if stride > 1:
+            # Strided records with the last one always included
+            sampled = steps[::stride]
+            if (len(steps) - 1) % stride != 0:
+                sampled = np.append(sampled, steps[-1])
+            return sampled
+        return steps
+
+    def _read_all(self) -> Tuple[List[int], List[Any]]:
         iters = self._get_iters()
         columns = [[] for _ in iters]
         steps = []
-
-        if self.step_range is not None:
-            start, stop = self.step_range
-            if stop <= start or start < 0 or stop < 0:
-                return
-            for idx, val in iters[0]:
-                if idx < start:
-                    for it in iters[1:]:
-                        next(it)
-                    continue
-                if idx >= stop:
-                    break
-                steps.append(idx)
-                columns[0].append(val)
-                for it_index, it in enumerate(iters[1:]):
-                    columns[it_index + 1].append(next(it))
-        else:
-            for idx, val in iters[0]:
-                steps.append(idx)
-                columns[0].append(val)
-                for it_index, it in enumerate(iters[1:]):
-                    columns[it_index + 1].append(next(it))
-        length = len(steps)
-        step = (length // self.n_items or 1) if self.n_items > 0 else 1
-        if step != 1:
-            slice_ = slice(0, length, step)
-            last_step_needed = (length - 1) % step != 0
-            steps = steps[slice_] + [steps[-1]] if last_step_needed else steps[slice_]
-            for i, v in enumerate(columns):
-                columns[i] = v[slice_] + [v[-1]] if last_step_needed else v[slice_]
-
+        for idx, val in iters[0]:
+            steps.append(idx)
+            columns[0].append(val)
+            for it_index, it in enumerate(iters[1:]):
+                columns[it_index + 1].append(next(it))
         return steps, columns
 
     def _get_iters(self) -> List[Iterator[Any]]:
@@ -174,6 +206,9 @@ class SequenceV2Data(SequenceData):
         return SequenceV2Data(
             self.meta_tree, self.series_tree, columns=self._checked_columns(columns), n_items=self.n_items)
 
+    def step_at(self, key) -> int:
+        return self.steps[key]
+
     def range(self, start, stop) -> 'SequenceData':
         raise ValueError('Range selection cannot be applied to data stored with reservoir sampling.')
 
@@ -187,12 +222,13 @@ class SequenceV2Data(SequenceData):
     def numpy(self) -> Tuple[np.ndarray, List[np.ndarray]]:
         if self.n_items == -1:  # select all
             last_step = None
-            steps = np.fromiter(self.steps.values(), np.intp)
-            columns = [np.fromiter(arr.values(), arr.dtype) for arr in self.arrays]
+            n_items = None
         else:
             last_step = self.meta_tree.get('last_step', None)
-            steps = np.fromiter(islice(self.steps.values(), self.n_items), np.intp)
-            columns = [np.fromiter(islice(arr.values(), self.n_items), arr.dtype) for arr in self.arrays]
+            n_items = self.n_items
+        _, steps = self.steps.tree.items_numpy(dtype=np.intp, n_items=n_items)
+        # `np.dtype(None)` is float64, which is the default for value columns
+        columns = [arr.tree.items_numpy(dtype=np.dtype(arr.dtype), n_items=n_items)[1] for arr in self.arrays]
 
         # sort all columns by step
         sort_indices = steps.argsort()
@@ -218,6 +254,204 @@ class SequenceV2Data(SequenceData):
         return steps, columns
 
 
+class StepArrayView(TreeArrayView):
+    """Array of a version 3 sequence column, indexed by the steps instead of the keys they are stored at."""
+
+    def keys(self) -> Iterator[int]:
+        yield from self.indices_numpy().tolist()
+
+    def items(self) -> Iterator[Tuple[int, Any]]:
+        for key, val in self.tree.items():
+            yield key - STEP_KEY_OFFSET, val
+
+    def __getitem__(self, idx: Union[int, slice]) -> Any:
+        if isinstance(idx, slice):
+            raise NotImplementedError
+        return self.tree[step_key(idx)]
+
+    def __setitem__(self, idx: int, val: Any):
+        assert isinstance(idx, int)
+        self.tree[step_key(idx)] = val
+
+    def __len__(self) -> int:
+        # the steps may be negative
+        return max(super().__len__(), 0)
+
+    def sparse_numpy(self) -> Tuple[np.ndarray, np.ndarray]:
+        keys, values = self.tree.items_numpy(dtype=self.dtype)
+        return keys - STEP_KEY_OFFSET, values
+
+    def indices_numpy(self) -> np.ndarray:
+        return self.tree.keys_numpy() - STEP_KEY_OFFSET
+
+    def tolist(self) -> List[Any]:
+        return self.values_list()
+
+    def first_idx(self) -> int:
+        return self.tree.first_key() - STEP_KEY_OFFSET
+
+    def last_idx(self) -> int:
+        return self.tree.last_key() - STEP_KEY_OFFSET
+
+
+class SequenceV3Data(SequenceData):
+    def __init__(
+            self,
+            meta_tree, series_tree, *,
+            columns: List[Tuple[str, str]],
+            step_range: Tuple[int, int] = None,
+            n_items: int = -1
+    ):
+        super().__init__(series_tree, version=3, columns=columns)
+        # Samples are keyed by the step shifted to the non-negative keys (see `step_key`).
+        # Integer keys are encoded as big-endian, hence records are stored in ascending
+        # step order: reading needs no sort, range selection is a seek and sampling
+        # is a stride of seeks.
+        self.meta_tree = meta_tree
+        self.step_range = step_range
+        self.n_items = n_items
+
+    def view(self, columns: List[str]) -> 'SequenceData':
+        return SequenceV3Data(
+            self.meta_tree, self.series_tree,
+            columns=self._checked_columns(columns), step_range=self.step_range, n_items=self.n_items)
+
+    def range(self, start, stop) -> 'SequenceData':
+        return SequenceV3Data(
+            self.meta_tree, self.series_tree,
+            columns=self.columns, step_range=(start, stop), n_items=self.n_items)
+
+    def sample(self, k) -> 'SequenceData':
+        return SequenceV3Data(
+            self.meta_tree, self.series_tree,
+            columns=self.columns, step_range=self.step_range, n_items=k)
+
+    def items_list(self) -> Tuple[List[int], List[Any]]:
+        steps, values = self.numpy()
+        return steps.tolist(), [v.tolist() for v in values]
+
+    def _get_array(self, column: str, dtype: str = None) -> ArrayView:
+        return StepArrayView(self.series_tree.subtree(column), dtype=dtype)
+
+    @staticmethod
+    def _key(step):
+        # steps out of the range of keys are clamped to it, as there are no such records
+        if step is None:
+            return None
+        return min(max(step, -STEP_KEY_OFFSET), STEP_KEY_OFFSET) + STEP_KEY_OFFSET
+
+    def numpy(self) -> Tuple[np.ndarray, List[np.ndarray]]:
+        start, stop = self.step_range if self.step_range is not None else (None, None)
+        if start is not None and stop <= start:
+            return np.array([], dtype=np.intp), [np.array([], dtype=arr.dtype) for arr in self.arrays]
+
+        targets = self._sample_targets(start, stop) if self.n_items > 0 else None
+        columns = []
+        keys = None
+        for arr in self.arrays:
+            # `np.dtype(None)` is float64, which is the default for value columns
+            dtype = np.dtype(arr.dtype)
+            if targets is None:
+                arr_keys, values = arr.tree.items_numpy(dtype=dtype, start=self._key(start), stop=self._key(stop))
+            else:
+                arr_keys, values = arr.tree.items_numpy_at(targets=targets + STEP_KEY_OFFSET, dtype=dtype,
+                                                           stop=self._key(stop))
+            if keys is None:
+                keys = arr_keys
+            columns.append(values)
+        return keys - STEP_KEY_OFFSET, columns
+
+    def values_at(self, steps: np.ndarray, column: str = 'val') -> np.ndarray:
+        steps = np.asarray(steps, dtype=np.int64)
+        start, stop = self.step_range if self.step_range is not None else (None, None)
+        targets = np.unique(steps)
+        if start is not None:
+            targets = targets[(targets >= start) & (targets < stop)]
+        # one seek per requested step; the sampling of the sequence does not apply
+        tree = self._get_array(column).tree
+        keys, values = tree.items_numpy_at(targets=targets + STEP_KEY_OFFSET, dtype=np.float64)
+        return align_to_steps(keys - STEP_KEY_OFFSET, values, steps)
+
+    def _sample_targets(self, start: int, stop: int) -> np.ndarray:
+        # The series tree is the source of truth for the step bounds, since
+        # the meta tree is not necessarily in sync with it.
+        val_tree = self.arrays[0].tree
+        try:
+            first_step = val_tree.first_key() - STEP_KEY_OFFSET
+            last_step = val_tree.last_key() - STEP_KEY_OFFSET
+        except KeyError:
+            return None
+        if start is not None:
+            first_step = max(first_step, start)
+            last_step = min(last_step, stop - 1)
+        if last_step - first_step + 1 <= self.n_items:
+            # Reading the whole range is cheaper than seeking for each step
+            return None
+        # `k` evenly spaced steps including both the first and the last ones
+        targets = np.linspace(first_step, last_step, self.n_items).round().astype(np.int64)
+        lod_targets = self._lod_targets(first_step, last_step)
+        if lod_targets is None:
+            return targets
+        # Minimum/maximum steps of neighbouring groups may coincide, so the remaining
+        # slots are filled with the evenly spaced steps to keep the sample size.
+        n_fill = self.n_items - len(lod_targets)
+        fill_keys = val_tree.keys_numpy_at(targets=targets + STEP_KEY_OFFSET, stop=self._key(last_step + 1))
+        fill = np.setdiff1d(fill_keys - STEP_KEY_OFFSET, lod_targets)
+        if n_fill > 0 and len(fill):
+            positions = np.linspace(0, len(fill) - 1, min(n_fill, len(fill))).round().astype(np.intp)
+            lod_targets = np.union1d(lod_targets, fill[positions])
+        return lod_targets
+
+    def _lod_targets(self, first_step: int, last_step: int) -> np.ndarray:
+        # Pick the coarsest level-of-detail summaries that still have enough buckets in the range,
+        # merge them into `n_buckets` groups and select the steps of minimum and maximum value
+        # of each group, so that the spikes are preserved.
+        levels = self.meta_tree.get('lod_levels', None)
+        if not levels:
+            return None
+        n_buckets = (self.n_items - 2) // 2
+        length = last_step - first_step + 1
+        levels = [level for level in levels if (length >> level) >= n_buckets > 0]
+        if not levels:
+            return None
+        level = max(levels)
+        lod_tree = self.series_tree.subtree(('lod', level))
+        first_bucket, last_bucket = lod_bucket_idx(first_step, level), lod_bucket_idx(last_step, level)
+
+        buckets, mins = lod_tree.items_numpy('min', dtype=np.float64, start=first_bucket, stop=last_bucket + 1)
+        _, maxs = lod_tree.items_numpy('max', dtype=np.float64, start=first_bucket, stop=last_bucket + 1)
+        _, min_steps = lod_tree.items_numpy('min_step', dtype=np.int64, start=first_bucket, stop=last_bucket + 1)
+        _, max_steps = lod_tree.items_numpy('max_step', dtype=np.int64, start=first_bucket, stop=last_bucket + 1)
+
+        # The buckets are written by the tracker once they are complete,
+        # so the remaining ones are summarized from the values themselves.
+        tail_step = first_step
+        if len(buckets):
+            tail_step = max(first_step, ((buckets[-1].item() + 1) << level) - STEP_KEY_OFFSET)
+        if tail_step <= last_step:
+            val_tree = self._get_array('val').tree
+            keys, values = val_tree.items_numpy(dtype=np.float64, start=self._key(tail_step),
+                                                stop=self._key(last_step + 1))
+            tail = lod_buckets(keys - STEP_KEY_OFFSET, values, level)
+            buckets = np.append(buckets, [bucket.idx for bucket in tail])
+            mins = np.append(mins, [bucket.min for bucket in tail])
+            maxs = np.append(maxs, [bucket.max for bucket in tail])
+            min_steps = np.append(min_steps, [bucket.min_step for bucket in tail])
+            max_steps = np.append(max_steps, [bucket.max_step for bucket in tail])
+
+        # Edge buckets may be only partially in the range
+        min_steps[(min_steps < first_step) | (min_steps > last_step)] = first_step
+        max_steps[(max_steps < first_step) | (max_steps > last_step)] = last_step
+
+        groups = (buckets - first_bucket) * n_buckets // (last_bucket - first_bucket + 1)
+        bounds = np.flatnonzero(np.diff(groups)) + 1
+        targets = [np.array([first_step, last_step])]
+        for group in np.split(np.arange(len(buckets)), bounds):
+            if len(group):
+                targets.append([min_steps[group[mins[group].argmin()]], max_steps[group[maxs[group].argmax()]]])
+        return np.unique(np.concatenate(targets))
+
+
 class Sequence(Generic[T]):
     """Class representing single series of tracked value.
 
@@ -293,8 +527,10 @@ class Sequence(Generic[T]):
         if self._data is None:
             if self.version == 1:
                 self._data = SequenceV1Data(self.series_tree, columns=self._columns)
-            else:
+            elif self.version == 2:
                 self._data = SequenceV2Data(self._meta_tree, self.series_tree, columns=self._columns)
+            else:
+                self._data = SequenceV3Data(self._meta_tree, self.series_tree, columns=self._columns)
         return self._data
 
     @property
@@ -305,7 +541,7 @@ class Sequence(Generic[T]):
 
     @property
     def values(self) -> ArrayView:
-        """Tracked values array as :obj:`ArrayView`.
+        """Tracked values array as :obj:`ArrayView`, indexed by the steps for the metrics.
 
             :getter: Returns values ArrayView.
         """
@@ -313,7 +549,7 @@ class Sequence(Generic[T]):
 
     @property
     def epochs(self) -> ArrayView:
-        """Tracked epochs array as :obj:`ArrayView`.
+        """Tracked epochs array as :obj:`ArrayView`, indexed by the steps for the metrics.
 
             :getter: Returns epochs ArrayView.
         """
@@ -321,7 +557,7 @@ class Sequence(Generic[T]):
 
     @property
     def timestamps(self) -> ArrayView:
-        """Tracked timestamps array as :obj:`ArrayView`.
+        """Tracked timestamps array as :obj:`ArrayView`, indexed by the steps for the metrics.
 
             :getter: Returns timestamps ArrayView.
         """
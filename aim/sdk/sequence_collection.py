@@ -1,23 +1,54 @@
 import logging
+import uuid
 from abc import abstractmethod
-from typing import Iterator
+from typing import Iterator, List, Optional, Set, Tuple
 from typing import TYPE_CHECKING
 from tqdm import tqdm
 
 from aim.sdk.sequence import Sequence
 from aim.sdk.types import QueryReportMode
 from aim.sdk.query_utils import RunView, SequenceView
+from aim.sdk import query_pool
+from aim.sdk.params_index import params_run_hashes
+from aim.storage.context import Context
 from aim.storage.query import RestrictedPythonQuery
+from aim.storage.structured.sql_engine.query import structured_run_filter
 
 
 if TYPE_CHECKING:
     from aim.sdk.run import Run
     from aim.sdk.repo import Repo
     from pandas import DataFrame
+    from pyarrow import RecordBatchReader
 
 logger = logging.getLogger(__name__)
 
 
+def structured_run_hashes(repo: 'Repo', query: RestrictedPythonQuery) -> Optional[Set[str]]:
+    """Hashes of the Runs passing the part of the query which refers to structured Run data.
+
+    The filter is evaluated in the structured DB, so that the Runs failing it can be skipped
+    without evaluating the query against Run metadata. Returns `None` if there is no such filter.
+    """
+    run_filter = structured_run_filter(query.expr)
+    if run_filter is None:
+        return None
+    return repo.structured_db.filter_run_hashes(run_filter)
+
+
+def candidate_run_hashes(repo: 'Repo', query: RestrictedPythonQuery) -> Optional[Set[str]]:
+    """Hashes of the Runs which may match the query, based on the structured DB and the params index.
+
+    Returns `None` if any Run may match the query.
+    """
+    candidates = params_run_hashes(repo, query)
+    if repo.structured_db:
+        run_hashes = structured_run_hashes(repo, query)
+        if run_hashes is not None:
+            candidates = run_hashes if candidates is None else candidates & run_hashes
+    return candidates
+
+
 class SequenceCollection:
     """Abstract interface for collection of tracked series/sequences.
 
@@ -55,6 +86,40 @@ class SequenceCollection:
         import pandas as pd
         return pd.concat(dfs)
 
+    def to_arrow(
+        self,
+        only_last: bool = False,
+        include_run=True,
+        include_name=True,
+        include_context=True,
+        include_props=True,
+        include_params=True,
+    ) -> 'RecordBatchReader':
+        """Get the collection data as a stream of Apache Arrow record batches.
+
+        Unlike :obj:`dataframe`, the data is read lazily, one record batch per run, so the whole
+        collection is never held in memory. Metric collections yield a row per tracked value, with
+        dictionary-encoded `run.hash`, `run.params`, `metric.name` and `metric.context` columns.
+        Run collections yield a row per run. Run params and metric contexts are JSON-encoded.
+        Requires `pyarrow` to be installed.
+        """
+        from aim.sdk.export import record_batch_reader
+        return record_batch_reader(self, only_last=only_last, include_run=include_run, include_name=include_name,
+                                   include_context=include_context, include_props=include_props,
+                                   include_params=include_params)
+
+    def to_parquet(self, path: str, **kwargs) -> int:
+        """Write the collection data to the Parquet file at `path`, one row group per record batch.
+
+        The keyword arguments of :obj:`to_arrow` are supported. Returns the number of written rows.
+        """
+        from aim.sdk.export import write_parquet
+        return write_parquet(self.to_arrow(**kwargs), path)
+
+    def _run_collections(self) -> Iterator['SequenceCollection']:
+        # the collection of a single run by default
+        yield self
+
     def __iter__(self) -> Iterator[Sequence]:
         return self.iter()
 
@@ -139,6 +204,8 @@ class QuerySequenceCollection(SequenceCollection):
          query (:obj:`str`, optional): Query expression. If specified, method `iter()` will skip sequences not matching
             the query. If not, method `iter()` will return iterator for all sequences in repository
             (that's a lot of sequences!).
+         workers (:obj:`int`, optional): Number of worker processes evaluating the query. If greater than 1,
+            runs are evaluated in parallel, in shards. 1 by default.
     """
 
     def __init__(
@@ -148,6 +215,7 @@ class QuerySequenceCollection(SequenceCollection):
         query: str = '',
         report_mode: QueryReportMode = QueryReportMode.PROGRESS_BAR,
         timezone_offset: int = 0,
+        workers: int = 1,
     ):
         self.repo: 'Repo' = repo
         self.seq_cls = seq_cls
@@ -156,6 +224,7 @@ class QuerySequenceCollection(SequenceCollection):
         self.report_mode = report_mode
         self.runs_proxy_cache = dict()
         self._timezone_offset = timezone_offset
+        self.workers = workers
 
     def iter_runs(self) -> Iterator['SequenceCollection']:
         """"""
@@ -163,23 +232,43 @@ class QuerySequenceCollection(SequenceCollection):
             runs_iterator = self.repo.iter_runs_from_cache()
         else:
             runs_iterator = self.repo.iter_runs()
-        runs_counter = 1
+        run_hashes = candidate_run_hashes(self.repo, RestrictedPythonQuery(self.query))
         total_runs = self.repo.total_runs_count()
 
         if self.report_mode == QueryReportMode.PROGRESS_BAR:
             progress_bar = tqdm(total=total_runs)
 
-        for run in runs_iterator:
-            seq_collection = SingleRunSequenceCollection(run, self.seq_cls, self.query,
-                                                         runs_proxy_cache=self.runs_proxy_cache,
-                                                         timezone_offset=self._timezone_offset)
+        # none of the sequences of the runs failing the structured or params filter can match the query
+        runs_iterator = ((runs_counter, run) for runs_counter, run in enumerate(runs_iterator, start=1)
+                         if run_hashes is None or run.hash in run_hashes)
+        if self.workers > 1 and self.repo.structured_db:
+            seq_collections = self._iter_matched_collections(runs_iterator)
+        else:
+            seq_collections = (
+                (runs_counter, SingleRunSequenceCollection(run, self.seq_cls, self.query,
+                                                           runs_proxy_cache=self.runs_proxy_cache,
+                                                           timezone_offset=self._timezone_offset))
+                for runs_counter, run in runs_iterator
+            )
+
+        reported_runs = 0
+        for runs_counter, seq_collection in seq_collections:
             if self.report_mode == QueryReportMode.PROGRESS_TUPLE:
                 yield seq_collection, (runs_counter, total_runs)
             else:
                 if self.report_mode == QueryReportMode.PROGRESS_BAR:
-                    progress_bar.update(1)
+                    progress_bar.update(runs_counter - reported_runs)
+                    reported_runs = runs_counter
                 yield seq_collection
-            runs_counter += 1
+        if self.report_mode == QueryReportMode.PROGRESS_BAR:
+            progress_bar.update(total_runs - reported_runs)
+
+    def _iter_matched_collections(self, runs_iterator) -> Iterator[Tuple[int, 'SequenceCollection']]:
+        args = (self.repo.root_path, uuid.uuid4().hex, self.query, self.seq_cls, self._timezone_offset)
+        matches = query_pool.imap_shards(self.workers, query_pool.match_sequences, args, runs_iterator,
+                                         run_hash=lambda item: item[1].hash)
+        for (runs_counter, run), sequences in matches:
+            yield runs_counter, MatchedRunSequenceCollection(run, self.seq_cls, sequences)
 
     def iter(self) -> Iterator[Sequence]:
         """"""
@@ -190,6 +279,13 @@ class QuerySequenceCollection(SequenceCollection):
             for run_seq in self.iter_runs():
                 yield from run_seq
 
+    def _run_collections(self) -> Iterator['SequenceCollection']:
+        for run_seq in self.iter_runs():
+            if self.report_mode == QueryReportMode.PROGRESS_TUPLE:
+                run_seq, _ = run_seq
+            if run_seq is not None:
+                yield run_seq
+
 
 class QueryRunSequenceCollection(SequenceCollection):
     """Implementation of SequenceCollection interface for repository's runs matching given query.
@@ -203,6 +299,8 @@ class QueryRunSequenceCollection(SequenceCollection):
             will be skipped. `Sequence` by default, meaning all sequences will match.
          query (:obj:`str`, optional): Query expression. If specified, method `iter_runs()` will skip runs not matching
             the query. If not, method `iter_run()` will return SequenceCollection iterator for all runs in repository.
+         workers (:obj:`int`, optional): Number of worker processes evaluating the query. If greater than 1,
+            runs are evaluated in parallel, in shards. 1 by default.
     """
 
     def __init__(
@@ -214,6 +312,7 @@ class QueryRunSequenceCollection(SequenceCollection):
         offset: str = None,
         report_mode: QueryReportMode = QueryReportMode.PROGRESS_BAR,
         timezone_offset: int = 0,
+        workers: int = 1,
     ):
         self.repo: 'Repo' = repo
         self.seq_cls = seq_cls
@@ -224,6 +323,7 @@ class QueryRunSequenceCollection(SequenceCollection):
         self.query = RestrictedPythonQuery(query)
         self.report_mode = report_mode
         self._timezone_offset = timezone_offset
+        self.workers = workers
 
     def iter(self) -> Iterator[Sequence]:
         """"""
@@ -234,19 +334,29 @@ class QueryRunSequenceCollection(SequenceCollection):
             for run_seq in self.iter_runs():
                 yield from run_seq
 
+    def _run_collections(self) -> Iterator['SequenceCollection']:
+        for run_seq in self.iter_runs():
+            if self.report_mode == QueryReportMode.PROGRESS_TUPLE:
+                run_seq, _ = run_seq
+            if run_seq is not None:
+                yield run_seq
+
     def iter_runs(self) -> Iterator['SequenceCollection']:
         """"""
         if self.repo.structured_db:
             runs_iterator = self.repo.iter_runs_from_cache(offset=self.offset)
         else:
             runs_iterator = self.repo.iter_runs()
+        run_hashes = candidate_run_hashes(self.repo, self.query)
         runs_counter = 1
         total_runs = self.repo.total_runs_count()
         if self.report_mode == QueryReportMode.PROGRESS_BAR:
             progress_bar = tqdm(total=total_runs)
-        for run in runs_iterator:
-            run_view = RunView(run, timezone_offset=self._timezone_offset)
-            match = self.query.check(run=run_view)
+        if self.workers > 1 and self.repo.structured_db:
+            matches = self._iter_matches_in_pool(runs_iterator, run_hashes)
+        else:
+            matches = self._iter_matches(runs_iterator, run_hashes)
+        for run, match in matches:
             seq_collection = SingleRunSequenceCollection(run, self.seq_cls) if match else None
             if self.report_mode == QueryReportMode.PROGRESS_TUPLE:
                 yield seq_collection, (runs_counter, total_runs)
@@ -256,3 +366,53 @@ class QueryRunSequenceCollection(SequenceCollection):
                 if match:
                     yield seq_collection
             runs_counter += 1
+
+    def _iter_matches(self, runs_iterator, run_hashes: Optional[Set[str]]) -> Iterator[Tuple['Run', bool]]:
+        for run in runs_iterator:
+            if run_hashes is not None and run.hash not in run_hashes:
+                yield run, False
+            else:
+                run_view = RunView(run, timezone_offset=self._timezone_offset)
+                yield run, self.query.check(run=run_view)
+
+    def _iter_matches_in_pool(self, runs_iterator, run_hashes: Optional[Set[str]]) -> Iterator[Tuple['Run', bool]]:
+        def candidate_hash(run):
+            # the runs failing the structured or params filter are not sent to the workers
+            return run.hash if run_hashes is None or run.hash in run_hashes else None
+
+        args = (self.repo.root_path, uuid.uuid4().hex, self.query.expr, self._timezone_offset)
+        matches = query_pool.imap_shards(self.workers, query_pool.match_runs, args, runs_iterator,
+                                         run_hash=candidate_hash)
+        for run, match in matches:
+            yield run, bool(match)
+
+
+class MatchedRunSequenceCollection(SequenceCollection):
+    """Implementation of SequenceCollection interface for the run sequences already matched by the query.
+
+    Args:
+         run (:obj:`Run`): Run object for which sequences are queried.
+         seq_cls (:obj:`type`): The collection's sequence class.
+         sequences (:obj:`list`): `(name, context)` pairs of the matched sequences.
+    """
+
+    def __init__(
+        self,
+        run: 'Run',
+        seq_cls=Sequence,
+        sequences: List[Tuple[str, dict]] = (),
+    ):
+        self.run: 'Run' = run
+        self.seq_cls = seq_cls
+        self._item = 'sequence'
+        self.sequences = sequences
+
+    def iter_runs(self) -> Iterator['SequenceCollection']:
+        """"""
+        logger.warning('Run is already bound to the Collection')
+        raise StopIteration
+
+    def iter(self) -> Iterator[Sequence]:
+        """"""
+        for seq_name, ctx in self.sequences:
+            yield self.seq_cls(seq_name, Context(ctx), self.run)
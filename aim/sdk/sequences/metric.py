@@ -48,11 +48,11 @@ class Metric(Sequence):
         self.preload()
 
         if only_last:
-            last_step, last_value = self.values.last()
-            steps = [last_step] if self.version == 1 else [self.data.steps[last_step]]
+            last_key, last_value = self.values.last()
+            steps = [self.data.step_at(last_key)]
             values = [last_value]
-            epochs = [self.epochs[last_step]]
-            timestamps = [self.timestamps[last_step]]
+            epochs = [self.epochs[last_key]]
+            timestamps = [self.timestamps[last_key]]
         else:
             try:
                 steps, (values, epochs, timestamps) = self.data.items_list()
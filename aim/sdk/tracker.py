@@ -2,9 +2,12 @@ import datetime
 import os
 import logging
 from collections import defaultdict
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Dict, Tuple, TYPE_CHECKING
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np
 import pytz
 
 from aim.sdk.configs import AIM_ENABLE_TRACKING_THREAD
@@ -18,13 +21,124 @@ from aim.storage.types import AimObject
 
 if TYPE_CHECKING:
     from aim.sdk import Run
+    from aim.storage.arrayview import ArrayView
+    from aim.storage.treeview import TreeView
 
 logger = logging.getLogger(__name__)
 
+# Numeric sequences are keyed by the step shifted by `STEP_KEY_OFFSET`. The keys are non-negative,
+# hence their big-endian encoding preserves the step order, negative steps included.
+STEP_KEY_OFFSET = 1 << 62
+
+
+def step_key(step: int) -> int:
+    if not -STEP_KEY_OFFSET <= step < STEP_KEY_OFFSET:
+        raise ValueError(f'Step {step} is out of the supported range [-2**62, 2**62).')
+    return step + STEP_KEY_OFFSET
+
+
+def step_keys(steps: np.ndarray) -> np.ndarray:
+    if len(steps) and (steps.min() < -STEP_KEY_OFFSET or steps.max() >= STEP_KEY_OFFSET):
+        raise ValueError('Steps are out of the supported range [-2**62, 2**62).')
+    return steps.astype(np.int64) + STEP_KEY_OFFSET
+
+
 STEP_HASH_FUNCTIONS = {
     1: lambda s: s,
-    2: lambda s: hash_auto(s)
+    2: lambda s: hash_auto(s),
+    3: step_key
 }
+METRIC_SEQUENCE_VERSION = 3
+
+# Level-of-detail summaries of metric sequences are kept for step buckets of
+# size `2 ** level`, so that long sequences can be downsampled without reading
+# all the values and without losing spikes.
+LOD_LEVELS = (4, 8, 12, 16)
+
+
+class LodBucket:
+    __slots__ = ('idx', 'count', 'sum', 'min', 'max', 'min_step', 'max_step')
+
+    def __init__(self, idx: int):
+        self.idx = idx
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.min_step = None
+        self.max_step = None
+
+    def add(self, step: int, val):
+        if val != val:
+            # NaNs are not summarized
+            return
+        if self.count == 0 or val < self.min:
+            self.min, self.min_step = val, step
+        if self.count == 0 or val > self.max:
+            self.max, self.max_step = val, step
+        self.sum += val
+        self.count += 1
+
+    def merge(self, other: 'LodBucket'):
+        # `other` holds the values tracked after the ones of this bucket
+        if other.count == 0:
+            return
+        if self.count == 0 or other.min < self.min:
+            self.min, self.min_step = other.min, other.min_step
+        if self.count == 0 or other.max > self.max:
+            self.max, self.max_step = other.max, other.max_step
+        self.sum += other.sum
+        self.count += other.count
+
+    def write(self, lod_views: Dict[str, 'ArrayView']):
+        if self.count == 0:
+            # the buckets of NaNs only are not written, those are skipped when sampling
+            return
+        lod_views['min'][self.idx] = self.min
+        lod_views['max'][self.idx] = self.max
+        lod_views['mean'][self.idx] = self.sum / self.count
+        lod_views['min_step'][self.idx] = self.min_step
+        lod_views['max_step'][self.idx] = self.max_step
+
+
+def lod_bucket_idx(step: int, level: int) -> int:
+    # the buckets are keyed as the steps, see `step_key`
+    return (step + STEP_KEY_OFFSET) >> level
+
+
+def lod_buckets(steps: np.ndarray, values: np.ndarray, level: int) -> List[LodBucket]:
+    """Aggregate the values of a step-ordered sequence into `2 ** level` step buckets. NaNs are skipped."""
+    if values.dtype.kind == 'f':
+        valid = ~np.isnan(values)
+        steps, values = steps[valid], values[valid]
+    if not len(steps):
+        return []
+    bucket_idxs = (steps.astype(np.int64) + STEP_KEY_OFFSET) >> level
+    bounds = np.flatnonzero(np.diff(bucket_idxs)) + 1
+    buckets = []
+    for start, end in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [len(steps)]))):
+        bucket_values = values[start:end]
+        min_idx = start + bucket_values.argmin()
+        max_idx = start + bucket_values.argmax()
+        bucket = LodBucket(int(bucket_idxs[start]))
+        bucket.count = end - start
+        bucket.sum = float(bucket_values.sum())
+        bucket.min, bucket.min_step = values[min_idx].item(), int(steps[min_idx])
+        bucket.max, bucket.max_step = values[max_idx].item(), int(steps[max_idx])
+        buckets.append(bucket)
+    return buckets
+
+
+def lod_views(series_tree: 'TreeView', levels, allocate: bool = False) -> Dict[int, Dict[str, 'ArrayView']]:
+    views = {}
+    for level in levels:
+        lod_tree = series_tree.subtree(('lod', level))
+        views[level] = {}
+        for column, dtype in (('min', None), ('max', None), ('mean', None),
+                              ('min_step', 'int64'), ('max_step', 'int64')):
+            view = lod_tree.array(column, dtype=dtype)
+            views[level][column] = view.allocate() if allocate else view
+    return views
 
 
 class SequenceInfo:
@@ -39,6 +153,15 @@ class SequenceInfo:
         self.time_view = None
         self.record_max_length = None
         self.step_hash_fn = None
+        self.min = None
+        self.max = None
+        self.lod_views = None
+        # the open buckets of the coarser levels, summarizing the complete buckets of the finest level
+        self.lod_buckets = None
+        # the values of the open bucket of the finest level by step, so that a step tracked again is replaced
+        self.lod_values = None
+        self.lod_idx = None
+        self.pending_lod_levels = None
 
 
 Selector = Tuple[int, str]
@@ -67,9 +190,11 @@ class RunTracker:
 
             self.hash = run.hash
             self.repo = run.repo
+            self.catalog = run.repo.catalog
             self.meta_run_tree = run.meta_run_tree
             self.series_run_trees = run.series_run_trees
             self.sequence_infos: Dict[Selector, SequenceInfo] = defaultdict(SequenceInfo)
+            self._pending_trace_info: Optional[Dict[tuple, AimObject]] = None
 
             self._preload_sequence_infos()
 
@@ -103,6 +228,165 @@ class RunTracker:
         else:
             self._track(value, track_time, name, step, epoch, context=context)
 
+    def track_many(
+        self,
+        name: str,
+        values,
+        steps=None,
+        epochs=None,
+        timestamps=None,
+        *,
+        context: AimObject = None,
+    ):
+        assert not self.read_only
+        track_time = datetime.datetime.now(pytz.utc).timestamp()
+
+        # the arrays are copied, as they may be written by the tracking thread
+        values = np.array(values)
+        if values.ndim != 1 or values.dtype.kind not in 'iuf':
+            raise ValueError(f'Input values of type {values.dtype} and shape {values.shape} '
+                             f'are not a one-dimensional array of numbers.')
+        steps = self._normalized_array(steps, len(values), 'steps', 'iu')
+        epochs = self._normalized_array(epochs, len(values), 'epochs', 'iu')
+        timestamps = self._normalized_array(timestamps, len(values), 'timestamps', 'iuf')
+        if not len(values):
+            return
+
+        if self._non_blocking:
+            self.repo.tracking_queue.register_task(
+                self._track_many, name, values, steps, epochs, timestamps, track_time, context=context
+            ) or self.track_rate_warn()
+        else:
+            self._track_many(name, values, steps, epochs, timestamps, track_time, context=context)
+
+    def track_objects(self, name: str, values: list, steps: list, *, context: AimObject = None):
+        """Track the list of objects (e.g. terminal log lines) of the sequence as a single batch."""
+        assert not self.read_only
+        track_time = datetime.datetime.now(pytz.utc).timestamp()
+        if not values:
+            return
+
+        if self._non_blocking:
+            self.repo.tracking_queue.register_task(
+                self._track_objects, name, values, steps, track_time, context=context
+            ) or self.track_rate_warn()
+        else:
+            self._track_objects(name, values, steps, track_time, context=context)
+
+    @staticmethod
+    def _normalized_array(array, size: int, arg_name: str, kinds: str) -> Optional[np.ndarray]:
+        if array is None:
+            return None
+        array = np.array(array)
+        if array.shape != (size,) or array.dtype.kind not in kinds:
+            raise ValueError(f'\'{arg_name}\' should be an array of {size} numbers.')
+        return array
+
+    def _track_many(
+        self,
+        name: str,
+        values: np.ndarray,
+        steps: Optional[np.ndarray],
+        epochs: Optional[np.ndarray],
+        timestamps: Optional[np.ndarray],
+        track_time: float,
+        *,
+        context: AimObject = None,
+    ):
+        if context is None:
+            context = {}
+
+        with self.batch():
+            ctx = Context(context)
+            seq_info = self.sequence_infos[ctx.idx, name]
+            first_val = values[0].item()
+            if not seq_info.initialized:
+                self._init_sequence_info(ctx.idx, name, first_val)
+            if steps is None:
+                steps = np.arange(seq_info.count, seq_info.count + len(values), dtype=np.int64)
+
+            if seq_info.version == METRIC_SEQUENCE_VERSION:
+                keys = step_keys(steps)
+            else:
+                keys = np.array([seq_info.step_hash_fn(step) for step in steps.tolist()], dtype=object)
+
+            self._update_context_data(ctx)
+            self._load_pending_lod_buckets(seq_info)
+            # the sequence info is updated once for all the values
+            self._update_sequence_dtype(ctx.idx, name, get_object_typename(first_val), first_val, steps[0].item())
+            last_idx = len(steps) - 1 - int(steps[::-1].argmax())
+            # as for the single values, NaNs are not taken into account in the bounds
+            bounds = values[~np.isnan(values)] if values.dtype.kind == 'f' else values
+            min_val, max_val = (bounds.min().item(), bounds.max().item()) if len(bounds) else (np.nan, np.nan)
+            self._update_sequence_bounds(ctx.idx, name, values[last_idx].item(), steps[last_idx].item(),
+                                         min_val, max_val)
+            if seq_info.lod_buckets is not None:
+                bucket_idxs = keys >> min(seq_info.lod_views)
+                if seq_info.lod_idx is not None:
+                    bucket_idxs = np.concatenate(([seq_info.lod_idx], bucket_idxs))
+                if (np.diff(bucket_idxs) < 0).any():
+                    self._disable_lod(ctx.idx, name)
+
+            keys = keys.tolist()
+            epochs = repeat(None) if epochs is None else epochs.tolist()
+            timestamps = repeat(track_time) if timestamps is None else timestamps.tolist()
+            for key, val in zip(keys, values.tolist()):
+                seq_info.val_view[key] = val
+            for key, epoch in zip(keys, epochs):
+                seq_info.epoch_view[key] = epoch
+            for key, timestamp in zip(keys, timestamps):
+                seq_info.time_view[key] = timestamp
+            if seq_info.step_view is not None:
+                for key, step in zip(keys, steps.tolist()):
+                    seq_info.step_view[key] = step
+            if seq_info.lod_buckets is not None:
+                self._add_lod_values(seq_info, steps, values)
+
+    def _track_objects(
+        self,
+        name: str,
+        values: list,
+        steps: list,
+        track_time: float,
+        *,
+        context: AimObject = None,
+    ):
+        if context is None:
+            context = {}
+
+        with self.batch():
+            ctx = Context(context)
+            seq_info = self.sequence_infos[ctx.idx, name]
+            if not seq_info.initialized:
+                self._init_sequence_info(ctx.idx, name, values[0])
+
+            self._update_context_data(ctx)
+            for val, step in zip(values, steps):
+                self._update_sequence_info(ctx.idx, name, val, step)
+                self._add_value(seq_info, val, step, None, track_time)
+
+    @contextmanager
+    def batch(self):
+        """Track the values within the context as a single batch.
+
+        The writes are stored in a single batch and the summaries of the sequences (last value/step,
+        min/max) are written once per batch.
+        """
+        if self._pending_trace_info is not None:
+            yield
+            return
+        self._pending_trace_info = {}
+        try:
+            with self.repo.atomic_track(self.hash):
+                try:
+                    yield
+                finally:
+                    pending_trace_info, self._pending_trace_info = self._pending_trace_info, None
+                    for path, value in pending_trace_info.items():
+                        self.meta_run_tree[path] = value
+        finally:
+            self._pending_trace_info = None
+
     def _track(
         self,
         value,
@@ -149,7 +433,7 @@ class RunTracker:
         try:
             seq_info.version = self.meta_run_tree['traces', ctx_id, name, 'version']
         except KeyError:
-            self.meta_run_tree['traces', ctx_id, name, 'version'] = seq_info.dtype = 1
+            self.meta_run_tree['traces', ctx_id, name, 'version'] = seq_info.version = 1
         try:
             seq_info.dtype = self.meta_run_tree['traces', ctx_id, name, 'dtype']
         except KeyError:
@@ -164,9 +448,43 @@ class RunTracker:
         seq_info.time_view = series_tree.subtree((ctx_id, name)).array('time', dtype='int64')
         seq_info.count = self.meta_run_tree['traces', ctx_id, name, 'last_step'] + 1
         seq_info.record_max_length = self.meta_run_tree.get(('traces', ctx_id, name, 'record_max_length'), 0)
+        if seq_info.version == METRIC_SEQUENCE_VERSION:
+            seq_info.min = self.meta_run_tree.get(('traces', ctx_id, name, 'min'))
+            seq_info.max = self.meta_run_tree.get(('traces', ctx_id, name, 'max'))
+            levels = self.meta_run_tree.get(('traces', ctx_id, name, 'lod_levels'))
+            if levels:
+                seq_info.lod_views = lod_views(series_tree.subtree((ctx_id, name)), levels)
+                # the open buckets are loaded once a value is tracked, see `_load_pending_lod_buckets`
+                seq_info.pending_lod_levels = levels
 
         seq_info.initialized = True
 
+    def _load_pending_lod_buckets(self, seq_info: SequenceInfo):
+        if seq_info.pending_lod_levels:
+            self._load_lod_buckets(seq_info, seq_info.pending_lod_levels)
+            seq_info.pending_lod_levels = None
+
+    @staticmethod
+    def _load_lod_buckets(seq_info: SequenceInfo, levels):
+        # The bucket containing the last step is written only once the next bucket is started,
+        # so aggregate the already tracked values of the open buckets to continue tracking.
+        last_step = seq_info.count - 1
+        start = (last_step >> max(levels)) << max(levels)
+        keys, values = seq_info.val_view.tree.items_numpy(dtype=np.float64, start=step_key(start))
+        steps = keys - STEP_KEY_OFFSET
+        finest_level = min(levels)
+        seq_info.lod_idx = lod_bucket_idx(last_step, finest_level)
+        open_start = (seq_info.lod_idx << finest_level) - STEP_KEY_OFFSET
+        is_open = steps >= open_start
+        seq_info.lod_values = dict(zip(steps[is_open].tolist(), values[is_open].tolist()))
+        seq_info.lod_buckets = {}
+        for level in levels:
+            if level == finest_level:
+                continue
+            open_buckets = lod_buckets(steps[~is_open], values[~is_open], level)
+            if open_buckets and open_buckets[-1].idx == lod_bucket_idx(last_step, level):
+                seq_info.lod_buckets[level] = open_buckets[-1]
+
     def _init_sequence_info(self, ctx_id: int, name: str, val):
         # this method is used in the `run.track()`, so please use only write-only instructions
         seq_info = self.sequence_infos[ctx_id, name]
@@ -177,7 +495,7 @@ class RunTracker:
         seq_info.count = 0
         seq_info.record_max_length = 0
         seq_info.dtype = None
-        seq_info.version = 2 if get_object_typename(val) in ('int', 'float') else 1
+        seq_info.version = METRIC_SEQUENCE_VERSION if get_object_typename(val) in ('int', 'float') else 1
         seq_info.step_hash_fn = STEP_HASH_FUNCTIONS[seq_info.version]
 
         series_tree = self.series_run_trees[seq_info.version]
@@ -186,6 +504,10 @@ class RunTracker:
         seq_info.val_view = series_tree.subtree((ctx_id, name)).array('val').allocate()
         seq_info.epoch_view = series_tree.subtree((ctx_id, name)).array('epoch', dtype='int64').allocate()
         seq_info.time_view = series_tree.subtree((ctx_id, name)).array('time', dtype='int64').allocate()
+        if seq_info.version == METRIC_SEQUENCE_VERSION:
+            seq_info.lod_views = lod_views(series_tree.subtree((ctx_id, name)), LOD_LEVELS, allocate=True)
+            seq_info.lod_buckets = {}
+            seq_info.lod_values = {}
         seq_info.initialized = True
         return seq_info
 
@@ -194,12 +516,28 @@ class RunTracker:
         seq_info = self.sequence_infos[ctx_id, name]
         assert seq_info.initialized
 
-        dtype = get_object_typename(val)
+        self._load_pending_lod_buckets(seq_info)
+        self._update_sequence_dtype(ctx_id, name, get_object_typename(val), val, step)
+        self._update_sequence_bounds(ctx_id, name, val, step, val, val)
+
+        if seq_info.lod_buckets is not None and seq_info.lod_idx is not None:
+            # Summaries of the written buckets can not be updated with write-only instructions.
+            # Stop maintaining them once a step goes back to one of those.
+            if lod_bucket_idx(step, min(seq_info.lod_views)) < seq_info.lod_idx:
+                self._disable_lod(ctx_id, name)
 
+        if isinstance(val, (tuple, list)):
+            record_max_length = max(seq_info.record_max_length, len(val))
+            self._set_trace_info(ctx_id, name, 'record_max_length', record_max_length)
+            seq_info.record_max_length = record_max_length
+
+    def _update_sequence_dtype(self, ctx_id: int, name: str, dtype: str, val, first_step: int):
+        seq_info = self.sequence_infos[ctx_id, name]
         if seq_info.dtype is not None:
             def update_trace_dtype(old_dtype: str, new_dtype: str):
                 logger.warning(f'Updating sequence \'{name}\' data type from {old_dtype} to {new_dtype}.')
                 self.meta_tree['traces_types', new_dtype, ctx_id, name] = 1
+                self._add_to_catalog(('traces_types', new_dtype, ctx_id, name), 1)
                 self.meta_run_tree['traces', ctx_id, name, 'dtype'] = new_dtype
                 seq_info.dtype = new_dtype
 
@@ -209,28 +547,57 @@ class RunTracker:
 
         if seq_info.count == 0:
             self.meta_tree['traces_types', dtype, ctx_id, name] = 1
+            self._add_to_catalog(('traces_types', dtype, ctx_id, name), 1)
             self.meta_run_tree['traces', ctx_id, name, 'dtype'] = dtype
             self.meta_run_tree['traces', ctx_id, name, 'version'] = seq_info.version
-            self.meta_run_tree['traces', ctx_id, name, 'first_step'] = step
+            self.meta_run_tree['traces', ctx_id, name, 'first_step'] = first_step
+            if seq_info.lod_buckets is not None:
+                self.meta_run_tree['traces', ctx_id, name, 'lod_levels'] = list(LOD_LEVELS)
             seq_info.dtype = dtype
 
-        if step >= seq_info.count:
-            self.meta_run_tree['traces', ctx_id, name, 'last'] = val
-            self.meta_run_tree['traces', ctx_id, name, 'last_step'] = step
-            seq_info.count = step + 1
+    def _update_sequence_bounds(self, ctx_id: int, name: str, last, last_step: int, min_val, max_val):
+        seq_info = self.sequence_infos[ctx_id, name]
+        # the last step tracked again replaces the last value
+        if last_step >= seq_info.count - 1:
+            self._set_trace_info(ctx_id, name, 'last', last)
+            self._set_trace_info(ctx_id, name, 'last_step', last_step)
+            seq_info.count = last_step + 1
+
+        if seq_info.version == METRIC_SEQUENCE_VERSION:
+            # NaNs are not taken into account in the bounds
+            if min_val == min_val and (seq_info.min is None or min_val < seq_info.min):
+                self._set_trace_info(ctx_id, name, 'min', min_val)
+                seq_info.min = min_val
+            if max_val == max_val and (seq_info.max is None or max_val > seq_info.max):
+                self._set_trace_info(ctx_id, name, 'max', max_val)
+                seq_info.max = max_val
+
+    def _disable_lod(self, ctx_id: int, name: str):
+        logger.debug(f'Disabling level-of-detail summaries for sequence \'{name}\'.')
+        del self.meta_run_tree['traces', ctx_id, name, 'lod_levels']
+        seq_info = self.sequence_infos[ctx_id, name]
+        seq_info.lod_buckets = seq_info.lod_values = seq_info.lod_idx = None
 
-        if isinstance(val, (tuple, list)):
-            record_max_length = max(seq_info.record_max_length, len(val))
-            self.meta_run_tree['traces', ctx_id, name, 'record_max_length'] = record_max_length
-            seq_info.record_max_length = record_max_length
+    def _set_trace_info(self, ctx_id: int, name: str, key: str, value):
+        if self._pending_trace_info is not None:
+            # only the latest value is written when the batch is done
+            self._pending_trace_info['traces', ctx_id, name, key] = value
+        else:
+            self.meta_run_tree['traces', ctx_id, name, key] = value
 
     def _update_context_data(self, ctx: Context):
         if ctx not in self.contexts:
             self.meta_tree['contexts', ctx.idx] = ctx.to_dict()
+            self._add_to_catalog(('contexts', ctx.idx), ctx.to_dict())
             self.meta_run_tree['contexts', ctx.idx] = ctx.to_dict()
             self.contexts[ctx] = ctx.idx
             self._idx_to_ctx[ctx.idx] = ctx
 
+    def _add_to_catalog(self, path: tuple, val):
+        # the repo-level params and sequences are listed from the catalog, see `aim.sdk.catalog`
+        if self.catalog is not None:
+            self.catalog.append(path, val)
+
     def _add_value(self, seq_info, val, step, epoch, track_time):
         step_hash = seq_info.step_hash_fn(step)
         seq_info.val_view[step_hash] = val
@@ -238,6 +605,50 @@ class RunTracker:
         seq_info.time_view[step_hash] = track_time
         if seq_info.step_view is not None:
             seq_info.step_view[step_hash] = step
+        if seq_info.lod_buckets is not None:
+            self._add_lod_value(seq_info, val, step)
+
+    @staticmethod
+    def _add_lod_value(seq_info, val, step):
+        bucket_idx = lod_bucket_idx(step, min(seq_info.lod_views))
+        if seq_info.lod_idx is not None and bucket_idx != seq_info.lod_idx:
+            RunTracker._close_lod_bucket(seq_info, step)
+        seq_info.lod_idx = bucket_idx
+        # the value of a step tracked again replaces the previous one, as in the `val` array
+        seq_info.lod_values[step] = val
+
+    @staticmethod
+    def _add_lod_values(seq_info, steps: np.ndarray, values: np.ndarray):
+        bucket_idxs = (steps.astype(np.int64) + STEP_KEY_OFFSET) >> min(seq_info.lod_views)
+        bounds = np.flatnonzero(np.diff(bucket_idxs)) + 1
+        for start, end in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [len(steps)]))):
+            bucket_idx = int(bucket_idxs[start])
+            if seq_info.lod_idx is not None and bucket_idx != seq_info.lod_idx:
+                RunTracker._close_lod_bucket(seq_info, int(steps[start]))
+            seq_info.lod_idx = bucket_idx
+            seq_info.lod_values.update(zip(steps[start:end].tolist(), values[start:end].tolist()))
+
+    @staticmethod
+    def _close_lod_bucket(seq_info, next_step: int):
+        # Write the open bucket of the finest level and add it to the open buckets of the coarser levels,
+        # writing the ones not containing `next_step`.
+        finest_level = min(seq_info.lod_views)
+        bucket = LodBucket(seq_info.lod_idx)
+        for step in sorted(seq_info.lod_values):
+            bucket.add(step, seq_info.lod_values[step])
+        bucket.write(seq_info.lod_views[finest_level])
+        seq_info.lod_values = {}
+        first_step = (bucket.idx << finest_level) - STEP_KEY_OFFSET
+        for level, views in seq_info.lod_views.items():
+            if level == finest_level:
+                continue
+            open_bucket = seq_info.lod_buckets.get(level)
+            if open_bucket is None:
+                open_bucket = seq_info.lod_buckets[level] = LodBucket(lod_bucket_idx(first_step, level))
+            open_bucket.merge(bucket)
+            if open_bucket.idx != lod_bucket_idx(next_step, level):
+                open_bucket.write(views)
+                del seq_info.lod_buckets[level]
 
     @staticmethod
     def _normalized_values(value, name):
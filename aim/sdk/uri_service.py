@@ -1,8 +1,16 @@
+import os
+
+from io import BytesIO
+from threading import Lock
+
+from cachetools import LRUCache
 from cryptography.fernet import Fernet
 from collections import defaultdict
-from typing import Iterator, List, Optional, Dict
+from PIL import Image as PILImage
+from typing import Iterator, List, Optional, Dict, Tuple
 from typing import TYPE_CHECKING
 
+from aim.sdk.configs import AIM_BLOB_CACHE_SIZE
 from aim.storage.encoding import encode_path, decode_path
 from aim.storage.types import BLOB
 
@@ -18,6 +26,51 @@ def generate_resource_path(prefix_view: 'PrefixView', additional_path: 'AimObjec
     return encoded_path.hex()
 
 
+def generate_thumbnail(data: bytes, max_size: int) -> bytes:
+    """Downscale the encoded image to fit into `max_size` x `max_size`, keeping the image format.
+
+    The data is returned as is if it is not an image or already fits.
+    """
+    try:
+        pil_img = PILImage.open(BytesIO(data))
+        if pil_img.width <= max_size and pil_img.height <= max_size:
+            return data
+        img_format = pil_img.format
+        pil_img.thumbnail((max_size, max_size))
+        thumbnail = BytesIO()
+        pil_img.save(thumbnail, format=img_format)
+    except Exception:
+        return data
+    return thumbnail.getvalue()
+
+
+class BlobCache:
+    """Thread-safe LRU cache of blobs limited by the total blobs size (in bytes)."""
+    DEFAULT_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._cache = LRUCache(maxsize=max_size, getsizeof=len)
+        self._lock = Lock()
+
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            return self._cache.get(key)
+
+    def put(self, key, data: bytes):
+        if len(data) > self.max_size:
+            return
+        with self._lock:
+            self._cache[key] = data
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+blob_cache = BlobCache(int(os.environ.get(AIM_BLOB_CACHE_SIZE, BlobCache.DEFAULT_SIZE)))
+
+
 class URIService:
     SEPARATOR = '__'
 
@@ -45,32 +98,63 @@ class URIService:
 
         return result
 
-    def request_batch(self, uri_batch: List[str]) -> Iterator[Dict[str, bytes]]:
+    def request_batch(self, uri_batch: List[str], max_size: Optional[int] = None) -> Iterator[Dict[str, bytes]]:
+        """Yield the `{uri: data}` of the requested blobs.
+
+        The images are downscaled to fit into `max_size` x `max_size`, if given.
+        """
         for uri in uri_batch:
             run_name, sub_name, resource_path = self.decode_uri(self.repo, uri)
             self.runs_pool[run_name].append((uri, sub_name, resource_path))
 
         for run_name in self.runs_pool.keys():
             run_containers = {}
+            cacheable = self._is_run_finished(run_name)
             for uri, sub_name, resource_path in self.runs_pool[run_name]:
-                container = run_containers.get(sub_name)
-                if not container:
-                    container = self._get_container(run_name, sub_name)
-                    run_containers[sub_name] = container
-
-                resource_path = decode_path(bytes.fromhex(resource_path))
-
-                # TODO: [MV] change to some other implementation of view when available
-                #  which won't collect in case of custom objects
-                data = container.tree().subtree(resource_path).collect()
-                if isinstance(data, BLOB):
-                    data = data.load()
+                data = self._get_blob(run_name, sub_name, resource_path, max_size, cacheable, run_containers)
                 yield {uri: data}
             del run_containers
 
         # clear runs pool
         self.runs_pool.clear()
 
+    def request(self, uri: str, max_size: Optional[int] = None) -> Tuple[bytes, bool]:
+        """Returns the requested blob and whether it is final (the Run is finished)."""
+        run_name, sub_name, resource_path = self.decode_uri(self.repo, uri)
+        final = self._is_run_finished(run_name)
+        return self._get_blob(run_name, sub_name, resource_path, max_size, final, {}), final
+
+    def _get_blob(self, run_name: str, sub_name: str, resource_path: str, max_size: Optional[int],
+                  cacheable: bool, run_containers: dict):
+        # the records of the Runs in progress may be overwritten, so only the finished ones are cached
+        cache_key = (self.repo.path, run_name, sub_name, resource_path, max_size)
+        if cacheable:
+            data = blob_cache.get(cache_key)
+            if data is not None:
+                return data
+
+        container = run_containers.get(sub_name)
+        if not container:
+            container = self._get_container(run_name, sub_name)
+            run_containers[sub_name] = container
+
+        # TODO: [MV] change to some other implementation of view when available
+        #  which won't collect in case of custom objects
+        data = container.tree().subtree(decode_path(bytes.fromhex(resource_path))).collect()
+        if isinstance(data, BLOB):
+            data = data.load()
+        if max_size is not None and isinstance(data, bytes):
+            data = generate_thumbnail(data, max_size)
+        if cacheable and isinstance(data, bytes):
+            blob_cache.put(cache_key, data)
+        return data
+
+    def _is_run_finished(self, run_name: str) -> bool:
+        try:
+            return self.repo._get_meta_tree()['chunks', run_name, 'end_time'] is not None
+        except KeyError:
+            return False
+
     def _get_container(self, run_name: str, sub_name: str):
         if sub_name == 'meta':
             container = self.repo.request(sub_name, run_name, from_union=True, read_only=True)
@@ -1,5 +1,12 @@
+import numpy as np
+
 from aim.storage import encoding as E
 from aim.storage.encoding.encoding import decode
+from aim.storage.encoding.encoding_numpy import (
+    decode_array_indices,
+    decode_array_items,
+    decode_array_items_at
+)
 from aim.storage.object import CustomObject
 from aim.storage.types import AimObject, AimObjectKey, AimObjectPath
 from aim.storage.utils import ArrayFlag, CustomObjectFlagType
@@ -167,6 +174,66 @@ class ContainerTreeView(TreeView):
         for path, value in treeutils.iter_decode_tree(it, level=level, skip_top_level=True):
             yield path, value
 
+    def keys_numpy(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        n_items: int = None,
+        start: int = None,
+        stop: int = None
+    ) -> np.ndarray:
+        prefix = E.encode_path(path)
+        it = self.container.view(prefix).items()
+        keys = decode_array_indices(it, -1 if n_items is None else n_items, start, stop)
+        if keys is None:
+            return super().keys_numpy(path, n_items=n_items, start=start, stop=stop)
+        return keys
+
+    def items_numpy(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        dtype: Any = None,
+        n_items: int = None,
+        start: int = None,
+        stop: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        prefix = E.encode_path(path)
+        it = self.container.view(prefix).items()
+        arrays = decode_array_items(it, dtype, -1 if n_items is None else n_items, start, stop)
+        if arrays is None:
+            return super().items_numpy(path, dtype=dtype, n_items=n_items, start=start, stop=stop)
+        return arrays
+
+    def keys_numpy_at(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        targets: np.ndarray = None,
+        stop: int = None
+    ) -> np.ndarray:
+        if targets is None or not len(targets):
+            return np.array([], dtype=np.intp)
+        prefix = E.encode_path(path)
+        it = self.container.view(prefix).items()
+        keys = decode_array_items_at(it, targets, stop=stop, with_values=False)
+        if keys is None:
+            return super().keys_numpy_at(path, targets=targets, stop=stop)
+        return keys
+
+    def items_numpy_at(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        targets: np.ndarray = None,
+        dtype: Any = None,
+        stop: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if targets is None or not len(targets):
+            return np.array([], dtype=np.intp), np.array([], dtype=dtype)
+        prefix = E.encode_path(path)
+        it = self.container.view(prefix).items()
+        arrays = decode_array_items_at(it, targets, dtype, stop)
+        if arrays is None:
+            return super().items_numpy_at(path, targets=targets, dtype=dtype, stop=stop)
+        return arrays
+
     def array(
         self,
         path: Union[AimObjectKey, AimObjectPath] = (),
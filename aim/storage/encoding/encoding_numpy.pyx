@@ -0,0 +1,341 @@
+# distutils: language = c++
+# cython: language_level = 3
+# cython: wraparound = False
+# cython: boundscheck = False
+# cython: cdivision=True
+# cython: nonecheck=False
+
+"""Bulk decoding of array records into NumPy buffers.
+
+Arrays are stored as a sequence of `(key, value)` records, where each key is
+an integer path key (`PATH_SENTINEL` + 64-bit big-endian integer +
+`PATH_SENTINEL`) and each value is a primitive encoding (see `encoding.pyx`).
+Decoding these records one by one into python objects, folding them into a
+tree and converting the resulting lists into NumPy arrays is expensive for
+long series. The functions below walk the records once and write the decoded
+indices and values directly into preallocated (and geometrically growing)
+NumPy buffers.
+"""
+
+import numpy as np
+
+from libc.string cimport memcpy
+
+from aim.storage.encoding.encoding_native cimport (
+    PATH_SENTINEL_CODE,
+    int64,
+    decode_int64_big_endian,
+    encode_int64_big_endian,
+)
+from aim.storage.encoding.encoding cimport FLAGS
+
+
+# The encoded integer path key consists of the leading sentinel, the 64-bit
+# big-endian integer and the trailing sentinel.
+cdef enum:
+    INDEX_KEY_SIZE = 10
+    # 1 byte for the type flag followed by 8 bytes of the content
+    NUMBER_VALUE_SIZE = 9
+    INITIAL_CAPACITY = 1024
+
+
+cdef bytes PATH_SENTINEL = bytes([PATH_SENTINEL_CODE])
+
+
+cdef inline bint is_index_key(const unsigned char* key, Py_ssize_t length) nogil:
+    # Keys of nested records start with the index key of the element
+    return (
+        length >= INDEX_KEY_SIZE
+        and key[0] == PATH_SENTINEL_CODE
+        and key[INDEX_KEY_SIZE - 1] == PATH_SENTINEL_CODE
+    )
+
+
+cdef inline bytes encode_index_key(int64 idx):
+    return PATH_SENTINEL + encode_int64_big_endian(idx) + PATH_SENTINEL
+
+
+cdef class ArrayBuilder:
+    """Accumulates the decoded `(index, value)` records in NumPy buffers.
+
+    The values are stored as raw 8-byte payloads along with their type flags
+    and are reinterpreted only once the resulting arrays are built.
+    """
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+    cdef bint with_values
+    cdef bint has_ints
+    cdef bint has_floats
+    cdef bint has_nones
+    cdef object indices
+    cdef object payloads
+    cdef object flags
+    cdef int64[::1] indices_buf
+    cdef int64[::1] payloads_buf
+    cdef unsigned char[::1] flags_buf
+
+    def __cinit__(self, bint with_values = True):
+        self.size = 0
+        self.capacity = INITIAL_CAPACITY
+        self.with_values = with_values
+        self.has_ints = False
+        self.has_floats = False
+        self.has_nones = False
+        self.indices = np.empty(self.capacity, dtype=np.int64)
+        self.indices_buf = self.indices
+        if with_values:
+            self.payloads = np.empty(self.capacity, dtype=np.int64)
+            self.flags = np.empty(self.capacity, dtype=np.uint8)
+            self.payloads_buf = self.payloads
+            self.flags_buf = self.flags
+
+    cdef void grow(self):
+        self.capacity *= 2
+        self.indices = np.resize(self.indices, self.capacity)
+        self.indices_buf = self.indices
+        if self.with_values:
+            self.payloads = np.resize(self.payloads, self.capacity)
+            self.flags = np.resize(self.flags, self.capacity)
+            self.payloads_buf = self.payloads
+            self.flags_buf = self.flags
+
+    cdef bint append(self, int64 idx, object value):
+        """Append the record. Returns `False` if the value is not supported."""
+        cdef unsigned char flag
+        cdef const unsigned char* value_ptr
+
+        if self.size == self.capacity:
+            self.grow()
+
+        if self.with_values:
+            if type(value) is not bytes:
+                # BLOBs are loaded lazily and are never numbers
+                return False
+            value_ptr = <bytes>value
+            flag = value_ptr[0] if len(value) else FLAGS._NONE
+            if flag == FLAGS._INT or flag == FLAGS._FLOAT:
+                if len(value) != NUMBER_VALUE_SIZE:
+                    return False
+                memcpy(&self.payloads_buf[self.size], value_ptr + 1, 8)
+                if flag == FLAGS._INT:
+                    self.has_ints = True
+                else:
+                    self.has_floats = True
+            elif flag == FLAGS._NONE:
+                self.payloads_buf[self.size] = 0
+                self.has_nones = True
+            else:
+                return False
+            self.flags_buf[self.size] = flag
+
+        self.indices_buf[self.size] = idx
+        self.size += 1
+        return True
+
+    cdef object build(self, object dtype):
+        """Returns the indices, the `(indices, values)` pair if the values are
+        decoded, or `None` if the values can not be represented by `dtype`.
+        """
+        indices = self.indices[:self.size].astype(np.intp, copy=False)
+        if not self.with_values:
+            return indices
+        if self.size == 0:
+            return indices, np.array([], dtype=dtype)
+
+        if self.has_nones and (dtype is None or np.dtype(dtype).kind != 'f'):
+            # `np.array` would produce an object array or fail
+            return None
+
+        payloads = self.payloads[:self.size]
+        flags = self.flags[:self.size]
+
+        if not self.has_floats and not self.has_nones:
+            values = payloads
+        elif not self.has_ints:
+            values = payloads.view(np.float64)
+            if self.has_nones:
+                values = values.copy()
+        else:
+            values = payloads.view(np.float64).copy()
+            int_mask = flags == FLAGS._INT
+            values[int_mask] = payloads[int_mask]
+
+        if self.has_nones:
+            values[flags == FLAGS._NONE] = np.nan
+
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+
+        return indices, values
+
+
+cdef object decode_range(
+    object items,
+    bint with_values,
+    object dtype,
+    int64 n_items,
+    object start,
+    object stop
+):
+    cdef ArrayBuilder builder = ArrayBuilder(with_values)
+    cdef Py_ssize_t length
+    cdef const unsigned char* key_ptr
+    cdef int64 idx
+    cdef bint bounded = stop is not None
+    cdef int64 stop_idx = stop if bounded else 0
+    # Nested records of non-primitive elements are skipped by seeking
+    cdef bint skip_nested = not with_values and hasattr(items, 'seek')
+    cdef int64 last_idx = 0
+    cdef bytes key
+
+    if start is not None:
+        items.seek(encode_index_key(start))
+
+    for item in items:
+        if builder.size == n_items:
+            break
+        key = item[0]
+        length = len(key)
+        if length == 0:
+            # The array flag itself
+            continue
+        key_ptr = key
+        if not is_index_key(key_ptr, length):
+            # Not an array at all
+            return None
+        if length != INDEX_KEY_SIZE and not skip_nested:
+            return None
+        idx = decode_int64_big_endian(key_ptr, 1)
+        if bounded and idx >= stop_idx:
+            break
+        if length != INDEX_KEY_SIZE:
+            # All the records of the element share the index key prefix, hence
+            # precede the prefix with the trailing sentinel replaced by 0xff
+            items.seek(key[:INDEX_KEY_SIZE - 1] + b'\xff')
+            if builder.size and idx == last_idx:
+                # The element flag has been already decoded
+                continue
+        if not builder.append(idx, item[1]):
+            return None
+        last_idx = idx
+
+    return builder.build(dtype)
+
+
+cpdef object decode_array_indices(
+    object items,
+    int64 n_items = -1,
+    object start = None,
+    object stop = None
+):
+    """Decode the indices of the array records into an `intp` NumPy array.
+
+    Args:
+        items: iterator over `(key, value)` records of the array, with keys
+               relative to the array path.
+        n_items: the maximum number of indices to decode; -1 to decode all.
+        start: if provided, seek `items` to the index `start` first.
+        stop: if provided, stop at the first index `>= stop`.
+              Both `start` and `stop` assume the indices are non-negative,
+              i.e. stored in ascending order.
+
+    Elements with nested records are supported only if `items` supports
+    `seek()`, so that the nested records can be skipped.
+
+    Returns:
+        The NumPy array of indices or `None` if the records do not represent
+        an array, so that the caller can fall back to the generic decoding.
+    """
+    return decode_range(items, False, None, n_items, start, stop)
+
+
+cpdef object decode_array_items(
+    object items,
+    object dtype = None,
+    int64 n_items = -1,
+    object start = None,
+    object stop = None
+):
+    """Decode the array records of numbers into `(indices, values)` NumPy arrays.
+
+    Only integer and floating-point (and None, if `dtype` is floating-point)
+    values are supported. The result is identical to
+    `np.array(indices, dtype=np.intp), np.array(values, dtype=dtype)`.
+
+    Args:
+        items: iterator over `(key, value)` records of the array, with keys
+               relative to the array path.
+        dtype: the NumPy data type of values; inferred if `None`.
+        n_items: the maximum number of items to decode; -1 to decode all.
+        start: if provided, seek `items` to the index `start` first.
+        stop: if provided, stop at the first index `>= stop`.
+              Both `start` and `stop` assume the indices are non-negative,
+              i.e. stored in ascending order.
+
+    Returns:
+        The pair of NumPy arrays or `None` if the records can not be decoded
+        in bulk, so that the caller can fall back to the generic decoding.
+    """
+    return decode_range(items, True, dtype, n_items, start, stop)
+
+
+cpdef object decode_array_items_at(
+    object items,
+    object targets,
+    object dtype = None,
+    object stop = None,
+    bint with_values = True
+):
+    """Decode the array records found by seeking `items` to each of `targets`.
+
+    For each target the first record with index `>= target` is decoded, unless
+    it has been already decoded for one of the previous targets. Hence the cost
+    is bounded by the number of targets rather than the length of the array.
+
+    Args:
+        items: seekable iterator over `(key, value)` records of the array, with
+               keys relative to the array path.
+        targets: non-negative indices in ascending order.
+        dtype: the NumPy data type of values; inferred if `None`.
+        stop: if provided, ignore the records with index `>= stop`.
+        with_values: if `False`, decode only the indices. In that case the
+                     array elements are not required to be primitive values.
+
+    Returns:
+        The pair of NumPy arrays (or just the indices if `with_values` is
+        `False`) or `None` if the records can not be decoded in bulk.
+    """
+    cdef ArrayBuilder builder = ArrayBuilder(with_values)
+    cdef Py_ssize_t length
+    cdef const unsigned char* key_ptr
+    cdef int64 idx
+    cdef int64 target
+    cdef int64 last_idx = 0
+    cdef bint bounded = stop is not None
+    cdef int64 stop_idx = stop if bounded else 0
+    cdef bytes key
+
+    for target in targets:
+        if builder.size and target <= last_idx:
+            continue
+        if bounded and target >= stop_idx:
+            break
+        items.seek(encode_index_key(target))
+        item = items.next()
+        if item is None:
+            break
+        key = item[0]
+        length = len(key)
+        key_ptr = key
+        if not is_index_key(key_ptr, length):
+            return None
+        if with_values and length != INDEX_KEY_SIZE:
+            return None
+        idx = decode_int64_big_endian(key_ptr, 1)
+        if bounded and idx >= stop_idx:
+            break
+        if not builder.append(idx, item[1]):
+            return None
+        last_idx = idx
+
+    return builder.build(dtype)
@@ -344,3 +344,7 @@ class PrefixViewItemsIterator(ContainerItemsIterator):
         value = item[1]
 
         return keys[self.prefix_len:], value
+
+    def seek(self, key):
+        """Move the iterator to the first record with key `>= key`."""
+        self.it.seek(self.path + key)
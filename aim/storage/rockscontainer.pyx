@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 import aimrocks
@@ -20,6 +22,33 @@ logger = logging.getLogger(__name__)
 
 BLOB_SENTINEL = b''
 BLOB_DOMAIN = b'BLOBS\xfe'
+# Number of records written to the index in a single `WriteBatch` on finalize
+FINALIZE_BATCH_SIZE = 16384
+# Size of the raw records written to the destination in a single `WriteBatch` on copy
+COPY_BATCH_BYTES = 16 * 1024 * 1024
+
+_batched_writes = threading.local()
+
+
+@contextmanager
+def batched_writes():
+    """Collect the writes of the current thread to every `RocksContainer` into a single batch.
+
+    Within the context :obj:`RocksContainer.batch` returns the shared batch of the container and
+    :obj:`RocksContainer.commit` of that batch is deferred; the batches are written when the
+    context exits, and discarded if it exits with an exception. The pending writes are not visible
+    to the reads made within the context. Nested contexts are merged into the outermost one.
+    """
+    if getattr(_batched_writes, 'batches', None) is not None:
+        yield
+        return
+    _batched_writes.batches = batches = {}
+    try:
+        yield
+    finally:
+        _batched_writes.batches = None
+    for container, batch in batches.values():
+        container.db.write(batch)
 
 
 class RocksAutoClean(AutoClean):
@@ -157,17 +186,47 @@ class RocksContainer(Container):
         """Finalize the Container.
 
         Store the collection of `(key, value)` records in the :obj:`Container`
-        `index` for fast reads.
+        `index` for fast reads. The records are written in large write batches.
         """
         if not self._progress_path:
             return
 
+        batch = index.batch()
+        n_records = 0
         for k, v in self.items():
-            index[k] = v
+            index.set(k, v, store_batch=batch)
+            n_records += 1
+            if n_records % FINALIZE_BATCH_SIZE == 0:
+                index.commit(batch)
+                batch = index.batch()
+        index.commit(batch)
 
         self._progress_path.unlink()
         self._progress_path = None
 
+    def copy_to(self, dest: 'RocksContainer'):
+        """Copy all the records of the Container to the Container `dest`.
+
+        The raw records, including the blobs, are copied as is, without decoding. The records are
+        written in write batches of up to `COPY_BATCH_BYTES` bytes.
+        """
+        it = self.db.iteritems()
+        it.seek(b'')
+        batch = dest.batch()
+        batch_bytes = 0
+        while True:
+            item = it.next()
+            if item is None:
+                break
+            key, value = item
+            dest._put(key, value, target=batch)
+            batch_bytes += len(key) + len(value)
+            if batch_bytes >= COPY_BATCH_BYTES:
+                dest.commit(batch)
+                batch = dest.batch()
+                batch_bytes = 0
+        dest.commit(batch)
+
     def close(self):
         """Close all the resources."""
         if self._resources is None:
@@ -480,7 +539,11 @@ class RocksContainer(Container):
 
         See more at :obj:`RocksContainer.commit`
         """
-        return aimrocks.WriteBatch()
+        batches = getattr(_batched_writes, 'batches', None)
+        if batches is None:
+            return aimrocks.WriteBatch()
+        _, batch = batches.setdefault(id(self), (self, aimrocks.WriteBatch()))
+        return batch
 
     def commit(
         self,
@@ -490,6 +553,10 @@ class RocksContainer(Container):
 
         The `RocksContainer` features atomic writes for batches.
         """
+        batches = getattr(_batched_writes, 'batches', None)
+        if batches is not None and id(self) in batches and batches[id(self)][1] is batch:
+            # written on exit of `batched_writes()`
+            return
         self.db.write(batch)
 
     def next_item(
@@ -608,3 +675,10 @@ class RocksContainerItemsIterator(ContainerItemsIterator):
             return key, self.container._get_blob(key)
 
         return key, value
+
+    def seek(self, key: ContainerKey):
+        """Move the iterator to the first record with key `>= key`.
+
+        The `key` is absolute, i.e. it should start with the iterator prefix.
+        """
+        self.it.seek(key)
@@ -8,6 +8,7 @@ from sqlalchemy.orm import sessionmaker, scoped_session
 
 from aim.storage.migrations.utils import upgrade_database
 from aim.storage.structured.sql_engine.factory import ModelMappedFactory as ObjectFactory
+from aim.storage.structured.sql_engine.runs_cache import RunsCache
 from aim.storage.types import SafeNone
 from aim.web.configs import AIM_LOG_LEVEL_KEY
 
@@ -58,6 +59,7 @@ class DB(ObjectFactory):
                                     echo=(logging.INFO >= int(os.environ.get(AIM_LOG_LEVEL_KEY, logging.WARNING))))
         self.session_cls = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=self.engine))
         self._upgraded = None
+        self._runs_cache = None
 
     @classmethod
     def from_path(cls, path: str, readonly: bool = False):
@@ -94,6 +96,17 @@ class DB(ObjectFactory):
         upgrade_database(self.db_url)
         self._upgraded = True
 
+    @property
+    def runs_cache(self) -> RunsCache:
+        if self._runs_cache is None:
+            self._runs_cache = RunsCache(self)
+        return self._runs_cache
+
+    def init_runs_cache(self, cache_name='runs_cache'):
+        # the runs cache lives as long as the database and is refreshed incrementally
+        self.runs_cache.refresh()
+        self._caches[cache_name] = self.runs_cache
+
     def init_cache(self, cache_name, callback, key_func):
         if cache_name in self._caches:
             return
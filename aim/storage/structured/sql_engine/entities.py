@@ -1,6 +1,7 @@
 import pytz
 
-from typing import Collection, Union, List, Optional
+from typing import Collection, Dict, Union, List, Optional, Set
+from sqlalchemy import func
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import IntegrityError
 
@@ -35,6 +36,11 @@ def timestamp_or_none(dt):
     return dt.timestamp()
 
 
+def created_at_hour(timezone_offset: int = 0):
+    # `created_at` is stored in UTC, the offset is in minutes as in JS `Date.getTimezoneOffset()`
+    return func.strftime('%Y-%m-%dT%H:00:00', RunModel.created_at, f'{-timezone_offset} minutes')
+
+
 class ModelMappedRun(IRun, metaclass=ModelMappedClassMeta):
     __model__ = RunModel
     __mapped_properties__ = [
@@ -128,6 +134,57 @@ class ModelMappedRun(IRun, metaclass=ModelMappedClassMeta):
         ]).filter(RunModel.name.like(term))
         return ModelMappedRunCollection(session, query=q)
 
+    @classmethod
+    def filter_hashes(cls, run_filter, **kwargs) -> Set[str]:
+        session = kwargs.get('session')
+        if not session:
+            return set()
+        q = session.query(RunModel.hash).filter(run_filter)
+        return {run_hash for run_hash, in q}
+
+    @classmethod
+    def activity(cls, timezone_offset: int = 0, experiment_id: Optional[str] = None,
+                 active_run_hashes: Optional[Collection[str]] = None, **kwargs) -> Optional[Dict]:
+        """Count the runs, the archived runs and the runs created in each hour.
+
+        The runs of the experiment with uuid `experiment_id` only are counted if given,
+        `None` is returned if there is no such experiment.
+        The runs out of `active_run_hashes` are counted as well if given.
+        """
+        session = kwargs.get('session')
+        if not session:
+            return None
+        q = session.query(RunModel)
+        if experiment_id is not None:
+            exp_id = session.query(ExperimentModel.id).filter(ExperimentModel.uuid == experiment_id).scalar()
+            if exp_id is None:
+                return None
+            q = q.filter(RunModel.experiment_id == exp_id)
+
+        hour = created_at_hour(timezone_offset)
+        activity_map = {}
+        num_runs = 0
+        for bucket, count in q.with_entities(hour, func.count(RunModel.id)).group_by(hour):
+            num_runs += count
+            if bucket is not None:
+                activity_map[bucket] = count
+        num_archived_runs = q.filter(
+            RunModel.is_archived == True  # noqa
+        ).with_entities(func.count(RunModel.id)).scalar()
+
+        activity = {
+            'num_runs': num_runs,
+            'num_archived_runs': num_archived_runs,
+            'activity_map': activity_map,
+        }
+        if active_run_hashes:
+            activity['num_active_runs'] = q.filter(
+                RunModel.hash.in_(list(active_run_hashes))
+            ).with_entities(func.count(RunModel.id)).scalar()
+        elif active_run_hashes is not None:
+            activity['num_active_runs'] = 0
+        return activity
+
     @property
     def experiment_obj(self) -> Optional[IExperiment]:
         if self._model and self._model.experiment:
@@ -334,6 +391,13 @@ class ModelMappedExperiment(IExperiment, metaclass=ModelMappedClassMeta):
     def runs(self) -> RunCollection:
         return ModelMappedRunCollection(self._session, collection=self._model.runs)
 
+    @classmethod
+    def count(cls, **kwargs) -> int:
+        session = kwargs.get('session')
+        if not session:
+            return 0
+        return session.query(func.count(ExperimentModel.id)).scalar()
+
     def get_runs(self) -> RunCollection:
         return self.runs
 
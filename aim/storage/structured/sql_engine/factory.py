@@ -10,7 +10,7 @@ from aim.storage.structured.sql_engine.entities import (
     ModelMappedExperiment,
     ModelMappedTag,
 )
-from typing import List
+from typing import Collection, Dict, List, Optional, Set
 from datetime import datetime
 
 
@@ -43,6 +43,14 @@ class ModelMappedFactory(ObjectFactory):
     def find_runs(self, ids: List[str]) -> List[Run]:
         return ModelMappedRun.find_many(ids, session=self._session or self.get_session())
 
+    def filter_run_hashes(self, run_filter) -> Set[str]:
+        return ModelMappedRun.filter_hashes(run_filter, session=self._session or self.get_session())
+
+    def runs_activity(self, timezone_offset: int = 0, experiment_id: Optional[str] = None,
+                      active_run_hashes: Optional[Collection[str]] = None) -> Optional[Dict]:
+        return ModelMappedRun.activity(timezone_offset, experiment_id, active_run_hashes,
+                                       session=self._session or self.get_session())
+
     def create_run(self, runhash: str, created_at: datetime = None) -> Run:
         run = ModelMappedRun.from_hash(runhash, created_at, session=self._session or self.get_session())
         run.experiment = 'default'
@@ -54,6 +62,9 @@ class ModelMappedFactory(ObjectFactory):
     def experiments(self) -> ExperimentCollection:
         return ModelMappedExperiment.all(session=self._session or self.get_session())
 
+    def count_experiments(self) -> int:
+        return ModelMappedExperiment.count(session=self._session or self.get_session())
+
     def search_experiments(self, term: str) -> ExperimentCollection:
         return ModelMappedExperiment.search(term, session=self._session or self.get_session())
 
@@ -40,13 +40,13 @@ class Run(Base):
     name = Column(Text, default=default_to_run_hash)
     description = Column(Text, nullable=True)
 
-    is_archived = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    is_archived = Column(Boolean, default=False, index=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     finalized_at = Column(DateTime, default=None)
 
     # relationships
-    experiment_id = Column(ForeignKey('experiment.id'), nullable=True)
+    experiment_id = Column(ForeignKey('experiment.id'), nullable=True, index=True)
 
     experiment = relationship('Experiment', backref=backref('runs', uselist=True, order_by='Run.created_at.desc()'))
     tags = relationship('Tag', secondary=run_tags, backref=backref('runs', uselist=True))
@@ -0,0 +1,185 @@
+import ast
+import sys
+
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, not_, func
+from sqlalchemy.sql.elements import ClauseElement
+
+from aim.storage.structured.sql_engine.models import (
+    Run as RunModel,
+    Experiment as ExperimentModel,
+    Tag as TagModel,
+)
+
+if sys.version_info >= (3, 8):
+    _CONSTANT_NODES = (ast.Constant,)
+else:
+    _CONSTANT_NODES = (ast.Str, ast.Num, ast.NameConstant)
+
+_RUN_COLUMNS = {
+    'hash': (RunModel.hash, str),
+    'name': (RunModel.name, str),
+    'description': (RunModel.description, str),
+    'archived': (RunModel.is_archived, bool),
+}
+
+
+class _NotStructured(Exception):
+    pass
+
+
+def structured_run_filter(expr: str) -> Optional[ClauseElement]:
+    """Build the SQL filter over structured Run data implied by the query expression.
+
+    The top-level conjuncts of `expr` which refer only to the Run properties kept in
+    the structured DB (`run.hash`, `run.name`, `run.description`, `run.archived`,
+    `run.experiment` and `run.tags`) are translated into a filter over the `run` table.
+    The rest of the conjuncts are ignored, hence the filter is a necessary condition
+    for the Run to match the query and the query check itself is still required.
+
+    Returns:
+        The SQLAlchemy filter clause, or `None` if none of the conjuncts can be translated.
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode='eval')
+    except SyntaxError:
+        return None
+
+    filters = []
+    for conjunct in _conjuncts(tree.body):
+        try:
+            filters.append(_translate(conjunct))
+        except _NotStructured:
+            continue
+    if not filters:
+        return None
+    return and_(*filters)
+
+
+def _conjuncts(node: ast.expr) -> List[ast.expr]:
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        return [conjunct for value in node.values for conjunct in _conjuncts(value)]
+    return [node]
+
+
+# The translated clauses never evaluate to NULL, so that `not` matches Python semantics:
+# comparison of a missing (`None`) property to a value is false, inequality is true.
+def _translate(node: ast.expr) -> ClauseElement:
+    if isinstance(node, ast.BoolOp):
+        clauses = [_translate(value) for value in node.values]
+        return and_(*clauses) if isinstance(node.op, ast.And) else or_(*clauses)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return not_(_translate(node.operand))
+    if isinstance(node, ast.Compare) and len(node.ops) == 1:
+        return _translate_compare(node.left, node.ops[0], node.comparators[0])
+    if _run_property(node) == 'archived':
+        return _equals('archived', True)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+            and node.func.attr in ('startswith', 'endswith') \
+            and len(node.args) == 1 and not node.keywords:
+        return _translate_affix(_run_property(node.func.value), node.func.attr, _constant(node.args[0]))
+    raise _NotStructured
+
+
+def _translate_compare(left: ast.expr, op: ast.cmpop, right: ast.expr) -> ClauseElement:
+    if isinstance(op, (ast.Eq, ast.NotEq)):
+        if _is_run_property(right):
+            left, right = right, left
+        clause = _equals(_run_property(left), _constant(right))
+        return clause if isinstance(op, ast.Eq) else not_(clause)
+    if isinstance(op, (ast.In, ast.NotIn)):
+        if _is_run_property(right):
+            clause = _contains(_run_property(right), _constant(left))
+        else:
+            clause = _one_of(_run_property(left), _constants(right))
+        return clause if isinstance(op, ast.In) else not_(clause)
+    raise _NotStructured
+
+
+def _equals(prop: str, value) -> ClauseElement:
+    if prop == 'experiment':
+        if value is None:
+            return not_(RunModel.experiment.has())
+        _check_type(value, str)
+        return RunModel.experiment.has(ExperimentModel.name == value)
+    if prop not in _RUN_COLUMNS:
+        raise _NotStructured
+    column, value_type = _RUN_COLUMNS[prop]
+    if value is None:
+        return column.is_(None)
+    _check_type(value, value_type)
+    return and_(column.isnot(None), column == value)
+
+
+def _one_of(prop: str, values: list) -> ClauseElement:
+    if prop == 'experiment':
+        for value in values:
+            _check_type(value, str)
+        return RunModel.experiment.has(ExperimentModel.name.in_(values))
+    if prop not in _RUN_COLUMNS:
+        raise _NotStructured
+    column, value_type = _RUN_COLUMNS[prop]
+    for value in values:
+        _check_type(value, value_type)
+    return and_(column.isnot(None), column.in_(values))
+
+
+def _contains(prop: str, value) -> ClauseElement:
+    _check_type(value, str)
+    if prop == 'tags':
+        # archived tags are not listed in `run.tags`
+        return RunModel.tags.any(and_(TagModel.name == value, TagModel.is_archived.isnot(True)))
+    if prop in ('name', 'description'):
+        column, _ = _RUN_COLUMNS[prop]
+        # substring check; unlike LIKE, `instr` is case-sensitive
+        return and_(column.isnot(None), func.instr(column, value) > 0)
+    raise _NotStructured
+
+
+def _translate_affix(prop: str, method: str, value) -> ClauseElement:
+    _check_type(value, str)
+    if prop not in ('name', 'description'):
+        raise _NotStructured
+    column, _ = _RUN_COLUMNS[prop]
+    if not value:
+        return column.isnot(None)
+    if method == 'startswith':
+        affix = func.substr(column, 1, len(value))
+    else:
+        affix = func.substr(column, -len(value), len(value))
+    return and_(column.isnot(None), affix == value)
+
+
+def _is_run_property(node: ast.expr) -> bool:
+    try:
+        _run_property(node)
+    except _NotStructured:
+        return False
+    return True
+
+
+def _run_property(node: ast.expr) -> str:
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'run':
+        return node.attr
+    raise _NotStructured
+
+
+def _constant(node: ast.expr):
+    if not isinstance(node, _CONSTANT_NODES):
+        raise _NotStructured
+    if isinstance(node, ast.Constant):
+        return node.value
+    return node.s if isinstance(node, ast.Str) else getattr(node, 'value', getattr(node, 'n', None))
+
+
+def _constants(node: ast.expr) -> list:
+    if not isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        raise _NotStructured
+    return [_constant(elt) for elt in node.elts]
+
+
+def _check_type(value, value_type: type):
+    # Python comparison of values of different types (e.g. `True == 1`) is not mirrored in SQL
+    if type(value) is not value_type:
+        raise _NotStructured
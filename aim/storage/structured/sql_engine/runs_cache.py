@@ -0,0 +1,239 @@
+import datetime
+import threading
+import weakref
+
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TYPE_CHECKING
+
+from sqlalchemy import func, or_
+
+from aim.storage.types import SafeNone
+from aim.storage.structured.sql_engine.entities import timestamp_or_none
+from aim.storage.structured.sql_engine.models import (
+    Run as RunModel,
+    Experiment as ExperimentModel,
+    Tag as TagModel,
+    run_tags,
+)
+
+if TYPE_CHECKING:
+    from aim.storage.structured.sql_engine.factory import ModelMappedFactory
+
+
+# keeps the number of bound parameters of the `IN` clauses below the SQLite limit
+_IN_CHUNK_SIZE = 500
+
+# `updated_at` is set when the change is flushed rather than committed, by the clock of the writing process,
+# so a Run update may become visible with an `updated_at` older than the watermark. The Runs updated within
+# this window before the watermark are re-read on every refresh.
+_WATERMARK_OVERLAP = datetime.timedelta(minutes=1)
+
+
+def _chunks(items: Iterable, size: int = _IN_CHUNK_SIZE) -> Iterator[list]:
+    it = iter(items)
+    chunk = list(islice(it, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(it, size))
+
+
+class ExperimentRow:
+    __slots__ = ('uuid', 'name', 'description')
+
+    def __init__(self, uuid: str, name: str, description: Optional[str]):
+        self.uuid = uuid
+        self.name = name
+        self.description = description
+
+
+class TagRow:
+    __slots__ = ('uuid', 'name', 'color', 'description')
+
+    def __init__(self, uuid: str, name: str, color: Optional[str], description: Optional[str]):
+        self.uuid = uuid
+        self.name = name
+        self.color = color
+        self.description = description
+
+
+class RunRow:
+    """Read-only snapshot of the structured Run props, as returned by :obj:`ModelMappedRun`.
+
+    The props not kept in the row (e.g. `info`, `notes`) are read from the database, and the
+    props set on the row are written to the database and invalidate the row in the cache.
+    """
+    __slots__ = ('hash', 'name', 'description', 'archived', 'created_at', 'finalized_at', 'updated_at',
+                 'experiment_obj', 'tags_obj', '_cache')
+
+    def __init__(self, cache: 'RunsCache', hash_: str, name, description, archived, created_at, finalized_at,
+                 updated_at, experiment_obj: Optional[ExperimentRow]):
+        set_ = object.__setattr__
+        set_(self, '_cache', cache)
+        set_(self, 'hash', hash_)
+        set_(self, 'name', name)
+        set_(self, 'description', description)
+        set_(self, 'archived', archived)
+        set_(self, 'created_at', created_at)
+        set_(self, 'finalized_at', finalized_at)
+        set_(self, 'updated_at', updated_at)
+        set_(self, 'experiment_obj', experiment_obj)
+        set_(self, 'tags_obj', [])
+
+    def __repr__(self) -> str:
+        return f'<RunRow id={self.hash}, name=\'{self.name}\'>'
+
+    @property
+    def creation_time(self):
+        return timestamp_or_none(self.created_at)
+
+    @property
+    def end_time(self):
+        return timestamp_or_none(self.finalized_at)
+
+    @property
+    def experiment(self):
+        return self.experiment_obj.name if self.experiment_obj else SafeNone()
+
+    @property
+    def tags(self) -> List[str]:
+        return [tag.name for tag in self.tags_obj]
+
+    def __getattr__(self, item):
+        return getattr(self._cache.db.find_run(self.hash), item)
+
+    def __setattr__(self, key, value):
+        setattr(self._cache.db.find_run(self.hash), key, value)
+        self._cache.invalidate(self.hash)
+
+
+class RunsCache:
+    """Long-lived cache of the structured Run props of the repository.
+
+    The Runs are kept as :obj:`RunRow` snapshots ordered by creation time (newest first).
+    `refresh()` reloads only the Runs updated since the last refresh, using the `updated_at`
+    watermark with an overlap window, and the Runs invalidated with `invalidate(run_hash)`. Changes not tracked by the
+    Runs' `updated_at` (deleted Runs, updated experiments or tags) cause a full reload.
+    Changes of the Run tags made by other processes are picked up once the Run is updated.
+    """
+    def __init__(self, db: 'ModelMappedFactory'):
+        # the cache is owned by the database, which must not be kept alive by the cache
+        self._db = weakref.ref(db)
+        self._rows: Optional[Dict[str, RunRow]] = None
+        self._hashes: List[str] = []
+        self._watermark = None
+        self._related_watermark = None
+        self._invalidated: Set[str] = set()
+        self._lock = threading.RLock()
+
+    @property
+    def db(self) -> 'ModelMappedFactory':
+        return self._db()
+
+    def refresh(self):
+        with self._lock:
+            # the session of the DB transaction in progress is shared by the thread, and must be kept as is
+            session = self.db._session or self.db.get_session()
+            related_watermark = (
+                session.query(func.max(ExperimentModel.updated_at)).scalar(),
+                session.query(func.max(TagModel.updated_at)).scalar(),
+            )
+            if self._rows is None or related_watermark != self._related_watermark:
+                self._load(session)
+            else:
+                self._update(session)
+                if session.query(func.count(RunModel.id)).scalar() != len(self._rows):
+                    self._load(session)
+            self._related_watermark = related_watermark
+
+    def invalidate(self, run_hash: Optional[str] = None):
+        """Reload the Run `run_hash` on next access, or all the Runs on next refresh if not given."""
+        with self._lock:
+            if run_hash is None:
+                self._rows = None
+                self._invalidated.clear()
+            else:
+                self._invalidated.add(run_hash)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            if self._rows is None:
+                self.refresh()
+            return self._hashes
+
+    def __getitem__(self, run_hash: str):
+        with self._lock:
+            if self._rows is None or run_hash in self._invalidated:
+                self.refresh()
+            return self._rows.get(run_hash) or SafeNone()
+
+    def __setitem__(self, run_hash: str, props):
+        # the props requested for Runs missing in the cache are cached on next access
+        self.invalidate(run_hash)
+
+    def _query(self, session):
+        return session.query(
+            RunModel.id, RunModel.hash, RunModel.name, RunModel.description, RunModel.is_archived,
+            RunModel.created_at, RunModel.finalized_at, RunModel.updated_at,
+            ExperimentModel.uuid, ExperimentModel.name, ExperimentModel.description,
+        ).outerjoin(ExperimentModel, RunModel.experiment_id == ExperimentModel.id)
+
+    def _make_rows(self, records) -> Dict[int, RunRow]:
+        rows = {}
+        for run_id, run_hash, name, description, archived, created_at, finalized_at, updated_at, \
+                exp_uuid, exp_name, exp_description in records:
+            experiment = ExperimentRow(exp_uuid, exp_name, exp_description) if exp_uuid is not None else None
+            rows[run_id] = RunRow(self, run_hash, name, description, archived, created_at, finalized_at,
+                                  updated_at, experiment)
+        return rows
+
+    def _add_tags(self, session, rows: Dict[int, RunRow], run_ids: Optional[List[int]] = None):
+        q = session.query(
+            run_tags.c.run_id, TagModel.uuid, TagModel.name, TagModel.color, TagModel.description
+        ).join(TagModel, TagModel.id == run_tags.c.tag_id).filter(
+            or_(TagModel.is_archived.is_(None), TagModel.is_archived == False)  # noqa
+        )
+        queries = [q] if run_ids is None else [q.filter(run_tags.c.run_id.in_(ids)) for ids in _chunks(run_ids)]
+        for tags_q in queries:
+            for run_id, uuid, name, color, description in tags_q:
+                row = rows.get(run_id)
+                if row is not None:
+                    row.tags_obj.append(TagRow(uuid, name, color, description))
+
+    def _load(self, session):
+        rows = self._make_rows(self._query(session))
+        self._add_tags(session, rows)
+        self._rows = {row.hash: row for row in rows.values()}
+        self._invalidated.clear()
+        self._watermark = max((row.updated_at for row in self._rows.values() if row.updated_at), default=None)
+        self._sort()
+
+    def _update(self, session):
+        invalidated = self._invalidated
+        self._invalidated = set()
+        q = self._query(session)
+        updates = {}
+        if self._watermark is not None:
+            updates.update(self._make_rows(q.filter(RunModel.updated_at >= self._watermark - _WATERMARK_OVERLAP)))
+        for hashes in _chunks(invalidated):
+            updates.update(self._make_rows(q.filter(RunModel.hash.in_(hashes))))
+        if not updates and not invalidated:
+            return
+        self._add_tags(session, updates, list(updates.keys()))
+
+        added = False
+        for row in updates.values():
+            added = added or row.hash not in self._rows
+            self._rows[row.hash] = row
+            if row.updated_at and (self._watermark is None or row.updated_at > self._watermark):
+                self._watermark = row.updated_at
+        updated_hashes = {row.hash for row in updates.values()}
+        removed = False
+        for run_hash in invalidated - updated_hashes:
+            removed = self._rows.pop(run_hash, None) is not None or removed
+        if added or removed:
+            self._sort()
+
+    def _sort(self):
+        rows = sorted(self._rows.values(), key=lambda row: (row.created_at is not None, row.created_at),
+                      reverse=True)
+        self._hashes = [row.hash for row in rows]
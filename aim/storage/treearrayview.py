@@ -80,19 +80,14 @@ class TreeArrayView(ArrayView):
         return list(self.values())
 
     def sparse_numpy(self) -> Tuple[np.ndarray, np.ndarray]:
-        # TODO URGENT implement using cython
-        indices_list, values_list = self.sparse_list()
-        indices_array = np.array(indices_list, dtype=np.intp)
-        values_array = np.array(values_list, dtype=self.dtype)
-        return indices_array, values_array
+        return self.tree.items_numpy(dtype=self.dtype)
 
     def indices_numpy(self) -> np.ndarray:
-        # TODO URGENT implement using cython
-        return np.array(self.indices_list(), dtype=np.intp)
+        return self.tree.keys_numpy()
 
     def values_numpy(self) -> np.ndarray:
-        # TODO URGENT implement using cython
-        return np.array(self.values_list(), dtype=self.dtype)
+        _, values_array = self.tree.items_numpy(dtype=self.dtype)
+        return values_array
 
     def tolist(self) -> List[Any]:
         arr = self.tree[...]
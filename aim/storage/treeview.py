@@ -1,6 +1,10 @@
+import numpy as np
+
+from itertools import islice
+
 from aim.storage.types import AimObject, AimObjectKey, AimObjectPath
 
-from typing import TYPE_CHECKING, Any, Iterator, Tuple, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, Tuple, Union
 
 if TYPE_CHECKING:
     from aim.storage.arrayview import ArrayView
@@ -19,6 +23,13 @@ class TreeView:
     ):
         ...
 
+    def prefetch(
+        self,
+        *paths: Union[AimObjectKey, AimObjectPath]
+    ):
+        # Only the remote trees fetch the subtrees ahead of the reads
+        ...
+
     def subtree(self, path: Union[AimObjectKey, AimObjectPath]) -> 'TreeView':
         # Default to:
         return self.view(path, resolve=False)
@@ -44,6 +55,21 @@ class TreeView:
     ) -> AimObject:
         ...
 
+    def collect_many(
+        self,
+        paths: List[Union[AimObjectKey, AimObjectPath]],
+        strict: bool = True,
+        resolve_objects: bool = False,
+        default: Any = None
+    ) -> List[AimObject]:
+        values = []
+        for path in paths:
+            try:
+                values.append(self.collect(path, strict=strict, resolve_objects=resolve_objects))
+            except KeyError:
+                values.append(default)
+        return values
+
     def __getitem__(
         self,
         path: Union[AimObjectKey, AimObjectPath]
@@ -110,6 +136,58 @@ class TreeView:
     ]]:
         ...
 
+    def keys_numpy(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        n_items: int = None,
+        start: int = None,
+        stop: int = None
+    ) -> np.ndarray:
+        keys = _in_range(self.keys(path), start, stop, key=lambda k: k)
+        return np.array(list(islice(keys, n_items)), dtype=np.intp)
+
+    def items_numpy(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        dtype: Any = None,
+        n_items: int = None,
+        start: int = None,
+        stop: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        keys = []
+        values = []
+        items = _in_range(self.items(path), start, stop, key=lambda item: item[0])
+        for key, value in islice(items, n_items):
+            keys.append(key)
+            values.append(value)
+        return np.array(keys, dtype=np.intp), np.array(values, dtype=dtype)
+
+    def keys_numpy_at(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        targets: np.ndarray = None,
+        stop: int = None
+    ) -> np.ndarray:
+        if targets is None or not len(targets):
+            return np.array([], dtype=np.intp)
+        keys = self.keys_numpy(path, start=targets[0], stop=stop)
+        positions = np.unique(np.searchsorted(keys, targets))
+        return keys[positions[positions < len(keys)]]
+
+    def items_numpy_at(
+        self,
+        path: Union[AimObjectKey, AimObjectPath] = (),
+        targets: np.ndarray = None,
+        dtype: Any = None,
+        stop: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if targets is None or not len(targets):
+            return np.array([], dtype=np.intp), np.array([], dtype=dtype)
+        keys, values = self.items_numpy(path, dtype=dtype, start=targets[0], stop=stop)
+        positions = np.unique(np.searchsorted(keys, targets))
+        positions = positions[positions < len(keys)]
+        return keys[positions], values[positions]
+
     def array(
         self,
         path: Union[AimObjectKey, AimObjectPath] = (),
@@ -128,3 +206,13 @@ class TreeView:
         path: Union[AimObjectKey, AimObjectPath] = ()
     ) -> AimObjectKey:
         ...
+
+
+def _in_range(it, start, stop, key):
+    for item in it:
+        k = key(item)
+        if start is not None and k < start:
+            continue
+        if stop is not None and k >= stop:
+            break
+        yield item
@@ -1,12 +1,14 @@
 from aim.ext.transport.message_utils import ResourceObject, pack_args
 from aim.ext.transport.remote_resource import RemoteResourceAutoClean
 
+from copy import deepcopy
+
 from aim.storage.treeview import TreeView
 from aim.storage.treeutils import encode_tree
 from aim.storage.treearrayview import TreeArrayView
 from aim.storage.types import AimObject, AimObjectKey, AimObjectPath
 
-from typing import TYPE_CHECKING, Any, Iterator, Tuple, Union, List
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple, Union, List
 
 
 if TYPE_CHECKING:
@@ -17,7 +19,28 @@ class ProxyTreeAutoClean(RemoteResourceAutoClean):
     PRIORITY = 60
 
 
+_NOT_PREFETCHED = object()
+# the prefetched paths collected as `None`, either missing or set to `None`
+_NONE_PREFETCHED = object()
+
+
+def _normalize_path(path: Union[AimObjectKey, AimObjectPath]) -> AimObjectPath:
+    if path == Ellipsis:
+        return ()
+    if not isinstance(path, (tuple, list)):
+        return (path,)
+    return tuple(path)
+
+
 class ProxyTree(TreeView):
+    """Tree of the remote repository, accessed through the remote tracking server.
+
+    Every read is a round trip to the server. The subtrees fetched with :obj:`ProxyTree.prefetch`
+    are kept on the client side and serve the reads under their paths, until the subtree is
+    overwritten through this tree or :obj:`ProxyTree.drop_prefetched` is called.
+    The writes done by the other trees, in this or other clients, are not seen in the prefetched
+    subtrees, so those are meant for the short-lived reads, such as the ones of a query.
+    """
     def __init__(self, client: 'Client',
                  name: str,
                  sub: str,
@@ -31,6 +54,7 @@ class ProxyTree(TreeView):
 
         self._rpc_client = client
         self._hash = sub
+        self._prefetched: Dict[AimObjectPath, AimObject] = {}
 
         kwargs = {
             'name': name,
@@ -54,6 +78,65 @@ class ProxyTree(TreeView):
     def preload(self):
         self._rpc_client.run_instruction(self._hash, self._handler, 'preload')
 
+    def prefetch(
+        self,
+        *paths: Union[AimObjectKey, AimObjectPath]
+    ):
+        paths = [_normalize_path(path) for path in paths] or [()]
+        paths = [path for path in paths if not self._is_prefetched(path)]
+        if not paths:
+            return
+        for path, value in zip(paths, self.collect_many(paths)):
+            self._prefetched[path] = _NONE_PREFETCHED if value is None else value
+
+    def drop_prefetched(self):
+        self._prefetched.clear()
+
+    def _is_prefetched(self, path: AimObjectPath) -> bool:
+        if path in self._prefetched:
+            return True
+        try:
+            return self._get_prefetched(path) is not _NOT_PREFETCHED
+        except KeyError:
+            return True
+
+    def _get_prefetched(self, path: AimObjectPath):
+        for prefix, value in self._prefetched.items():
+            if path[:len(prefix)] != prefix:
+                continue
+            if value is _NONE_PREFETCHED:
+                # missing paths are not told apart from `None` values, so only the ones below are known
+                if path == prefix:
+                    return _NOT_PREFETCHED
+                raise KeyError('No key {} is present.'.format(path))
+            for key in path[len(prefix):]:
+                if isinstance(value, dict) or (isinstance(value, list) and isinstance(key, int)):
+                    try:
+                        value = value[key]
+                    except (KeyError, IndexError):
+                        raise KeyError('No key {} is present.'.format(path))
+                else:
+                    raise KeyError('No key {} is present.'.format(path))
+            return value
+        return _NOT_PREFETCHED
+
+    def _get_prefetched_tree(self, path: Union[AimObjectKey, AimObjectPath]) -> Optional[dict]:
+        if not self._prefetched:
+            return None
+        try:
+            value = self._get_prefetched(_normalize_path(path))
+        except KeyError:
+            return None
+        return value if isinstance(value, dict) else None
+
+    def _invalidate_prefetched(self, path: Union[AimObjectKey, AimObjectPath]):
+        if not self._prefetched:
+            return
+        path = _normalize_path(path)
+        for prefix in list(self._prefetched):
+            if prefix[:len(path)] == path or path[:len(prefix)] == prefix:
+                del self._prefetched[prefix]
+
     def view(
         self,
         path: Union[AimObjectKey, AimObjectPath],
@@ -70,6 +153,7 @@ class ProxyTree(TreeView):
         self,
         path: Union[AimObjectKey, AimObjectPath] = ()
     ):
+        self._invalidate_prefetched(path)
         self._rpc_client.run_instruction(self._hash, self._handler, 'make_array', (path,), is_write_only=True)
 
     def collect(
@@ -78,12 +162,28 @@ class ProxyTree(TreeView):
         strict: bool = True,
         resolve_objects: bool = False
     ) -> AimObject:
+        if self._prefetched and not resolve_objects:
+            value = self._get_prefetched(_normalize_path(path))
+            if value is not _NOT_PREFETCHED:
+                return deepcopy(value)
         return self._rpc_client.run_instruction(self._hash, self._handler, 'collect', (path, strict, resolve_objects))
 
+    def collect_many(
+        self,
+        paths: List[Union[AimObjectKey, AimObjectPath]],
+        strict: bool = True,
+        resolve_objects: bool = False,
+        default: Any = None
+    ) -> List[AimObject]:
+        paths = [_normalize_path(path) for path in paths]
+        return self._rpc_client.run_instruction(self._hash, self._handler, 'collect_many',
+                                                (paths, strict, resolve_objects, default))
+
     def __delitem__(
         self,
         path: Union[AimObjectKey, AimObjectPath]
     ):
+        self._invalidate_prefetched(path)
         self._rpc_client.run_instruction(self._hash, self._handler, '__delitem__', (path,), is_write_only=True)
 
     def set(
@@ -92,6 +192,7 @@ class ProxyTree(TreeView):
         value: AimObject,
         strict: bool = True
     ):
+        self._invalidate_prefetched(path)
         self._rpc_client.run_instruction(self._hash, self._handler, 'set', (path, value, strict), is_write_only=True)
 
     def __setitem__(
@@ -99,12 +200,16 @@ class ProxyTree(TreeView):
         path: Union[AimObjectKey, AimObjectPath],
         value: AimObject
     ):
+        self._invalidate_prefetched(path)
         self._rpc_client.run_instruction(self._hash, self._handler, '__setitem__', (path, value), is_write_only=True)
 
     def keys_eager(
             self,
             path: Union[AimObjectKey, AimObjectPath] = (),
     ) -> List[Union[AimObjectPath, AimObjectKey]]:
+        value = self._get_prefetched_tree(path)
+        if value is not None:
+            return list(value.keys())
         return self._rpc_client.run_instruction(self._hash, self._handler, 'keys_eager', (path,))
 
     def keys(
@@ -121,6 +226,9 @@ class ProxyTree(TreeView):
         AimObjectKey,
         AimObject
     ]]:
+        value = self._get_prefetched_tree(path)
+        if value is not None:
+            return list(deepcopy(value).items())
         return self._rpc_client.run_instruction(self._hash, self._handler, 'items_eager', (path,))
 
     def items(
@@ -187,6 +295,12 @@ class SubtreeView(TreeView):
     def preload(self):
         self.tree.preload()
 
+    def prefetch(
+        self,
+        *paths: Union[AimObjectKey, AimObjectPath]
+    ):
+        self.tree.prefetch(*(self.absolute_path(path) for path in paths or [()]))
+
     def view(
         self,
         path: Union[AimObjectKey, AimObjectPath],
@@ -208,6 +322,15 @@ class SubtreeView(TreeView):
     ) -> AimObject:
         return self.tree.collect(self.absolute_path(path), strict, resolve_objects)
 
+    def collect_many(
+        self,
+        paths: List[Union[AimObjectKey, AimObjectPath]],
+        strict: bool = True,
+        resolve_objects: bool = False,
+        default: Any = None
+    ) -> List[AimObject]:
+        return self.tree.collect_many([self.absolute_path(path) for path in paths], strict, resolve_objects, default)
+
     def __delitem__(
         self,
         path: Union[AimObjectKey, AimObjectPath]
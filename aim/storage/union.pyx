@@ -5,6 +5,7 @@ import aimrocks
 
 import cachetools.func
 
+from bisect import bisect_right
 from pathlib import Path
 
 from aim.storage.encoding import encode_path
@@ -12,7 +13,7 @@ from aim.storage.container import Container, ContainerItemsIterator
 from aim.storage.prefixview import PrefixView
 from aim.storage.rockscontainer import RocksContainer, optimize_db_for_read
 
-from typing import Dict, List, NamedTuple, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -85,8 +86,10 @@ class ItemsIterator(ContainerItemsIterator):
         while self._heap:
             alt = self._heap[0]
 
+            # the keys of a chunk shadow the keys of the other DBs within the chunk's prefix;
+            # the index (empty prefix) shadows the equal keys only
             if (
-                alt.key != key and (alt.prefix == prefix or not alt.key.startswith(prefix))
+                alt.key != key and (alt.prefix == prefix or not prefix or not alt.key.startswith(prefix))
             ):
                 break
 
@@ -151,6 +154,7 @@ class DB(object):
         self.db_name = db_name
         self.opts = opts
         self._dbs: Dict[bytes, aimrocks.DB] = dict()
+        self._chunks_prefix = encode_path((self.db_name, "chunks"))
 
     def _get_db(
         self,
@@ -176,7 +180,9 @@ class DB(object):
 
     @property
     @cachetools.func.ttl_cache(maxsize=None, ttl=0.1)
-    def dbs(self):
+    def _listing(self) -> Tuple[List[bytes], Dict[bytes, aimrocks.DB]]:
+        # The sorted prefixes of the chunks, for the lookup of the chunk by key, and the DBs.
+        # Both are returned as a single value, so that `route` never mixes two listings.
         index_prefix = encode_path((self.db_name, "chunks"))
         index_path = os.path.join(self.db_path, self.db_name, "index")
         try:
@@ -195,20 +201,47 @@ class DB(object):
             prefix = encode_path((self.db_name, "chunks", prefix))
             self._get_db(prefix, path, self._dbs, new_dbs)
 
+        # Chunk prefixes end with the path sentinel, so none of them is a prefix of another
+        prefixes = sorted(new_dbs)
         if index_db is not None:
             new_dbs[b""] = index_db
         self._dbs = new_dbs
-        return new_dbs
+        return prefixes, new_dbs
+
+    @property
+    def dbs(self) -> Dict[bytes, aimrocks.DB]:
+        return self._listing[1]
+
+    @classmethod
+    def invalidate_listing(cls):
+        """Drop the cached listing of the chunks, so that the chunks created since are seen."""
+        cls._list_dir.cache_clear()
+        cls._listing.fget.cache_clear()
+
+    def route(self, key: bytes) -> Optional[aimrocks.DB]:
+        """Returns the only DB which can hold the records with the given `key` prefix.
+
+        The records of a Run are either in its chunk, if the Run is in progress, or in the index.
+        Returns `None` if the key range is not limited to a single Run.
+        """
+        prefixes, dbs = self._listing
+        idx = bisect_right(prefixes, key) - 1
+        if idx >= 0 and key.startswith(prefixes[idx]):
+            return dbs[prefixes[idx]]
+        # `key` includes the whole `<hash>` path component, followed by the path sentinel
+        if key.startswith(self._chunks_prefix) and key.find(b'\xfe', len(self._chunks_prefix)) != -1:
+            return dbs.get(b"")
+        return None
 
     def close(self):
         ...
 
     def get(self, key: bytes, *args, **kwargs) -> bytes:
-        for prefix, db in self.dbs.items():
-            # Shadowing
-            if key.startswith(prefix):
-                return db.get(key)
-        return self.dbs[b""].get(key)
+        # Shadowing
+        db = self.route(key)
+        if db is None:
+            db = self.dbs[b""]
+        return db.get(key)
 
     def iteritems(
         self, *args, **kwargs
@@ -249,12 +282,24 @@ class RocksUnionContainer(RocksContainer):
 
         return self._db
 
+    @staticmethod
+    def invalidate_listing():
+        DB.invalidate_listing()
+
+    def items(
+        self,
+        prefix: bytes = b''
+    ) -> 'ContainerItemsIterator':
+        if prefix and self.db.route(prefix) is not None:
+            return RocksUnionSubContainer(container=self, domain=prefix).items(prefix)
+        return super().items(prefix)
+
     def view(
         self,
         prefix: bytes = b''
     ) -> 'Container':
         container = self
-        if prefix and prefix in self.db.dbs:
+        if prefix and self.db.route(prefix) is not None:
             container = RocksUnionSubContainer(container=self, domain=prefix)
         return PrefixView(prefix=prefix,
                           container=container)
@@ -267,8 +312,10 @@ class RocksUnionSubContainer(RocksContainer):
 
     @property
     def db(self) -> aimrocks.DB:
+        # routed on each access, as the Run may get finalized or resumed meanwhile
         db: DB = self._parent.db
-        return db.dbs.get(self.domain, db)
+        routed_db = db.route(self.domain)
+        return db if routed_db is None else routed_db
 
     def view(
         self,
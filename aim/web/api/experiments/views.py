@@ -1,5 +1,3 @@
-from datetime import timedelta
-from collections import Counter
 from fastapi import Request, HTTPException, Depends, Header
 from aim.web.api.utils import APIRouter  # wrapper for fastapi.APIRouter
 from typing import Optional
@@ -120,13 +118,15 @@ async def get_experiment_runs_api(exp_id: str,
 
     from aim.sdk.run import Run
 
-    cache_name = 'exp_runs'
-    project.repo.run_props_cache_hint = cache_name
-    project.repo.structured_db.invalidate_cache(cache_name)
-    project.repo.structured_db.init_cache(cache_name, exp.get_runs, lambda run_: run_.hash)
+    project.repo._prepare_runs_cache()
+    runs_cache = project.repo.structured_db.runs_cache
     exp_runs = []
 
-    run_hashes = [run.hash for run in exp.runs]
+    run_hashes = []
+    for run_hash in runs_cache.keys():
+        run_experiment = runs_cache[run_hash].experiment_obj
+        if run_experiment and run_experiment.uuid == exp.uuid:
+            run_hashes.append(run_hash)
     offset_idx = 0
     if offset:
         try:
@@ -146,9 +146,6 @@ async def get_experiment_runs_api(exp_id: str,
             'archived': run.archived
         })
 
-    project.repo.structured_db.invalidate_cache(cache_name)
-    project.repo.run_props_cache_hint = None
-
     response = {
         'id': exp.uuid,
         'runs': exp_runs
@@ -253,29 +250,8 @@ async def experiment_runs_activity_api(exp_id,
         raise HTTPException(status_code=404)
 
     with factory:
-        experiment = factory.find_experiment(exp_id)
-        if not experiment:
+        activity = factory.runs_activity(x_timezone_offset, exp_id, project.repo.list_active_runs())
+        if activity is None:
             raise HTTPException(status_code=404)
 
-        active_run_hashes = project.repo.list_active_runs()
-
-        num_runs = 0
-        num_archived_runs = 0
-        num_active_runs = 0
-        activity_counter = Counter()
-
-        for run in experiment.runs:
-            creation_time = run.created_at - timedelta(minutes=x_timezone_offset)
-            activity_counter[creation_time.strftime('%Y-%m-%dT%H:00:00')] += 1
-            num_runs += 1
-            if run.archived:
-                num_archived_runs += 1
-            if run.hash in active_run_hashes:
-                num_active_runs += 1
-
-        return {
-            'num_runs': num_runs,
-            'num_archived_runs': num_archived_runs,
-            'num_active_runs': num_active_runs,
-            'activity_map': dict(activity_counter),
-        }
+        return activity
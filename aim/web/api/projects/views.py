@@ -1,9 +1,9 @@
+import hashlib
 import os
-from datetime import timedelta
 from typing import Optional, Tuple
 
-from collections import Counter
 from fastapi import Depends, HTTPException, Query, Header
+from starlette.responses import Response
 from aim.web.api.utils import APIRouter  # wrapper for fastapi.APIRouter
 
 from aim.web.configs import AIM_PROJECT_SETTINGS_FILE
@@ -45,22 +45,14 @@ async def project_activity_api(x_timezone_offset: int = Header(default=0),
     if not project.exists():
         raise HTTPException(status_code=404)
 
-    num_runs = 0
-    num_archived_runs = 0
-    activity_counter = Counter()
-    for run in factory.runs():
-        creation_time = run.created_at - timedelta(minutes=x_timezone_offset)
-        activity_counter[creation_time.strftime('%Y-%m-%dT%H:00:00')] += 1
-        num_runs += 1
-        if run.archived:
-            num_archived_runs += 1
+    activity = factory.runs_activity(x_timezone_offset)
 
     return {
-        'num_experiments': len(factory.experiments()),
-        'num_runs': num_runs,
-        'num_archived_runs': num_archived_runs,
+        'num_experiments': factory.count_experiments(),
+        'num_runs': activity['num_runs'],
+        'num_archived_runs': activity['num_archived_runs'],
         'num_active_runs': len(project.repo.list_active_runs()),
-        'activity_map': dict(activity_counter),
+        'activity_map': activity['activity_map'],
     }
 
 
@@ -123,8 +115,10 @@ async def update_pinned_metrics_api(request_data: ProjectPinnedSequencesApiIn):
 
 
 @projects_router.get('/params/', response_model=ProjectParamsOut, response_model_exclude_defaults=True)
-async def project_params_api(sequence: Optional[Tuple[str, ...]] = Query(()),
-                             exclude_params: Optional[bool] = False):
+async def project_params_api(http_response: Response,
+                             sequence: Optional[Tuple[str, ...]] = Query(()),
+                             exclude_params: Optional[bool] = False,
+                             if_none_match: Optional[str] = Header(default=None)):
     project = Project()
 
     if not project.exists():
@@ -137,6 +131,17 @@ async def project_params_api(sequence: Optional[Tuple[str, ...]] = Query(()),
             raise HTTPException(status_code=400, detail=str(e))
     else:
         sequence = project.repo.available_sequence_types()
+
+    # the params and sequences are served from the repo catalog, unchanged until its generation changes
+    generation = project.repo.catalog_generation()
+    if generation is not None:
+        request_key = hashlib.blake2b(repr((sorted(sequence), exclude_params)).encode(), digest_size=8).hexdigest()
+        etag = f'"{generation}-{request_key}"'
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+        http_response.headers.update(headers)
+
     if exclude_params:
         response = {}
     else:
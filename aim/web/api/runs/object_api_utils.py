@@ -25,9 +25,9 @@ if TYPE_CHECKING:
     from aim.sdk.run import Run
 
 
-def get_blobs_batch(uri_batch: List[str], repo: 'Repo') -> Iterator[bytes]:
+def get_blobs_batch(uri_batch: List[str], repo: 'Repo', max_size: Optional[int] = None) -> Iterator[bytes]:
     uri_service = URIService(repo=repo)
-    batch_iterator = uri_service.request_batch(uri_batch=uri_batch)
+    batch_iterator = uri_service.request_batch(uri_batch=uri_batch, max_size=max_size)
     for it in batch_iterator:
         yield collect_streamable_data(encode_tree(it))
 
@@ -109,7 +109,7 @@ class CustomObjectApi:
     def get_total_record_range(self):
         return self._calculate_ranges()
 
-    async def search_result_streamer(self, skip_system: bool, report_progress: bool):
+    def search_result_streamer(self, skip_system: bool, report_progress: bool):
         def _pack_run_data(run_: 'Run', traces_: list):
             ranges = {
                 'record_range_used': self.record_range,
@@ -127,39 +127,35 @@ class CustomObjectApi:
                 }
             }
             return collect_streamable_data(encode_tree(run_dict))
-        try:
-            last_reported_progress_time = time.time()
-            run_info = None
-            progress_reports_sent = 0
-            for key in list(self.trace_cache.keys()):
-                run_info = self.trace_cache[key]
-                await asyncio.sleep(ASYNC_SLEEP_INTERVAL)
-                if report_progress and time.time() - last_reported_progress_time > AIM_PROGRESS_REPORT_INTERVAL:
-                    yield collect_streamable_data(encode_tree(
-                        {f'progress_{progress_reports_sent}_{PROGRESS_KEY_SUFFIX}': run_info['progress']}
-                    ))
+        last_reported_progress_time = time.time()
+        run_info = None
+        progress_reports_sent = 0
+        for key in list(self.trace_cache.keys()):
+            run_info = self.trace_cache[key]
+            if report_progress and time.time() - last_reported_progress_time > AIM_PROGRESS_REPORT_INTERVAL:
+                yield collect_streamable_data(encode_tree(
+                    {f'progress_{progress_reports_sent}_{PROGRESS_KEY_SUFFIX}': run_info['progress']}
+                ))
+                yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}':
+                                                           run_info['progress']}))
+                progress_reports_sent += 1
+                last_reported_progress_time = time.time()
+            if run_info.get('traces') and run_info.get('run'):
+                traces_list = []
+                for trace in run_info['traces']:
+                    traces_list.append(self._get_trace_info(trace, True, True))
+                yield _pack_run_data(run_info['run'], traces_list)
+                if report_progress:
                     yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}':
                                                                run_info['progress']}))
                     progress_reports_sent += 1
                     last_reported_progress_time = time.time()
-                if run_info.get('traces') and run_info.get('run'):
-                    traces_list = []
-                    for trace in run_info['traces']:
-                        traces_list.append(self._get_trace_info(trace, True, True))
-                    yield _pack_run_data(run_info['run'], traces_list)
-                    if report_progress:
-                        yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}':
-                                                                   run_info['progress']}))
-                        progress_reports_sent += 1
-                        last_reported_progress_time = time.time()
 
-                del self.trace_cache[key]
-            self.traces = None
-            if report_progress and run_info:
-                yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}':
-                                                           run_info['progress']}))
-        except asyncio.CancelledError:
-            pass
+            del self.trace_cache[key]
+        self.traces = None
+        if report_progress and run_info:
+            yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}':
+                                                       run_info['progress']}))
 
     async def requested_traces_streamer(self) -> List[dict]:
         try:
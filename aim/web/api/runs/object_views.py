@@ -1,13 +1,17 @@
+import asyncio
+import hashlib
+
 from typing import Optional, Dict, List
 
 from fastapi import HTTPException, Header
 from pydantic import BaseModel
-from starlette.responses import StreamingResponse
+from starlette.responses import Response, StreamingResponse
 
 from aim import Images, Texts, Distributions, Audios, Figures
 from aim.sdk.sequence import Sequence
 from aim.sdk.sequence_collection import QuerySequenceCollection
 from aim.sdk.types import QueryReportMode
+from aim.sdk.uri_service import URIService
 from aim.web.api.runs.pydantic_models import (
     RunTracesBatchApiIn,
     URIBatchIn,
@@ -24,10 +28,12 @@ from aim.web.api.runs.utils import (
     checked_query,
     checked_range,
     get_project_repo,
+    get_query_workers,
     numpy_to_encodable,
     get_run_or_404
 )
 from aim.web.api.runs.object_api_utils import CustomObjectApi, get_blobs_batch
+from aim.web.api.utils import get_streamer_executor, offload_streamer
 
 
 class CustomObjectApiConfig:
@@ -41,6 +47,11 @@ class CustomObjectApiConfig:
         if density <= 0:
             raise HTTPException(status_code=400, detail='Density must be greater than 0.')
 
+    @staticmethod
+    def check_max_size(max_size):
+        if max_size is not None and max_size <= 0:
+            raise HTTPException(status_code=400, detail='Max size must be greater than 0.')
+
     @classmethod
     def register_endpoints(cls, router):
         assert issubclass(cls.sequence_type, Sequence)
@@ -71,14 +82,18 @@ class CustomObjectApiConfig:
                                                      seq_cls=cls.sequence_type,
                                                      query=query,
                                                      report_mode=QueryReportMode.PROGRESS_TUPLE,
-                                                     timezone_offset=x_timezone_offset)
+                                                     timezone_offset=x_timezone_offset,
+                                                     workers=get_query_workers())
 
             api = CustomObjectApi(seq_name, resolve_blobs=cls.resolve_blobs)
             api.set_dump_data_fn(cls.dump_record_fn)
             api.set_trace_collection(query_iterator)
-            api.set_ranges(record_range, record_density, index_range, index_density)
+            # the ranges are calculated by iterating the query results, in the thread of the streamer
+            executor = get_streamer_executor()
+            await asyncio.wrap_future(executor.submit(
+                api.set_ranges, record_range, record_density, index_range, index_density))
             streamer = api.search_result_streamer(skip_system, report_progress)
-            return StreamingResponse(streamer)
+            return StreamingResponse(offload_streamer(streamer, executor))
 
         # run sequence batch API
         sequence_batch_endpoint = f'/{{run_id}}/{seq_name}/get-batch/'
@@ -108,8 +123,29 @@ class CustomObjectApiConfig:
             uri_batch_endpoint = f'/{seq_name}/get-batch'
 
             @router.post(uri_batch_endpoint)
-            def blobs_batch_api(uri_batch: URIBatchIn):
-                return StreamingResponse(get_blobs_batch(uri_batch, get_project_repo()))
+            def blobs_batch_api(uri_batch: URIBatchIn, max_size: Optional[int] = None):
+                CustomObjectApiConfig.check_max_size(max_size)
+                return StreamingResponse(get_blobs_batch(uri_batch, get_project_repo(), max_size))
+
+            # get single BLOB API, cacheable by the browsers and proxies
+            uri_endpoint = f'/{seq_name}/blob'
+
+            @router.get(uri_endpoint)
+            def blob_api(uri: str, max_size: Optional[int] = None,
+                         if_none_match: Optional[str] = Header(default=None)):
+                CustomObjectApiConfig.check_max_size(max_size)
+                data, final = URIService(repo=get_project_repo()).request(uri, max_size)
+                if not isinstance(data, bytes):
+                    raise HTTPException(status_code=404, detail='Requested resource is not a blob.')
+                etag = f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+                # the blobs of the Runs in progress may be overwritten, so those are revalidated
+                headers = {
+                    'ETag': etag,
+                    'Cache-Control': 'private, max-age=86400' if final else 'private, no-cache',
+                }
+                if if_none_match == etag:
+                    return Response(status_code=304, headers=headers)
+                return Response(content=data, media_type='application/octet-stream', headers=headers)
 
         # run sequence batch API
         step_of_sequence_endpoint = f'/{{run_id}}/{seq_name}/get-step/'
@@ -1,5 +1,6 @@
 import asyncio
 import numpy as np
+import os
 import random
 import struct
 import time
@@ -16,7 +17,7 @@ from aim.sdk import Run
 from aim.sdk.sequences.metric import Metric
 from aim.sdk.sequence_collection import SequenceCollection
 from aim.storage.query import syntax_error_check
-from aim.web.configs import AIM_PROGRESS_REPORT_INTERVAL
+from aim.web.configs import AIM_PROGRESS_REPORT_INTERVAL, AIM_QUERY_WORKERS_KEY
 from aim.web.api.projects.project import Project
 from aim.web.api.runs.pydantic_models import AlignedRunIn, TraceBase
 from aim.storage.treeutils import encode_tree
@@ -117,28 +118,28 @@ def numpy_to_encodable(array: np.ndarray) -> Optional[dict]:
     return encoded_numpy
 
 
-def collect_x_axis_data(x_trace: Metric, iters: np.ndarray) -> Tuple[Optional[dict], Optional[dict]]:
+def align_x_axis_data(x_trace: Metric, iters: np.ndarray) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
     if not x_trace:
         return None, None
 
-    x_axis_values = []
-    x_axis_iters = []
-    step_index_fn = x_trace.data.step_hash
-    for idx in iters:
-        try:
-            x_val = x_trace.values[step_index_fn(idx.item())]
-        except KeyError:
-            x_val = None
-        if x_val:
-            x_axis_iters.append(step_index_fn(idx.item()))
-            x_axis_values.append(x_val)
-
-    if not x_axis_iters:
+    iters = np.asarray(iters, dtype=np.int64)
+    x_axis_values = x_trace.data.values_at(iters)
+    # the steps with missing (or zero) values of the x-axis metric are not aligned
+    aligned = ~np.isnan(x_axis_values) & (x_axis_values != 0)
+    if not aligned.any():
+        return None, None
+
+    return iters[aligned], x_axis_values[aligned]
+
+
+def collect_x_axis_data(x_trace: Metric, iters: np.ndarray) -> Tuple[Optional[dict], Optional[dict]]:
+    x_axis_iters, x_axis_values = align_x_axis_data(x_trace, iters)
+    if x_axis_iters is None:
         return None, None
 
     return (
-        numpy_to_encodable(np.array(x_axis_iters, dtype='float64')),
-        numpy_to_encodable(np.array(x_axis_values, dtype='float64'))
+        numpy_to_encodable(x_axis_iters.astype('float64')),
+        numpy_to_encodable(x_axis_values)
     )
 
 
@@ -147,150 +148,193 @@ def collect_streamable_data(encoded_tree: Iterator[Tuple[bytes, bytes]]) -> byte
     return b''.join(result)
 
 
-async def custom_aligned_metrics_streamer(requested_runs: List[AlignedRunIn], x_axis: str, repo: 'Repo') -> bytes:
-    try:
-        for run_data in requested_runs:
-            await asyncio.sleep(ASYNC_SLEEP_INTERVAL)
-            run_hash = run_data.run_id
-            requested_traces = run_data.traces
-            run = Run(run_hash, repo=repo, read_only=True)
-
-            traces_list = []
-            for trace_data in requested_traces:
-                context = Context(trace_data.context)
-                trace = run.get_metric(name=trace_data.name,
-                                       context=context)
-                x_axis_trace = run.get_metric(name=x_axis,
-                                              context=context)
-                if not (trace and x_axis_trace):
-                    continue
-
-                iters = np.array(trace.data.sample(trace_data.slice[-1]).indices_list())
-                x_axis_iters, x_axis_values = collect_x_axis_data(x_axis_trace, iters)
-                traces_list.append({
-                    'name': trace.name,
-                    'context': trace.context.to_dict(),
-                    'x_axis_values': x_axis_values,
-                    'x_axis_iters': x_axis_iters,
-                })
-            run_dict = {
-                run_hash: traces_list
-            }
-            encoded_tree = encode_tree(run_dict)
-            yield collect_streamable_data(encoded_tree)
-    except asyncio.CancelledError:
-        pass
-
-
-async def metric_search_result_streamer(traces: SequenceCollection,
-                                        skip_system: bool,
-                                        steps_num: int,
-                                        x_axis: Optional[str] = None,
-                                        report_progress: Optional[bool] = True) -> bytes:
-    try:
-        last_reported_progress_time = time.time()
-        progress = None
-        progress_reports_sent = 0
-        for run_trace_collection, progress in traces.iter_runs():
-            await asyncio.sleep(ASYNC_SLEEP_INTERVAL)
-            if report_progress and time.time() - last_reported_progress_time > AIM_PROGRESS_REPORT_INTERVAL:
-                yield collect_streamable_data(encode_tree(
-                    {f'progress_{progress_reports_sent}_{PROGRESS_KEY_SUFFIX}': progress}
-                ))
-                progress_reports_sent += 1
-                last_reported_progress_time = time.time()
-
-            run = None
-            traces_list = []
-            for trace in run_trace_collection.iter():
-                if not run:
-                    run = run_trace_collection.run
-                iters, (values, epochs, timestamps) = trace.data.sample(steps_num).numpy()
+class ColumnarFrame:
+    """Binary columnar frame of the streamed search result.
+
+    The frame is a header, followed by the contiguous column buffers:
+
+        <header size: uint32 LE> <columns size: uint32 LE> <header> <zero padding> <columns>
+
+    The header is the tree of the result encoded as the default stream format, where each array is
+    replaced by the column description `{'type': 'column', 'dtype', 'shape', 'offset'}`, `offset` being
+    relative to the start of the columns. The header is zero padded to the multiple of 8 bytes (the
+    padding is not included in the header size), hence the columns of consecutive frames are 8 bytes
+    aligned and can be viewed as typed arrays without copying.
+    Integer columns are sent as little-endian int64, the rest as little-endian float64.
+    """
+    ALIGNMENT = 8
+
+    def __init__(self):
+        self.columns = []
+        self.columns_size = 0
+
+    def add_column(self, array: Optional[np.ndarray]) -> Optional[dict]:
+        if array is None or array.dtype == 'object':
+            return None
+        if array.dtype.kind in 'iub':
+            dtype, array = 'int64', np.ascontiguousarray(array, dtype='<i8')
+        else:
+            dtype, array = 'float64', np.ascontiguousarray(array, dtype='<f8')
+        column = {
+            'type': 'column',
+            'dtype': dtype,
+            'shape': array.shape[0],
+            'offset': self.columns_size,
+        }
+        self.columns.append(memoryview(array).cast('B'))
+        self.columns_size += array.nbytes
+        return column
+
+    def encode(self, tree: dict) -> bytes:
+        header = collect_streamable_data(encode_tree(tree))
+        padding = -len(header) % self.ALIGNMENT
+        # column buffers are copied once, directly into the frame
+        return b''.join([struct.pack('<II', len(header), self.columns_size),
+                         header, bytes(padding), *self.columns])
+
+
+def custom_aligned_metrics_streamer(requested_runs: List[AlignedRunIn], x_axis: str,
+                                    repo: 'Repo') -> Iterator[bytes]:
+    for run_data in requested_runs:
+        run_hash = run_data.run_id
+        requested_traces = run_data.traces
+        run = Run(run_hash, repo=repo, read_only=True)
+
+        traces_list = []
+        for trace_data in requested_traces:
+            context = Context(trace_data.context)
+            trace = run.get_metric(name=trace_data.name,
+                                   context=context)
+            x_axis_trace = run.get_metric(name=x_axis,
+                                          context=context)
+            if not (trace and x_axis_trace):
+                continue
 
-                x_axis_trace = run.get_metric(x_axis, trace.context) if x_axis else None
+            iters = np.array(trace.data.sample(trace_data.slice[-1]).indices_list())
+            x_axis_iters, x_axis_values = collect_x_axis_data(x_axis_trace, iters)
+            traces_list.append({
+                'name': trace.name,
+                'context': trace.context.to_dict(),
+                'x_axis_values': x_axis_values,
+                'x_axis_iters': x_axis_iters,
+            })
+        run_dict = {
+            run_hash: traces_list
+        }
+        encoded_tree = encode_tree(run_dict)
+        yield collect_streamable_data(encoded_tree)
+
+
+def metric_search_result_streamer(traces: SequenceCollection,
+                                  skip_system: bool,
+                                  steps_num: int,
+                                  x_axis: Optional[str] = None,
+                                  report_progress: Optional[bool] = True,
+                                  columnar: Optional[bool] = False) -> Iterator[bytes]:
+    def encode(tree: dict, frame: Optional[ColumnarFrame] = None) -> bytes:
+        if columnar:
+            return (frame or ColumnarFrame()).encode(tree)
+        return collect_streamable_data(encode_tree(tree))
+
+    last_reported_progress_time = time.time()
+    progress = None
+    progress_reports_sent = 0
+    for run_trace_collection, progress in traces.iter_runs():
+        if report_progress and time.time() - last_reported_progress_time > AIM_PROGRESS_REPORT_INTERVAL:
+            yield encode({f'progress_{progress_reports_sent}_{PROGRESS_KEY_SUFFIX}': progress})
+            progress_reports_sent += 1
+            last_reported_progress_time = time.time()
+
+        run = None
+        frame = ColumnarFrame() if columnar else None
+        traces_list = []
+        for trace in run_trace_collection.iter():
+            if not run:
+                run = run_trace_collection.run
+            iters, (values, epochs, timestamps) = trace.data.sample(steps_num).numpy()
+
+            x_axis_trace = run.get_metric(x_axis, trace.context) if x_axis else None
+            if columnar:
+                encodable = frame.add_column
+                x_axis_iters, x_axis_values = map(encodable, align_x_axis_data(x_axis_trace, iters))
+            else:
+                encodable = numpy_to_encodable
                 x_axis_iters, x_axis_values = collect_x_axis_data(x_axis_trace, iters)
 
-                traces_list.append({
-                    'name': trace.name,
-                    'context': trace.context.to_dict(),
-                    'slice': [0, 0, steps_num],  # TODO [AT] change once UI is ready
-                    'values': numpy_to_encodable(values),
-                    'iters': numpy_to_encodable(iters),
-                    'epochs': numpy_to_encodable(epochs),
-                    'timestamps': numpy_to_encodable(timestamps),
-                    'x_axis_values': x_axis_values,
-                    'x_axis_iters': x_axis_iters,
-                })
-
-            if run:
-                run_dict = {
-                    run.hash: {
-                        'params': get_run_params(run, skip_system=skip_system),
-                        'traces': traces_list,
-                        'props': get_run_props(run)
-                    }
-                }
-
-                encoded_tree = encode_tree(run_dict)
-                yield collect_streamable_data(encoded_tree)
-                if report_progress:
-                    yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}': progress}))
-                    progress_reports_sent += 1
-                    last_reported_progress_time = time.time()
-
-        if report_progress and progress:
-            yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}': progress}))
-    except asyncio.CancelledError:
-        pass
-
-
-async def run_search_result_streamer(runs: SequenceCollection,
-                                     limit: int,
-                                     skip_system: bool,
-                                     report_progress: Optional[bool] = True,
-                                     exclude_params: Optional[bool] = False,
-                                     exclude_traces: Optional[bool] = False) -> bytes:
-    try:
-        run_count = 0
-        last_reported_progress_time = time.time()
-        progress = None
-        progress_reports_sent = 0
-        for run_trace_collection, progress in runs.iter_runs():
-            await asyncio.sleep(ASYNC_SLEEP_INTERVAL)
-            # if no progress was reported for a long interval, report progress
-            if report_progress and time.time() - last_reported_progress_time > AIM_PROGRESS_REPORT_INTERVAL:
-                yield collect_streamable_data(encode_tree(
-                    {f'progress_{progress_reports_sent}_{PROGRESS_KEY_SUFFIX}': progress}
-                ))
-                progress_reports_sent += 1
-                last_reported_progress_time = time.time()
-            if not run_trace_collection:
-                continue
-            run = run_trace_collection.run
+            traces_list.append({
+                'name': trace.name,
+                'context': trace.context.to_dict(),
+                'slice': [0, 0, steps_num],  # TODO [AT] change once UI is ready
+                'values': encodable(values),
+                'iters': encodable(iters),
+                'epochs': encodable(epochs),
+                'timestamps': encodable(timestamps),
+                'x_axis_values': x_axis_values,
+                'x_axis_iters': x_axis_iters,
+            })
+
+        if run:
             run_dict = {
                 run.hash: {
+                    'params': get_run_params(run, skip_system=skip_system),
+                    'traces': traces_list,
                     'props': get_run_props(run)
                 }
             }
-            if not exclude_params:
-                run_dict[run.hash]['params'] = get_run_params(run, skip_system=skip_system)
-            if not exclude_traces:
-                run_dict[run.hash]['traces'] = run.collect_sequence_info(sequence_types='metric')
 
-            encoded_tree = encode_tree(run_dict)
-            yield collect_streamable_data(encoded_tree)
+            yield encode(run_dict, frame)
             if report_progress:
-                yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}': progress}))
+                yield encode({f'progress_{progress_reports_sent}': progress})
                 progress_reports_sent += 1
                 last_reported_progress_time = time.time()
-            run_count += 1
-            if limit and run_count >= limit:
-                break
 
-        if report_progress and progress:
+    if report_progress and progress:
+        yield encode({f'progress_{progress_reports_sent}': progress})
+
+
+def run_search_result_streamer(runs: SequenceCollection,
+                               limit: int,
+                               skip_system: bool,
+                               report_progress: Optional[bool] = True,
+                               exclude_params: Optional[bool] = False,
+                               exclude_traces: Optional[bool] = False) -> Iterator[bytes]:
+    run_count = 0
+    last_reported_progress_time = time.time()
+    progress = None
+    progress_reports_sent = 0
+    for run_trace_collection, progress in runs.iter_runs():
+        # if no progress was reported for a long interval, report progress
+        if report_progress and time.time() - last_reported_progress_time > AIM_PROGRESS_REPORT_INTERVAL:
+            yield collect_streamable_data(encode_tree(
+                {f'progress_{progress_reports_sent}_{PROGRESS_KEY_SUFFIX}': progress}
+            ))
+            progress_reports_sent += 1
+            last_reported_progress_time = time.time()
+        if not run_trace_collection:
+            continue
+        run = run_trace_collection.run
+        run_dict = {
+            run.hash: {
+                'props': get_run_props(run)
+            }
+        }
+        if not exclude_params:
+            run_dict[run.hash]['params'] = get_run_params(run, skip_system=skip_system)
+        if not exclude_traces:
+            run_dict[run.hash]['traces'] = run.collect_sequence_info(sequence_types='metric')
+
+        encoded_tree = encode_tree(run_dict)
+        yield collect_streamable_data(encoded_tree)
+        if report_progress:
             yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}': progress}))
-    except asyncio.CancelledError:
-        pass
+            progress_reports_sent += 1
+            last_reported_progress_time = time.time()
+        run_count += 1
+        if limit and run_count >= limit:
+            break
+
+    if report_progress and progress:
+        yield collect_streamable_data(encode_tree({f'progress_{progress_reports_sent}': progress}))
 
 
 async def run_active_result_streamer(repo: 'Repo', report_progress: Optional[bool] = True):
@@ -429,6 +473,10 @@ def get_project_repo():
     return project.repo
 
 
+def get_query_workers() -> int:
+    return int(os.environ.get(AIM_QUERY_WORKERS_KEY, 1))
+
+
 def checked_query(q: str):
     query = q.strip()
     try:
@@ -19,6 +19,7 @@ from aim.web.api.runs.utils import (
     convert_nan_and_inf_to_str,
     custom_aligned_metrics_streamer,
     get_project_repo,
+    get_query_workers,
     get_run_or_404,
     get_run_params,
     get_run_props,
@@ -47,7 +48,7 @@ from aim.web.api.runs.pydantic_models import (
     StructuredRunsArchivedOut,
     NoteIn,
 )
-from aim.web.api.utils import object_factory
+from aim.web.api.utils import object_factory, offload_streamer
 
 runs_router = APIRouter()
 
@@ -75,12 +76,13 @@ async def run_search_api(q: Optional[str] = '',
                                       paginated=bool(limit),
                                       offset=offset,
                                       report_mode=QueryReportMode.PROGRESS_TUPLE,
-                                      timezone_offset=x_timezone_offset)
+                                      timezone_offset=x_timezone_offset,
+                                      workers=get_query_workers())
 
     streamer = run_search_result_streamer(runs, limit,
                                           skip_system, report_progress,
                                           exclude_params, exclude_traces)
-    return StreamingResponse(streamer)
+    return StreamingResponse(offload_streamer(streamer))
 
 
 @runs_router.post('/search/metric/align/', response_model=RunMetricCustomAlignApiOut)
@@ -90,7 +92,7 @@ async def run_metric_custom_align_api(request_data: MetricAlignApiIn):
     requested_runs = request_data.runs
 
     streamer = custom_aligned_metrics_streamer(requested_runs, x_axis_metric_name, repo)
-    return StreamingResponse(streamer)
+    return StreamingResponse(offload_streamer(streamer))
 
 
 @runs_router.get('/search/metric/', response_model=RunMetricSearchApiOut,
@@ -100,6 +102,7 @@ async def run_metric_search_api(q: Optional[str] = '',
                                 x_axis: Optional[str] = None,
                                 skip_system: Optional[bool] = True,
                                 report_progress: Optional[bool] = True,
+                                columnar: Optional[bool] = False,
                                 x_timezone_offset: int = Header(default=0),):
     from aim.sdk.sequences.metric import Metric
     from aim.sdk.sequence_collection import QuerySequenceCollection
@@ -117,10 +120,11 @@ async def run_metric_search_api(q: Optional[str] = '',
                                      seq_cls=Metric,
                                      query=query,
                                      report_mode=QueryReportMode.PROGRESS_TUPLE,
-                                     timezone_offset=x_timezone_offset,)
+                                     timezone_offset=x_timezone_offset,
+                                     workers=get_query_workers())
 
-    streamer = metric_search_result_streamer(traces, skip_system, steps_num, x_axis, report_progress)
-    return StreamingResponse(streamer)
+    streamer = metric_search_result_streamer(traces, skip_system, steps_num, x_axis, report_progress, columnar)
+    return StreamingResponse(offload_streamer(streamer))
 
 
 @runs_router.get('/active/', response_model=RunActiveOut)
@@ -200,6 +204,7 @@ async def add_run_tag_api(run_id: str, tag_in: StructuredRunAddTagIn, factory=De
 
         run.add_tag(tag_in.tag_name)
         tag = next(iter(factory.search_tags(tag_in.tag_name)))
+    factory.runs_cache.invalidate(run.hash)
     return {
         'id': run.hash,
         'tag_id': tag.uuid,
@@ -216,6 +221,7 @@ async def remove_run_tag_api(run_id: str, tag_id: str, factory=Depends(object_fa
             raise HTTPException(status_code=404)
 
         removed = run.remove_tag(tag.name)
+    factory.runs_cache.invalidate(run.hash)
 
     return {
         'id': run.hash,
@@ -111,10 +111,7 @@ async def get_tagged_runs_api(tag_id: str, factory=Depends(object_factory)):
 
     from aim.sdk.run import Run
 
-    cache_name = 'tag_runs'
-    project.repo.run_props_cache_hint = cache_name
-    project.repo.structured_db.invalidate_cache(cache_name)
-    project.repo.structured_db.init_cache(cache_name, tag.get_runs, lambda run_: run_.hash)
+    project.repo._prepare_runs_cache()
 
     tag_runs = []
     for tagged_run in tag.runs:
@@ -127,9 +124,6 @@ async def get_tagged_runs_api(tag_id: str, factory=Depends(object_factory)):
             'experiment': tagged_run.experiment if tagged_run.experiment else None
         })
 
-    project.repo.structured_db.invalidate_cache(cache_name)
-    project.repo.run_props_cache_hint = None
-
     response = {
         'id': tag.uuid,
         'runs': tag_runs
@@ -1,12 +1,22 @@
+import asyncio
 import datetime
+import itertools
 import pytz
 
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import APIRouter as FastAPIRouter
 from fastapi import HTTPException
 from fastapi.types import DecoratedCallable
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional
+
+from aim.web.configs import AIM_STREAMER_WORKERS
+
+_streamer_executors: List[ThreadPoolExecutor] = None
+_next_streamer_executor = itertools.count()
+_STREAM_END = object()
 
 
 def object_factory():
@@ -22,6 +32,49 @@ def datetime_now():
     return datetime.datetime.utcnow().replace(tzinfo=pytz.utc)
 
 
+def get_streamer_executor() -> ThreadPoolExecutor:
+    """Get one of the single-thread executors of the streamer threads pool, in round-robin order.
+
+    The work submitted to the returned executor is done in the same thread, so that objects bound
+    to the thread (e.g. the structured DB `scoped_session`) stay valid across the steps.
+    """
+    global _streamer_executors
+    if _streamer_executors is None:
+        _streamer_executors = [ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'aim-streamer-{i}')
+                               for i in range(AIM_STREAMER_WORKERS)]
+    return _streamer_executors[next(_next_streamer_executor) % len(_streamer_executors)]
+
+
+async def offload_streamer(
+    streamer: Iterator[bytes],
+    executor: Optional[ThreadPoolExecutor] = None
+) -> AsyncIterator[bytes]:
+    """Iterate the blocking `streamer` in the bounded pool of streamer threads.
+
+    Storage reads and encoding of the streamed data are done in the worker threads, so that the
+    event loop keeps serving other requests. The next chunk is produced while the current one is
+    being sent, hence at most one chunk is produced ahead of the client. All the steps of the
+    `streamer` are done in the same pool thread, interleaved with the steps of the other streamers
+    pinned to that thread.
+    If the response is cancelled, the `streamer` is closed as soon as its current step is done.
+    The `executor` must be given if the objects used by the `streamer` were created in one of the
+    streamer threads.
+    """
+    if executor is None:
+        executor = get_streamer_executor()
+    pending = executor.submit(next, streamer, _STREAM_END)
+    try:
+        while True:
+            chunk = await asyncio.wrap_future(pending)
+            if chunk is _STREAM_END:
+                break
+            pending = executor.submit(next, streamer, _STREAM_END)
+            yield chunk
+    finally:
+        # a running generator can not be closed, the executor runs the close after the current step
+        executor.submit(streamer.close)
+
+
 class APIRouter(FastAPIRouter):
     def api_route(
         self, path: str, *, include_in_schema: bool = True, **kwargs: Any
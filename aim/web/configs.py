@@ -8,5 +8,7 @@ AIM_UI_MOUNTED_REPO_PATH = '__AIM_UI_MOUNT_REPO_PATH__'
 AIM_UI_BASE_PATH = '__AIM_UI_BASE_PATH__'
 AIM_PROXY_URL = '__AIM_PROXY_URL__'
 AIM_PROFILER_KEY = '__AIM_PROFILER_ENABLED__'
+AIM_QUERY_WORKERS_KEY = '__AIM_QUERY_WORKERS__'
 AIM_PROGRESS_REPORT_INTERVAL = 0.5
+AIM_STREAMER_WORKERS = 8
 AIM_PROJECT_SETTINGS_FILE = '.project_settings'
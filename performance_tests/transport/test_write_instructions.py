@@ -0,0 +1,45 @@
+import gc
+import shutil
+import tempfile
+
+from parameterized import parameterized
+
+from performance_tests.base import TestBase
+from performance_tests.utils import get_baseline, write_baseline
+from performance_tests.transport.utils import INSTRUCTIONS_COUNT, start_tracking_server, write_instructions
+
+from aim.ext.transport.config import AIM_CLIENT_QUEUE_DEFAULT_COALESCE_SIZE
+
+TRACKING_SERVER_PORT = 53850
+
+
+class TestWriteInstructionsThroughput(TestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo_path = tempfile.mkdtemp()
+        cls.server = start_tracking_server(cls.repo_path, TRACKING_SERVER_PORT)
+        cls.remote_repo_path = f'aim://localhost:{TRACKING_SERVER_PORT}'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        # release the remote resources of the closed Runs while the server is running
+        gc.collect()
+        cls.server.terminate()
+        cls.server.wait()
+        shutil.rmtree(cls.repo_path, ignore_errors=True)
+        super().tearDownClass()
+
+    @parameterized.expand([
+        ('single', 0),
+        ('coalesced', AIM_CLIENT_QUEUE_DEFAULT_COALESCE_SIZE),
+    ])
+    def test_write_instructions(self, mode, coalesce_size):
+        execution_time = write_instructions(self.remote_repo_path, coalesce_size)
+        print(f'{mode} write instructions: {INSTRUCTIONS_COUNT / execution_time:.0f} instructions/s')
+        test_name = f'test_write_instructions_{mode}'
+        baseline = get_baseline(test_name)
+        if baseline:
+            self.assertInRange(execution_time, baseline)
+        else:
+            write_baseline(test_name, execution_time)
@@ -0,0 +1,37 @@
+import socket
+import subprocess
+import sys
+import time
+
+from aim import Repo, Run
+
+from performance_tests.utils import timing
+
+INSTRUCTIONS_COUNT = 5000
+
+
+def start_tracking_server(repo_path, port):
+    Repo.from_path(repo_path, init=True)
+    server = subprocess.Popen([sys.executable, '-c', 'from aim.cli.cli import cli_entry_point; cli_entry_point()',
+                               'server', '--repo', repo_path, '--port', str(port)],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('localhost', port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.5)
+    server.kill()
+    raise RuntimeError(f'Aim Remote Tracking server did not start on port {port}.')
+
+
+@timing(3)
+def write_instructions(remote_repo_path, coalesce_size):
+    run = Run(repo=remote_repo_path, system_tracking_interval=None, capture_terminal_logs=False)
+    queue = run.repo._client.get_queue(run.hash)
+    queue.coalesce_size = coalesce_size
+    for i in range(INSTRUCTIONS_COUNT):
+        run.meta_run_tree['bench', str(i)] = {'value': i}
+    queue.wait_for_finish()
+    run.close()
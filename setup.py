@@ -143,6 +143,7 @@ CYTHON_SCRITPS = [
     ('aim.storage.hashing', 'aim/storage/hashing/__init__.py'),
     ('aim.storage.encoding.encoding_native', 'aim/storage/encoding/encoding_native.pyx'),
     ('aim.storage.encoding.encoding', 'aim/storage/encoding/encoding.pyx'),
+    ('aim.storage.encoding.encoding_numpy', 'aim/storage/encoding/encoding_numpy.pyx'),
     ('aim.storage.encoding', 'aim/storage/encoding/__init__.py'),
     ('aim.storage.treeutils', 'aim/storage/treeutils.pyx'),
     ('aim.storage.rockscontainer', 'aim/storage/rockscontainer.pyx'),
@@ -42,6 +42,25 @@ class TestProjectApi(PrefilledDataApiTestBase):
         self.assertIn('run_index', data['params'])
         self.assertIn('start_time', data['params'])
 
+    def test_project_params_api_etag(self):
+        client = self.client
+        response = client.get('/api/projects/params', params={'sequence': 'metric'})
+        self.assertEqual(200, response.status_code)
+        etag = response.headers['ETag']
+        response = client.get('/api/projects/params', params={'sequence': 'metric'}, headers={'If-None-Match': etag})
+        self.assertEqual(304, response.status_code)
+
+        run = Run(system_tracking_interval=None)
+        run['catalog_param'] = {'nested': 1}
+        run.track(1., name='catalog_metric', context={'subset': 'catalog'})
+        response = client.get('/api/projects/params', params={'sequence': 'metric'}, headers={'If-None-Match': etag})
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers['ETag'])
+        data = response.json()
+        self.assertIn('nested', data['params']['catalog_param'])
+        self.assertListEqual([{'subset': 'catalog'}], data['metric']['catalog_metric'])
+        run.close()
+
 
 class TestProjectParamsWithImagesApi(ApiTestBase):
     @classmethod
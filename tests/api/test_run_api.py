@@ -1,12 +1,16 @@
+import asyncio
+import threading
+
 import pytest
 import numpy as np
 from parameterized import parameterized
 
 from tests.base import PrefilledDataApiTestBase, ApiTestBase
-from tests.utils import decode_encoded_tree_stream
+from tests.utils import decode_columnar_stream, decode_encoded_tree_stream
 
 from aim.storage.treeutils import decode_tree
 from aim.sdk.run import Run
+from aim.web.api.utils import offload_streamer
 
 
 class TestRunApi(PrefilledDataApiTestBase):
@@ -103,6 +107,34 @@ class TestRunApi(PrefilledDataApiTestBase):
                 self.assertAlmostEqual(0.99, array[step_count - 1])
                 self.assertEqual(step_count, len(array))
 
+    def test_search_metrics_api_columnar(self):
+        client = self.client
+
+        query = self.isolated_query_patch('run["name"] in ["Run # 2","Run # 3"]')
+        params = {'q': query, 'p': 10, 'x_axis': 'accuracy', 'report_progress': False}
+        response = client.get('/api/runs/search/metric/', params=params)
+        expected = decode_tree(decode_encoded_tree_stream(response.iter_bytes(chunk_size=512 * 1024)))
+
+        response = client.get('/api/runs/search/metric/', params={**params, 'columnar': True})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(0, len(response.content) % 8)
+        frames = list(decode_columnar_stream(response.iter_bytes(chunk_size=512 * 1024)))
+        self.assertEqual(2, len(frames))
+        decoded_response = {run_hash: run for frame in frames for run_hash, run in frame.items()}
+        self.assertEqual(expected.keys(), decoded_response.keys())
+        for run_hash, run in decoded_response.items():
+            self.assertEqual(expected[run_hash]['params'], run['params'])
+            self.assertEqual(len(expected[run_hash]['traces']), len(run['traces']))
+            for expected_trace, trace in zip(expected[run_hash]['traces'], run['traces']):
+                self.assertEqual(expected_trace['name'], trace['name'])
+                self.assertEqual(np.int64, trace['iters'].dtype)
+                for key in ('values', 'iters', 'timestamps', 'x_axis_values', 'x_axis_iters'):
+                    if expected_trace[key] is None:
+                        self.assertIsNone(trace[key])
+                        continue
+                    expected_array = np.frombuffer(expected_trace[key]['blob'], dtype='float64')
+                    np.testing.assert_array_equal(expected_array, trace[key])
+
     def test_search_aligned_metrics_api(self):
         client = self.client
         run_hashes = []
@@ -241,3 +273,34 @@ class TestRunInfoApi(ApiTestBase):
         self.assertEqual(1, len(run_props['tags']))
         self.assertEqual('Long description for tag', run_props['tags'][0]['description'])
 
+
+class TestStreamerOffload(ApiTestBase):
+    def test_chunks_produced_in_streamer_threads(self):
+        def streamer():
+            for idx in range(3):
+                yield f'{idx}:{threading.current_thread().name}'.encode()
+
+        async def collect():
+            return [chunk async for chunk in offload_streamer(streamer())]
+
+        chunks = asyncio.run(collect())
+        self.assertListEqual([b'0', b'1', b'2'], [chunk.split(b':')[0] for chunk in chunks])
+        self.assertTrue(all(chunk.split(b':')[1].startswith(b'aim-streamer') for chunk in chunks))
+
+    def test_cancelled_streamer_is_closed(self):
+        closed = threading.Event()
+
+        def streamer():
+            try:
+                while True:
+                    yield b'chunk'
+            finally:
+                closed.set()
+
+        async def consume_one():
+            stream = offload_streamer(streamer())
+            self.assertEqual(b'chunk', await stream.__anext__())
+            await stream.aclose()
+
+        asyncio.run(consume_one())
+        self.assertTrue(closed.wait(timeout=5))
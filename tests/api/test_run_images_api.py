@@ -1,12 +1,17 @@
 from parameterized import parameterized
+from PIL import Image as PILImage
+from io import BytesIO
 import random
 
+from unittest import mock
+
 from tests.base import ApiTestBase
 from tests.utils import decode_encoded_tree_stream, generate_image_set
 
 from aim.storage.treeutils import decode_tree
 from aim.storage.context import Context
 from aim.sdk.run import Run
+from aim.sdk.uri_service import URIService, blob_cache
 
 
 class TestNoImagesRunQueryApi(ApiTestBase):
@@ -209,7 +214,7 @@ class RunImagesURIBulkLoadApi(RunImagesTestBase):
     @parameterized.expand([(1,), (5,), (10,)])
     def test_images_uri_bulk_load_api(self, uri_count):
         # take random N URIs
-        uris = random.sample(self.uri_map.keys(), uri_count)
+        uris = random.sample(list(self.uri_map.keys()), uri_count)
 
         client = self.client
         response = client.post('/api/runs/images/get-batch', json=uris)
@@ -220,6 +225,69 @@ class RunImagesURIBulkLoadApi(RunImagesTestBase):
             expected_blob = self.image_blobs[self.uri_map[uri]]
             self.assertEqual(expected_blob, blob)
 
+    def test_images_uri_bulk_load_thumbnails(self):
+        uris = list(self.uri_map.keys())[:5]
+
+        client = self.client
+        response = client.post('/api/runs/images/get-batch', json=uris, params={'max_size': 8})
+        self.assertEqual(200, response.status_code)
+        decoded_response = decode_tree(decode_encoded_tree_stream(response.iter_bytes(chunk_size=512 * 1024)))
+        self.assertEqual(5, len(decoded_response))
+        for blob in decoded_response.values():
+            thumbnail = PILImage.open(BytesIO(blob))
+            self.assertEqual((8, 8), thumbnail.size)
+            self.assertEqual('PNG', thumbnail.format)
+
+        response = client.post('/api/runs/images/get-batch', json=uris, params={'max_size': 0})
+        self.assertEqual(400, response.status_code)
+
+    def test_image_blob_api(self):
+        uri, caption = next(iter(self.uri_map.items()))
+
+        client = self.client
+        response = client.get('/api/runs/images/blob', params={'uri': uri})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(self.image_blobs[caption], response.content)
+        etag = response.headers['ETag']
+
+        response = client.get('/api/runs/images/blob', params={'uri': uri}, headers={'If-None-Match': etag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b'', response.content)
+
+        response = client.get('/api/runs/images/blob', params={'uri': uri, 'max_size': 4})
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers['ETag'])
+        self.assertEqual((4, 4), PILImage.open(BytesIO(response.content)).size)
+
+
+class TestFinishedRunImageBlobApi(ApiTestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        run = cls.create_run(repo=cls.repo, system_tracking_interval=None)
+        run.track(generate_image_set(img_count=1, img_size=(32, 32)), name='images')
+        cls.run_hash = run.hash
+        run.close()
+        del run
+
+    def test_finished_run_blob_cache(self):
+        client = self.client
+        params = {'q': f'run.hash == "{self.run_hash}"', 'report_progress': False}
+        response = client.get('/api/runs/search/images/', params=params)
+        decoded_response = decode_tree(decode_encoded_tree_stream(response.iter_bytes(chunk_size=512 * 1024)))
+        uri = decoded_response[self.run_hash]['traces'][0]['values'][0][0]['blob_uri']
+
+        blob_cache.clear()
+        response = client.get('/api/runs/images/blob', params={'uri': uri, 'max_size': 16})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('private, max-age=86400', response.headers['Cache-Control'])
+        self.assertEqual((16, 16), PILImage.open(BytesIO(response.content)).size)
+        # the blobs of the finished Runs are served from the cache
+        with mock.patch.object(URIService, '_get_container', side_effect=AssertionError):
+            cached_response = client.get('/api/runs/images/blob', params={'uri': uri, 'max_size': 16})
+        self.assertEqual(response.content, cached_response.content)
+        self.assertEqual(response.headers['ETag'], cached_response.headers['ETag'])
+
 
 class TestRunImagesBatchApi(RunImagesTestBase):
     def test_run_images_bulk_load_api(self):
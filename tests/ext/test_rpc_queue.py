@@ -0,0 +1,56 @@
+import threading
+import unittest
+
+from aim.ext.transport.rpc_queue import RpcQueueWithRetry
+
+
+class TestRpcQueueCoalescing(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _task(self, *instructions):
+        self.calls.append(instructions)
+
+    def _other_task(self, *instructions):
+        self.calls.append(('other',) + instructions)
+
+    def _register_tasks(self, queue, tasks):
+        # hold the worker until all tasks are registered
+        with self.lock:
+            queue.register_task(self, self._blocking_task, [])
+            for task_f, instructions in tasks:
+                queue.register_task(self, task_f, instructions)
+        queue.wait_for_finish()
+        self.assertEqual(0, queue.current_memory_usage)
+        return self.calls[1:]
+
+    def _blocking_task(self, *instructions):
+        with self.lock:
+            self.calls.append(instructions)
+
+    def test_coalesce_pending_tasks(self):
+        queue = RpcQueueWithRetry('test', max_queue_memory=1024, coalesce_size=6)
+        first, second, third, fourth = ([(b'k%d' % i, b'v')] for i in range(4))
+        calls = self._register_tasks(queue, [
+            (self._task, first),
+            (self._task, second),
+            (self._task, third),
+            (self._other_task, fourth),
+            (self._task, first),
+        ])
+        self.assertListEqual([
+            (first, second),  # coalesce size limit is reached
+            (third,),
+            ('other', fourth),
+            (first,),
+        ], calls)
+        queue.stop()
+
+    def test_no_coalescing(self):
+        queue = RpcQueueWithRetry('test', max_queue_memory=1024)
+        first, second = ([(b'k%d' % i, b'v')] for i in range(2))
+        calls = self._register_tasks(queue, [(self._task, first), (self._task, second)])
+        self.assertListEqual([(first,), (second,)], calls)
+        queue.stop()
@@ -0,0 +1,75 @@
+import threading
+import unittest
+from contextlib import contextmanager
+
+from aim.ext.task_queue.queue import TaskQueue
+
+
+class Tracker:
+    def __init__(self, events):
+        self.events = events
+        self.values = []
+
+    def track(self, value):
+        self.values.append(value)
+
+    @contextmanager
+    def batch(self):
+        self.events.append(('start', self))
+        yield
+        self.events.append(('end', self))
+
+
+class TestTaskQueue(unittest.TestCase):
+    def test_per_object_order(self):
+        events = []
+        trackers = [Tracker(events) for _ in range(4)]
+        task_queue = TaskQueue('test', num_workers=3, max_backlog=10_000, max_batch_size=50,
+                               batch_context=lambda tracker: tracker.batch())
+        for value in range(500):
+            for tracker in trackers:
+                task_queue.register_task(tracker.track, value)
+        task_queue.wait_for_finish()
+
+        for tracker in trackers:
+            self.assertListEqual(list(range(500)), tracker.values)
+        stats = task_queue.stats
+        self.assertEqual(0, stats['queue_depth'])
+        self.assertEqual(2000, stats['tasks'])
+        self.assertLessEqual(stats['max_batch_size'], 50)
+        self.assertEqual(2000 / stats['batches'], stats['avg_batch_size'])
+        task_queue.stop_workers()
+
+    def test_batch_context(self):
+        events = []
+        first, second = Tracker(events), Tracker(events)
+        task_queue = TaskQueue('test', max_backlog=100, max_batch_size=10,
+                               batch_context=lambda tracker: tracker.batch())
+        started, registered = threading.Event(), threading.Event()
+
+        def wait():
+            started.set()
+            registered.wait()
+
+        # hold the worker until all the tasks are registered
+        task_queue.register_task(wait)
+        started.wait()
+        for tracker in (first, first, second, first):
+            task_queue.register_task(tracker.track, 1)
+        registered.set()
+        task_queue.wait_for_finish()
+
+        self.assertListEqual([('start', first), ('end', first),
+                              ('start', second), ('end', second),
+                              ('start', first), ('end', first)], events)
+        task_queue.stop_workers()
+
+    def test_failed_task(self):
+        events = []
+        tracker = Tracker(events)
+        task_queue = TaskQueue('test', max_backlog=100, max_batch_size=10)
+        task_queue.register_task(tracker.track)  # missing argument
+        task_queue.register_task(tracker.track, 1)
+        task_queue.wait_for_finish()
+        self.assertListEqual([1], tracker.values)
+        task_queue.stop_workers()
@@ -0,0 +1,80 @@
+import os
+
+from tests.base import TestBase
+
+from aim.sdk.catalog import RepoCatalog
+from aim.sdk.index_manager import RepoIndexManager
+from aim.sdk.repo import Repo
+from aim.storage import encoding as E
+
+
+class TestRepoCatalog(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.repo.catalog.invalidate()
+        # a catalog not shared with the Runs of this process, as the ones of the other processes
+        self.catalog = RepoCatalog(self.repo.path)
+
+    def _params(self):
+        return self.catalog.tree('attrs', self.repo._get_meta_tree, strict=False)
+
+    def _check_collected(self, name, strict=True):
+        def paths(tree, path=()):
+            # the example types of the params set by several Runs may come from any of them
+            if not isinstance(tree, dict) or '__example_type__' in tree:
+                return {path}
+            return {path}.union(*(paths(val, path + (key,)) for key, val in tree.items()))
+
+        # a Repo not sharing the containers opened before the Run was closed
+        collected = Repo(self.repo.root_path)._get_meta_tree().collect(name, strict=strict)
+        self.assertSetEqual(paths(collected), paths(self.catalog.tree(name, self.repo._get_meta_tree, strict=strict)))
+
+    def test_incremental_updates(self):
+        run = self.create_run(system_tracking_interval=None)
+        run['hparams'] = {'lr': 0.1}
+        generation = self.catalog.generation(self.repo._get_meta_tree)
+        self.assertIn('lr', self._params()['hparams'])
+
+        run['hparams', 'batch_size'] = 16
+        run.set(('catalog', 'tags'), ['a', 'b'])
+        run.track(1, name='loss', context={'subset': 'val'})
+        self.assertNotEqual(generation, self.catalog.generation(self.repo._get_meta_tree))
+        self.assertEqual({'lr', 'batch_size'}, set(self._params()['hparams']))
+        traces_types = self.catalog.tree('traces_types', self.repo._get_meta_tree)
+        ctx_id, = (ctx_id for ctx_id, seqs in traces_types['int'].items() if 'loss' in seqs)
+        self.assertEqual({'subset': 'val'}, self.catalog.tree('contexts', self.repo._get_meta_tree)[ctx_id])
+        run.close()
+
+        self._check_collected('attrs', strict=False)
+        self._check_collected('traces_types')
+        self._check_collected('contexts')
+
+    def test_partial_record(self):
+        self._params()
+        key = E.encode_path(('attrs', 'partial'))
+        value = E.encode(1)
+        record = RepoCatalog._RECORD_HEADER.pack(len(key), len(value)) + key + value
+        with open(self.catalog.log_path, 'ab') as fh:
+            fh.write(record[:-1])
+        self.assertNotIn('partial', self._params())
+        with open(self.catalog.log_path, 'ab') as fh:
+            fh.write(record[-1:])
+        self.assertIn('partial', self._params())
+
+    def test_rebuild(self):
+        # the records written without the catalog are added once the Run is indexed
+        run = self.create_run(system_tracking_interval=None)
+        self._params()
+        generation = self.catalog.generation(self.repo._get_meta_tree)
+        run.meta_attrs_tree['not_cataloged'] = 1
+        run.meta_run_attrs_tree['not_cataloged'] = 1
+        run.close()
+        self.assertEqual(generation, self.catalog.generation(self.repo._get_meta_tree))
+        self.assertNotIn('not_cataloged', self._params())
+        RepoIndexManager.get_index_manager(self.repo).index(run.hash)
+        self.assertIn('not_cataloged', self._params())
+
+        self.catalog.invalidate()
+        os.remove(self.catalog.log_path)
+        self.assertNotEqual(generation, self.catalog.generation(self.repo._get_meta_tree))
+        self.assertIn('not_cataloged', self._params())
@@ -0,0 +1,70 @@
+import tempfile
+
+from pathlib import Path
+from unittest import mock
+
+from parameterized import parameterized
+
+from tests.base import TestBase
+
+from aim.sdk.reporter import CheckIn
+from aim.sdk.reporter.check_in_index import CheckInIndex, Inotify
+from aim.sdk.reporter.file_manager import LocalFileManager
+
+
+class TestCheckInIndex(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.check_ins_dir = Path(tempfile.mkdtemp())
+
+    def _touch(self, run_hash, idx, flag_name='check_in'):
+        name = CheckIn.generate_filename(run_hash=run_hash, idx=idx, flag_name=flag_name,
+                                         absolute_time=1.0, expect_next_in=0)
+        (self.check_ins_dir / name).touch()
+        return name
+
+    @parameterized.expand([
+        (True,),
+        (False,),
+    ])
+    def test_external_changes(self, use_inotify):
+        if use_inotify and not Inotify.available():
+            self.skipTest('inotify is not available')
+        index = CheckInIndex(self.check_ins_dir, use_inotify=use_inotify)
+        self._touch('run1', 1)
+        with mock.patch.object(CheckInIndex, 'POLL_INTERVAL', 0):
+            self.assertIsNone(index.latest('run1', 'finished'))
+            self.assertEqual(use_inotify, index.event_driven)
+
+            self._touch('run1', 2)
+            finished = self._touch('run1', 3, 'finished')
+            second = self._touch('run2', 1)
+            (self.check_ins_dir / 'unrelated').touch()
+            self.assertEqual(finished, index.latest('run1', 'finished'))
+            self.assertEqual({'run1', 'run2'}, set(index.latest_by_run('check_in')))
+
+            (self.check_ins_dir / second).unlink()
+            self.assertIsNone(index.latest('run2', 'check_in'))
+            self.assertEqual(3, len(index.run_check_ins('run1')))
+
+    def test_missing_directory(self):
+        index = CheckInIndex(self.check_ins_dir / 'check_ins')
+        self.assertIsNone(index.latest('run1', 'check_in'))
+        (self.check_ins_dir / 'check_ins').mkdir()
+        index.refresh()
+        self.check_ins_dir = self.check_ins_dir / 'check_ins'
+        name = self._touch('run1', 1)
+        with mock.patch.object(CheckInIndex, 'POLL_INTERVAL', 0):
+            self.assertEqual(name, index.latest('run1', 'check_in'))
+
+    def test_file_manager(self):
+        file_mgr = LocalFileManager(self.check_ins_dir)
+        for idx in range(1, 4):
+            CheckIn(idx=idx).touch(file_mgr=file_mgr, run_hash='run1')
+        CheckIn(idx=1, flag_name='finished').touch(file_mgr=file_mgr, run_hash='run1')
+
+        self.assertEqual(3, CheckIn.poll(file_mgr=file_mgr, run_hash='run1').idx)
+        # the older check-ins are cleaned up
+        self.assertEqual(2, len(list(file_mgr.base_dir.iterdir())))
+        self.assertEqual(2, len(file_mgr.check_ins.run_check_ins('run1')))
+        self.assertIs(file_mgr.check_ins, LocalFileManager(self.check_ins_dir).check_ins)
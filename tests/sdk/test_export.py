@@ -0,0 +1,79 @@
+import json
+import tempfile
+
+from unittest import mock
+
+from tests.base import TestBase
+
+from aim.sdk import export
+from aim.sdk.types import QueryReportMode
+
+
+class TestArrowExport(TestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.run_hashes = []
+        for i in range(3):
+            run = cls.create_run(system_tracking_interval=None)
+            run['hparams'] = {'idx': i}
+            run.add_tag('export')
+            for step in range(10):
+                run.track(step * i, name='loss', step=step, epoch=step // 5)
+            run.track(1.5, name='accuracy', context={'subset': 'val'})
+            cls.run_hashes.append(run.hash)
+            run.close()
+
+    def test_metrics_to_arrow(self):
+        import pyarrow as pa
+
+        query = self.isolated_query_patch()
+        table = self.repo.query_metrics(query, report_mode=QueryReportMode.DISABLED).to_arrow().read_all()
+        self.assertEqual(3 * 11, table.num_rows)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('run.hash').type))
+
+        rows = table.to_pylist()
+        for idx, run_hash in enumerate(self.run_hashes):
+            loss = [row for row in rows if row['run.hash'] == run_hash and row['metric.name'] == 'loss']
+            self.assertListEqual(list(range(10)), [row['idx'] for row in loss])
+            self.assertListEqual(list(range(10)), [row['step'] for row in loss])
+            self.assertListEqual([step * idx for step in range(10)], [row['value'] for row in loss])
+            self.assertListEqual([step // 5 for step in range(10)], [row['epoch'] for row in loss])
+            self.assertEqual(idx, json.loads(loss[0]['run.params'])['hparams']['idx'])
+            self.assertEqual({}, json.loads(loss[0]['metric.context']))
+
+            accuracy, = (row for row in rows if row['run.hash'] == run_hash and row['metric.name'] == 'accuracy')
+            self.assertEqual({'subset': 'val'}, json.loads(accuracy['metric.context']))
+            self.assertIsNone(accuracy['epoch'])
+            self.assertIsNotNone(accuracy['time'].tzinfo)
+
+    def test_metrics_only_last(self):
+        query = self.isolated_query_patch('metric.name == "loss"')
+        table = self.repo.query_metrics(query, report_mode=QueryReportMode.DISABLED).to_arrow(
+            only_last=True, include_run=False, include_context=False).read_all()
+        self.assertListEqual(['metric.name', 'idx', 'step', 'value', 'epoch', 'time'], table.schema.names)
+        self.assertListEqual([9, 9, 9], table.column('step').to_pylist())
+        self.assertListEqual([0, 9, 18], sorted(table.column('value').to_pylist()))
+
+    def test_runs_to_parquet(self):
+        import pyarrow.parquet as pq
+
+        path = tempfile.mktemp(suffix='.parquet')
+        query = self.isolated_query_patch()
+        with mock.patch.object(export, 'RUNS_PER_BATCH', 2):
+            n_rows = self.repo.query_runs(query, report_mode=QueryReportMode.DISABLED).to_parquet(path)
+        self.assertEqual(3, n_rows)
+
+        parquet_file = pq.ParquetFile(path)
+        self.assertEqual(2, parquet_file.num_row_groups)
+        rows = {row['hash']: row for row in parquet_file.read().to_pylist()}
+        self.assertSetEqual(set(self.run_hashes), set(rows))
+        for idx, run_hash in enumerate(self.run_hashes):
+            self.assertListEqual(['export'], rows[run_hash]['tags'])
+            self.assertFalse(rows[run_hash]['active'])
+            self.assertIsNotNone(rows[run_hash]['end_time'])
+            self.assertEqual(idx, json.loads(rows[run_hash]['params'])['hparams']['idx'])
+
+    def test_unsupported_sequences(self):
+        with self.assertRaises(ValueError):
+            self.repo.query_images(self.isolated_query_patch()).to_arrow()
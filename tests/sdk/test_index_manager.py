@@ -0,0 +1,53 @@
+from unittest import mock
+
+from parameterized import parameterized
+
+from tests.base import TestBase
+
+from aim.sdk.index_manager import RepoIndexManager
+from aim.sdk.repo import Repo
+from aim.storage import rockscontainer
+
+
+class TestRepoIndexManager(TestBase):
+    def _create_runs(self, count):
+        run_hashes = []
+        for i in range(count):
+            run = self.create_run(system_tracking_interval=None)
+            run['hparams'] = {'idx': i, 'batch_size': 32}
+            for step in range(20):
+                run.track(step * i, name='loss', step=step)
+            run_hashes.append(run.hash)
+            run.close()
+            del run
+        return run_hashes
+
+    @parameterized.expand([
+        (1,),
+        (2,),
+    ])
+    def test_index_runs(self, workers):
+        index_manager = RepoIndexManager.get_index_manager(self.repo)
+        run_hashes = self._create_runs(3)
+        for run_hash in run_hashes:
+            self.assertTrue(index_manager.run_needs_indexing(run_hash))
+
+        with mock.patch.object(rockscontainer, 'FINALIZE_BATCH_SIZE', 4), \
+                mock.patch.object(RepoIndexManager, 'RUNS_PER_LOCK', 2):
+            self.assertListEqual(run_hashes, list(index_manager.index_runs(run_hashes, workers=workers)))
+
+        index_tree = self.repo._get_index_tree('meta', 0).subtree(('meta', 'chunks'))
+        for idx, run_hash in enumerate(run_hashes):
+            self.assertFalse(index_manager.run_needs_indexing(run_hash))
+            run_tree = self.repo.request_tree('meta', run_hash, read_only=True).subtree(('meta', 'chunks', run_hash))
+            expected = run_tree.collect()
+            indexed = index_tree.subtree(run_hash).collect()
+            self.assertIsNotNone(indexed.pop('end_time'))
+            expected.pop('end_time', None)
+            self.assertDictEqual(expected, indexed)
+            self.assertEqual(idx, indexed['attrs']['hparams']['idx'])
+
+        # already indexed Runs are skipped, and their storage is not optimized
+        with mock.patch.object(Repo, '_optimize_run') as optimize_run:
+            self.assertListEqual([], list(index_manager.index_runs(run_hashes, optimize=True)))
+        optimize_run.assert_not_called()
@@ -0,0 +1,101 @@
+import tempfile
+
+from unittest import mock
+
+from parameterized import parameterized
+
+from tests.base import TestBase
+
+from aim.sdk.catalog import RepoCatalog
+from aim.sdk.repo import Repo
+from aim.sdk.types import QueryReportMode
+from aim.storage import rockscontainer
+from aim.storage.context import Context
+
+
+class TestRepoCopyRuns(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dest_repo = Repo(tempfile.mkdtemp(), init=True)
+
+    def _create_runs(self, count):
+        run_hashes = []
+        for i in range(count):
+            run = self.create_run(system_tracking_interval=None)
+            run.name = f'run {i}'
+            run.add_tag('copied')
+            run['hparams'] = {'idx': i, 'batch_size': 32}
+            for step in range(50):
+                run.track(step * i, name='loss', step=step, epoch=step // 10)
+            run.track(0.5 * i, name='accuracy', context={'subset': 'train'})
+            run_hashes.append(run.hash)
+            run.close()
+            del run
+        return run_hashes
+
+    def _check_dest_runs(self, run_hashes):
+        for idx, run_hash in enumerate(run_hashes):
+            run = self.dest_repo.get_run(run_hash)
+            self.assertIsNotNone(run)
+            self.assertEqual(f'run {idx}', run.name)
+            self.assertListEqual(['copied'], run.tags)
+            self.assertEqual(idx, run['hparams', 'idx'])
+            self.assertIsNotNone(run.end_time)
+            metric = run.get_metric('loss', Context({}))
+            self.assertListEqual([step * idx for step in range(50)], metric.values.values_list())
+            self.assertListEqual([step // 10 for step in range(50)], metric.epochs.values_list())
+            self.assertEqual(0.5 * idx, run.get_metric('accuracy', Context({'subset': 'train'})).values.last_value())
+        self.assertSetEqual(set(run_hashes), set(self.dest_repo.list_all_runs()))
+        query = 'run.hparams.batch_size == 32'
+        runs = self.dest_repo.query_runs(query, report_mode=QueryReportMode.DISABLED).iter_runs()
+        self.assertSetEqual(set(run_hashes), {run_collection.run.hash for run_collection in runs})
+
+    @parameterized.expand([
+        (1,),
+        (2,),
+    ])
+    def test_copy_runs(self, workers):
+        run_hashes = self._create_runs(3)
+        with mock.patch.object(rockscontainer, 'COPY_BATCH_BYTES', 256):
+            self.assertEqual((True, []), self.repo.copy_runs(run_hashes, self.dest_repo, workers=workers))
+
+        self._check_dest_runs(run_hashes)
+        for run_hash in run_hashes:
+            self.assertIsNotNone(self.repo.get_run(run_hash))
+
+    @parameterized.expand([
+        (True,),
+        (False,),
+    ])
+    def test_move_runs(self, same_filesystem):
+        run_hashes = self._create_runs(2)
+        with mock.patch.object(Repo, '_can_rename_run', return_value=False) if not same_filesystem \
+                else mock.patch.object(Repo, '_copy_run_chunks', side_effect=AssertionError):
+            self.assertEqual((True, []), self.repo.move_runs(run_hashes, self.dest_repo, workers=2))
+
+        self._check_dest_runs(run_hashes)
+        for run_hash in run_hashes:
+            self.assertIsNone(self.repo.get_run(run_hash))
+            self.assertFalse(self.repo.structured_db.find_run(run_hash))
+
+    def test_copy_locked_run(self):
+        run = self.create_run(system_tracking_interval=None)
+        run.track(1, name='loss')
+        self.assertEqual((False, [run.hash]), self.repo.copy_runs([run.hash], self.dest_repo))
+        self.assertEqual((False, [run.hash]), self.repo.move_runs([run.hash], self.dest_repo))
+        self.assertIsNone(self.dest_repo.get_run(run.hash))
+        run.close()
+
+    def test_failed_move_leaves_no_dest_index(self):
+        run_hash, = self._create_runs(1)
+        with mock.patch.object(Repo, '_can_rename_run', return_value=True), \
+                mock.patch.object(RepoCatalog, 'append_container', side_effect=RuntimeError):
+            self.assertEqual((False, [run_hash]), self.repo.move_runs([run_hash], self.dest_repo))
+
+        self.assertIsNotNone(self.repo.get_run(run_hash))
+        self.assertFalse(self.dest_repo.structured_db.find_run(run_hash))
+        dest_index = self.dest_repo._get_index_tree('meta', timeout=10)
+        self.assertNotIn(run_hash, list(dest_index.subtree(('meta', 'chunks')).keys()))
+        query = 'run.hparams.batch_size == 32'
+        runs = self.dest_repo.query_runs(query, report_mode=QueryReportMode.DISABLED).iter_runs()
+        self.assertListEqual([], [run_collection.run.hash for run_collection in runs])
@@ -1,7 +1,9 @@
+import sys
 import time
 
 from tests.base import TestBase
 
+from aim.ext.resource.tracker import LogBuffer
 from aim.sdk.types import QueryReportMode
 from aim.sdk import Run
 
@@ -57,3 +59,26 @@ class TestRunResourceTracker(TestBase):
         self.assertIsNone(run._system_resource_tracker)
         run = Run(system_tracking_interval=2 * 24 * 3600, capture_terminal_logs=False)  # two days
         self.assertIsNone(run._system_resource_tracker)
+
+    def test_terminal_logs_capture(self):
+        run = Run(system_tracking_interval=None, capture_terminal_logs=True)
+        for i in range(5):
+            sys.stdout.write(f'line {i}\n')
+        sys.stdout.write('progress 10%\rprogress 100%')
+        run_hash = run.hash
+        run.close()
+        del run
+
+        logs = Run(run_hash, read_only=True).get_terminal_logs()
+        steps, (lines, *_) = logs.data.items_list()
+        self.assertListEqual(list(range(6)), steps)
+        self.assertListEqual([f'line {i}' for i in range(5)] + ['progress 100%'], [line.data for line in lines])
+
+    def test_log_buffer_size_limit(self):
+        buffer = LogBuffer(max_size=8)
+        for chunk in (b'abc', b'def', b'ghi'):
+            buffer.write(chunk)
+        # the oldest chunk is dropped
+        self.assertEqual(1, buffer.dropped)
+        self.assertEqual(b'defghi', buffer.read())
+        self.assertEqual(b'', buffer.read())
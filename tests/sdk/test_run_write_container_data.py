@@ -1,12 +1,13 @@
 import os
+import numpy as np
 
 from tests.base import TestBase
 
 from aim.sdk import Run
+from aim.sdk.tracker import STEP_KEY_OFFSET
 from aim.storage.context import Context
 from aim.storage.containertreeview import ContainerTreeView
 from aim.storage.rockscontainer import RocksContainer
-from aim.storage.hashing import hash_auto
 
 
 class TestRunContainerData(TestBase):
@@ -97,10 +98,9 @@ class TestRunContainerData(TestBase):
         series_container_path = os.path.join(self.repo.path, 'seqs', 'chunks', run.hash)
         rc = RocksContainer(series_container_path, read_only=True)
         tree = ContainerTreeView(rc)
-        trace = tree.view(('seqs', 'v2', 'chunks', run.hash, Context({}).idx, 'metric 1'))
-        self.assertSetEqual({'step', 'val', 'epoch', 'time'}, set(trace.keys()))
-        steps = sorted(trace.array('step').values_list())
-        vals = trace.array('val').values_list()
+        trace = tree.view(('seqs', 'v3', 'chunks', run.hash, Context({}).idx, 'metric 1'))
+        self.assertSetEqual({'val', 'epoch', 'time', 'lod'}, set(trace.keys()))
+        steps, vals = trace.array('val').sparse_list()
         epochs = trace.array('epoch').values_list()
         times = trace.array('time').values_list()
 
@@ -109,10 +109,8 @@ class TestRunContainerData(TestBase):
         self.assertEqual(3, len(epochs))
         self.assertEqual(3, len(times))
 
-        self.assertListEqual([0, 1, 2], steps)
-        self.assertEqual(1.0, trace.array('val')[hash_auto(steps[0])])
-        self.assertEqual(2.0, trace.array('val')[hash_auto(steps[1])])
-        self.assertEqual(3.0, trace.array('val')[hash_auto(steps[2])])
+        self.assertListEqual([STEP_KEY_OFFSET + step for step in (0, 1, 2)], steps)
+        self.assertListEqual([1.0, 2.0, 3.0], vals)
 
         # user-specified steps
         run = Run()
@@ -123,23 +121,11 @@ class TestRunContainerData(TestBase):
         series_container_path = os.path.join(self.repo.path, 'seqs', 'chunks', run.hash)
         rc = RocksContainer(series_container_path, read_only=True)
         tree = ContainerTreeView(rc)
-        trace = tree.view(('seqs', 'v2', 'chunks', run.hash, Context({}).idx, 'metric 1'))
-        steps = sorted(trace.array('step').values_list())
-        vals = trace.array('val').values_list()
-        epochs = trace.array('epoch').values_list()
-        times = trace.array('time').values_list()
+        trace = tree.view(('seqs', 'v3', 'chunks', run.hash, Context({}).idx, 'metric 1'))
+        self.assertTupleEqual(([STEP_KEY_OFFSET + step for step in (10, 20, 30)], [1.0, 2.0, 3.0]),
+                              trace.array('val').sparse_list())
 
-        self.assertEqual(3, len(steps))
-        self.assertEqual(3, len(vals))
-        self.assertEqual(3, len(epochs))
-        self.assertEqual(3, len(times))
-
-        self.assertListEqual([10, 20, 30], steps)
-        self.assertEqual(1.0, trace.array('val')[hash_auto(steps[0])])
-        self.assertEqual(2.0, trace.array('val')[hash_auto(steps[1])])
-        self.assertEqual(3.0, trace.array('val')[hash_auto(steps[2])])
-
-        # user-specified steps, unordered
+        # user-specified steps, unordered; stored in step order
         run = Run()
         run.track(3.0, name='metric 1', step=30, context={})
         run.track(1.0, name='metric 1', step=10, context={})
@@ -148,9 +134,8 @@ class TestRunContainerData(TestBase):
         series_container_path = os.path.join(self.repo.path, 'seqs', 'chunks', run.hash)
         rc = RocksContainer(series_container_path, read_only=True)
         tree = ContainerTreeView(rc)
-        trace = tree.view(('seqs', 'v2', 'chunks', run.hash, Context({}).idx, 'metric 1'))
-        steps = sorted(trace.array('step').values_list())
-        vals = trace.array('val').values_list()
+        trace = tree.view(('seqs', 'v3', 'chunks', run.hash, Context({}).idx, 'metric 1'))
+        steps, vals = trace.array('val').sparse_list()
         epochs = trace.array('epoch').values_list()
         times = trace.array('time').values_list()
 
@@ -159,10 +144,8 @@ class TestRunContainerData(TestBase):
         self.assertEqual(3, len(epochs))
         self.assertEqual(3, len(times))
 
-        self.assertListEqual([10, 20, 30], steps)
-        self.assertEqual(1.0, trace.array('val')[hash_auto(steps[0])])
-        self.assertEqual(2.0, trace.array('val')[hash_auto(steps[1])])
-        self.assertEqual(3.0, trace.array('val')[hash_auto(steps[2])])
+        self.assertListEqual([STEP_KEY_OFFSET + step for step in (10, 20, 30)], steps)
+        self.assertListEqual([1.0, 2.0, 3.0], vals)
 
     def test_run_set_param_meta_tree(self):
         run = Run()
@@ -242,3 +225,47 @@ class TestRunContainerData(TestBase):
         val = meta_run_attrs_tree['p8']
         self.assertEqual(bytes, type(val))
         self.assertEqual(b'blob', val)
+
+    def test_batched_tracking(self):
+        run = Run(repo=self.repo, system_tracking_interval=None)
+        run.track(5.0, name='metric', step=0)
+        ctx_idx = Context({}).idx
+        with run._tracker.batch():
+            for step in range(1, 10):
+                run.track(float(step % 7), name='metric', step=step)
+            # the sequence summary is written once the batch is done
+            self.assertEqual(0, run.meta_run_tree['traces', ctx_idx, 'metric', 'last_step'])
+        traces = run.meta_run_tree['traces', ctx_idx, 'metric']
+        self.assertEqual(9, traces['last_step'])
+        self.assertEqual(2.0, traces['last'])
+        self.assertEqual(0.0, traces['min'])
+        self.assertEqual(6.0, traces['max'])
+        steps, (values, _, _) = run.get_metric('metric', Context({})).data.numpy()
+        self.assertListEqual(list(range(10)), steps.tolist())
+        self.assertListEqual([5.0] + [float(step % 7) for step in range(1, 10)], values.tolist())
+
+    def test_track_many(self):
+        run = Run(repo=self.repo, system_tracking_interval=None)
+        run.track(1.0, name='metric', step=0, context={'subset': 'train'})
+        run.track_many('metric', np.array([3.0, -2.0, 0.5]), context={'subset': 'train'})
+        run.track_many('metric', [4, 5], steps=np.array([10, 20]), epochs=[1, 2], context={'subset': 'train'})
+        ctx = Context({'subset': 'train'})
+        traces = run.meta_run_tree['traces', ctx.idx, 'metric']
+        self.assertEqual(20, traces['last_step'])
+        self.assertEqual(5, traces['last'])
+        self.assertEqual(-2.0, traces['min'])
+        self.assertEqual(5, traces['max'])
+        metric = run.get_metric('metric', ctx)
+        steps, (values, epochs, _) = metric.data.numpy()
+        self.assertListEqual([0, 1, 2, 3, 10, 20], steps.tolist())
+        self.assertListEqual([1.0, 3.0, -2.0, 0.5, 4.0, 5.0], values.tolist())
+        self.assertListEqual([1, 2], epochs[-2:].tolist())
+
+        with self.assertRaises(ValueError):
+            run.track_many('metric', np.array([[1.0, 2.0]]))
+        with self.assertRaises(ValueError):
+            run.track_many('metric', ['a', 'b'])
+        with self.assertRaises(ValueError):
+            run.track_many('metric', np.array([True, False]))
+        with self.assertRaises(ValueError):
+            run.track_many('metric', [1.0, 2.0], steps=[1])
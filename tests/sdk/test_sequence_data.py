@@ -0,0 +1,333 @@
+import numpy as np
+
+from tests.base import TestBase
+
+from aim.sdk.objects import Text
+from aim.sdk.run import Run
+from aim.sdk.tracker import METRIC_SEQUENCE_VERSION
+from aim.storage.context import Context
+from aim.storage.hashing import hash_auto
+
+
+class TestSequenceV3Data(TestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        run = cls.create_run(system_tracking_interval=None)
+        for step in range(0, 300, 3):
+            run.track(step * 0.5, name='loss', step=step, epoch=step // 30)
+        cls.run_hash = run.hash
+        run.close()
+
+    def _metric(self):
+        run = Run(self.run_hash, read_only=True)
+        return run.get_metric('loss', Context({}))
+
+    def test_metrics_tracked_in_step_order(self):
+        metric = self._metric()
+        self.assertEqual(METRIC_SEQUENCE_VERSION, metric.version)
+        steps, (values, epochs, _) = metric.data.numpy()
+        self.assertListEqual(list(range(0, 300, 3)), steps.tolist())
+        self.assertListEqual([step * 0.5 for step in range(0, 300, 3)], values.tolist())
+        self.assertListEqual([step // 30 for step in range(0, 300, 3)], epochs.tolist())
+
+    def test_range(self):
+        steps, (values,) = self._metric().data.view('val').range(10, 31).items_list()
+        self.assertListEqual([12, 15, 18, 21, 24, 27, 30], steps)
+        self.assertListEqual([step * 0.5 for step in steps], values)
+
+        steps, _ = self._metric().data.range(1000, 2000).items_list()
+        self.assertListEqual([], steps)
+
+    def test_sample(self):
+        steps, (values,) = self._metric().data.view('val').sample(10).items_list()
+        self.assertEqual(0, steps[0])
+        self.assertEqual(297, steps[-1])
+        self.assertEqual(10, len(steps))
+        self.assertListEqual(sorted(set(steps)), steps)
+        self.assertListEqual([step * 0.5 for step in steps], values)
+
+        steps, _ = self._metric().data.range(30, 60).sample(5).items_list()
+        self.assertTrue(all(30 <= step < 60 for step in steps))
+        self.assertEqual(30, steps[0])
+
+    def test_values_at(self):
+        steps = np.array([3, 0, 4, 297, 300, 3])
+        values = self._metric().data.values_at(steps)
+        np.testing.assert_array_equal([1.5, 0, np.nan, 148.5, np.nan, 1.5], values)
+
+        values = self._metric().data.range(0, 100).values_at(steps)
+        np.testing.assert_array_equal([1.5, 0, np.nan, np.nan, np.nan, 1.5], values)
+        self.assertEqual(0, len(self._metric().data.values_at(np.array([], dtype=np.int64))))
+
+    def test_arrays_indexed_by_steps(self):
+        metric = self._metric()
+        steps, values = metric.values.sparse_numpy()
+        self.assertListEqual(list(range(0, 300, 3)), steps.tolist())
+        self.assertListEqual([step * 0.5 for step in range(0, 300, 3)], values.tolist())
+        self.assertEqual((297, 148.5), metric.values.last())
+        self.assertEqual(0, metric.values.first_idx())
+        self.assertEqual(4, metric.epochs[120])
+        self.assertListEqual([0, 3, 6], list(metric.timestamps.indices())[:3])
+        self.assertEqual(298, len(metric))
+
+    def test_dataframe_only_last(self):
+        df = self._metric().dataframe(only_last=True)
+        self.assertListEqual([297], df['step'].tolist())
+        self.assertListEqual([148.5], df['value'].tolist())
+
+    def test_negative_steps(self):
+        run = self.create_run(system_tracking_interval=None)
+        for step in (3, -5, 0, -2, 7):
+            run.track(float(step), name='loss', step=step)
+        run_hash = run.hash
+        run.close()
+
+        metric = Run(run_hash, read_only=True).get_metric('loss', Context({}))
+        steps, (values, _, _) = metric.data.numpy()
+        self.assertListEqual([-5, -2, 0, 3, 7], steps.tolist())
+        self.assertListEqual([-5.0, -2.0, 0.0, 3.0, 7.0], values.tolist())
+
+        steps, _ = metric.data.range(-3, 4).items_list()
+        self.assertListEqual([-2, 0, 3], steps)
+
+        steps, _ = metric.data.sample(3).items_list()
+        self.assertEqual(-5, steps[0])
+        self.assertEqual(7, steps[-1])
+
+        values = metric.data.values_at(np.array([-5, -4, 0, 7]))
+        np.testing.assert_array_equal([-5.0, np.nan, 0.0, 7.0], values)
+
+        df = metric.dataframe(only_last=True)
+        self.assertListEqual([7], df['step'].tolist())
+
+    def test_update_v2_metrics(self):
+        run = self.create_run(system_tracking_interval=None)
+        ctx_id = Context({}).idx
+        series = run.series_run_trees[2].subtree((ctx_id, 'legacy'))
+        step_view = series.array('step', dtype='int64').allocate()
+        val_view = series.array('val').allocate()
+        epoch_view = series.array('epoch', dtype='int64').allocate()
+        time_view = series.array('time', dtype='int64').allocate()
+        for step in (5, 1, 3):
+            step_hash = hash_auto(step)
+            step_view[step_hash] = step
+            val_view[step_hash] = step * 2
+            epoch_view[step_hash] = None
+            time_view[step_hash] = 0
+        run.meta_run_tree['traces', ctx_id, 'legacy'] = {
+            'dtype': 'int', 'version': 2, 'first_step': 1, 'last_step': 5, 'last': 10
+        }
+        run_hash = run.hash
+        self.assertTrue(run.check_metrics_version(METRIC_SEQUENCE_VERSION))
+        self.assertFalse(run.check_metrics_version())
+
+        run.update_metrics()
+        self.assertFalse(run.check_metrics_version(METRIC_SEQUENCE_VERSION))
+        self.assertEqual(2, run.meta_run_tree['traces', ctx_id, 'legacy', 'min'])
+        self.assertListEqual([4, 8, 12, 16], run.meta_run_tree['traces', ctx_id, 'legacy', 'lod_levels'])
+        run.close()
+
+        metric = Run(run_hash, read_only=True).get_metric('legacy', Context({}))
+        self.assertEqual(METRIC_SEQUENCE_VERSION, metric.version)
+        steps, (values,) = metric.data.view('val').items_list()
+        self.assertListEqual([1, 3, 5], steps)
+        self.assertListEqual([2, 6, 10], values)
+
+
+class TestSequenceV1Data(TestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        run = cls.create_run(system_tracking_interval=None)
+        for step in range(100):
+            run.track(Text(f'text {step}'), name='texts', step=step)
+            if step % 10 == 0:
+                run.track([Text(f'text {step}'), Text('')], name='text lists', step=step)
+        for step in list(range(10)) + list(range(1000, 1010)):
+            run.track(Text(f'text {step}'), name='sparse texts', step=step)
+        cls.run_hash = run.hash
+        run.close()
+
+    def _sequence(self, name):
+        run = Run(self.run_hash, read_only=True)
+        return run.get_text_sequence(name, Context({}))
+
+    def test_range(self):
+        steps, (values, _, _) = self._sequence('texts').data.range(10, 15).items_list()
+        self.assertListEqual([10, 11, 12, 13, 14], steps)
+        self.assertListEqual([f'text {step}' for step in steps], [text.data for text in values])
+
+        data = self._sequence('text lists').data.range(15, 45)
+        self.assertListEqual([20, 30, 40], data.indices_list())
+        steps, (values, _, _) = data.items_list()
+        self.assertListEqual([20, 30, 40], steps)
+        self.assertListEqual([[f'text {step}', ''] for step in steps], [[t.data for t in val] for val in values])
+
+    def test_sample(self):
+        data = self._sequence('texts').data.sample(10)
+        steps, (values, epochs, _) = data.items_list()
+        self.assertListEqual(list(range(0, 100, 10)) + [99], steps)
+        self.assertListEqual(steps, data.indices_list())
+        self.assertListEqual([f'text {step}' for step in steps], [text.data for text in values])
+        self.assertListEqual([None] * len(steps), epochs)
+
+        steps, _ = self._sequence('text lists').data.sample(3).items_list()
+        self.assertListEqual([0, 30, 60, 90], steps)
+
+    def test_sample_sparse_steps(self):
+        # the records are sampled evenly, regardless of the gaps between the steps
+        data = self._sequence('sparse texts').data.sample(5)
+        steps, (values, _, _) = data.items_list()
+        self.assertListEqual([0, 4, 8, 1002, 1006, 1009], steps)
+        self.assertListEqual([f'text {step}' for step in steps], [text.data for text in values])
+
+        steps, _ = self._sequence('sparse texts').data.range(5, 1005).sample(3).items_list()
+        self.assertListEqual([5, 8, 1001, 1004], steps)
+
+
+class TestMetricSummaries(TestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        run = cls.create_run(system_tracking_interval=None)
+        for step in range(5000):
+            val = 100 if step == 1234 else -50 if step == 4321 else step % 7
+            run.track(val, name='loss', step=step)
+        cls.run_hash = run.hash
+        run.close()
+
+    def _metric(self, name='loss', run_hash=None):
+        run = Run(run_hash or self.run_hash, read_only=True)
+        return run.get_metric(name, Context({}))
+
+    def test_summaries(self):
+        run = Run(self.run_hash, read_only=True)
+        meta = run.meta_run_tree['traces', Context({}).idx, 'loss']
+        self.assertEqual(-50, meta['min'])
+        self.assertEqual(100, meta['max'])
+        self.assertEqual(4999 % 7, meta['last'])
+        self.assertListEqual([4, 8, 12, 16], meta['lod_levels'])
+
+    def test_sample_keeps_extremes(self):
+        for n_items in (10, 50, 500):
+            steps, (values,) = self._metric().data.view('val').sample(n_items).items_list()
+            self.assertEqual(n_items, len(steps))
+            self.assertListEqual(sorted(set(steps)), steps)
+            self.assertEqual(0, steps[0])
+            self.assertEqual(4999, steps[-1])
+            self.assertIn(1234, steps)
+            self.assertIn(4321, steps)
+            self.assertEqual(100, max(values))
+            self.assertEqual(-50, min(values))
+
+        steps, _ = self._metric().data.range(1000, 2000).sample(20).items_list()
+        self.assertTrue(all(1000 <= step < 2000 for step in steps))
+        self.assertIn(1234, steps)
+
+    def test_resumed_run(self):
+        run = self.create_run(system_tracking_interval=None)
+        for step in range(0, 1000):
+            run.track(step % 5, name='loss', step=step)
+        run_hash = run.hash
+        run.close()
+        run = Run(run_hash)
+        seq_info = run._tracker.sequence_infos[Context({}).idx, 'loss']
+        # the open level-of-detail buckets are not read until the sequence is tracked
+        self.assertIsNone(seq_info.lod_buckets)
+        for step in range(1000, 2000):
+            run.track(-10 if step == 1001 else step % 5, name='loss', step=step)
+        self.assertIsNotNone(seq_info.lod_buckets)
+        run.close()
+
+        run = Run(run_hash, read_only=True)
+        self.assertEqual(-10, run.meta_run_tree['traces', Context({}).idx, 'loss', 'min'])
+        steps, _ = self._metric(run_hash=run_hash).data.sample(10).items_list()
+        self.assertIn(1001, steps)
+
+    def test_out_of_order_steps_disable_lod(self):
+        run = self.create_run(system_tracking_interval=None)
+        for step in list(range(100)) + [5]:
+            run.track(step, name='loss', step=step)
+        run_hash = run.hash
+        run.close()
+
+        run = Run(run_hash, read_only=True)
+        self.assertNotIn('lod_levels', run.meta_run_tree['traces', Context({}).idx, 'loss'])
+        steps, _ = self._metric(run_hash=run_hash).data.sample(10).items_list()
+        self.assertEqual(10, len(steps))
+
+    def test_track_many_summaries(self):
+        run = self.create_run(system_tracking_interval=None)
+        for start in range(0, 5000, 700):
+            steps = np.arange(start, min(start + 700, 5000))
+            values = np.where(steps == 1234, 100, np.where(steps == 4321, -50, steps % 7))
+            run.track_many('loss', values, steps=steps)
+        run_hash = run.hash
+        run.close()
+
+        self._check_same_summaries(self.run_hash, run_hash)
+
+    def test_nan_values_skipped_in_summaries(self):
+        run = self.create_run(system_tracking_interval=None)
+        run.track(float('nan'), name='loss', step=0)
+        for step in range(1, 100):
+            run.track(float('nan') if step % 10 == 0 else float(step), name='loss', step=step)
+        run.track_many('loss', np.array([float('nan'), -5.0]), steps=np.array([100, 101]))
+        run_hash = run.hash
+        run.close()
+
+        run = Run(run_hash, read_only=True)
+        meta = run.meta_run_tree['traces', Context({}).idx, 'loss']
+        self.assertEqual(-5, meta['min'])
+        self.assertEqual(99, meta['max'])
+        lod = self._lod_items(run_hash, 4)
+        self.assertFalse(np.isnan(lod['min'][1]).any())
+        self.assertEqual(1, lod['min'][1][0])
+        self.assertEqual(1, lod['min_step'][1][0])
+
+    def test_tracked_again_steps_replaced_in_summaries(self):
+        run = self.create_run(system_tracking_interval=None)
+        for step in range(5000):
+            val = 100 if step == 1234 else -50 if step == 4321 else step % 7
+            run.track(50, name='loss', step=step)
+            run.track(val, name='loss', step=step)
+        run_hash = run.hash
+        run.close()
+        self._check_same_summaries(self.run_hash, run_hash)
+
+        run = self.create_run(system_tracking_interval=None)
+        for start in range(0, 5000, 700):
+            steps = np.arange(start, min(start + 700, 5000))
+            values = np.where(steps == 1234, 100, np.where(steps == 4321, -50, steps % 7))
+            values = np.stack((np.full(len(steps), 50), values), axis=1).ravel()
+            run.track_many('loss', values, steps=np.repeat(steps, 2))
+        run_hash = run.hash
+        run.close()
+        self._check_same_summaries(self.run_hash, run_hash)
+
+    def _lod_items(self, run_hash, level):
+        run = Run(run_hash, read_only=True)
+        lod_tree = run.series_run_trees[3].subtree((Context({}).idx, 'loss', 'lod', level))
+        return {column: lod_tree.items_numpy(column) for column in ('min', 'max', 'mean', 'min_step', 'max_step')}
+
+    def _check_same_summaries(self, expected_run_hash, run_hash):
+        run = Run(run_hash, read_only=True)
+        expected_run = Run(expected_run_hash, read_only=True)
+        ctx_idx = Context({}).idx
+        self.assertDictEqual(expected_run.meta_run_tree['traces', ctx_idx, 'loss'],
+                             run.meta_run_tree['traces', ctx_idx, 'loss'])
+        for level in (4, 8, 12, 16):
+            expected_lod, lod = self._lod_items(expected_run_hash, level), self._lod_items(run_hash, level)
+            for column in expected_lod:
+                np.testing.assert_array_equal(expected_lod[column][0], lod[column][0])
+                np.testing.assert_array_equal(expected_lod[column][1], lod[column][1])
+
+    def test_track_many_out_of_order_steps_disable_lod(self):
+        run = self.create_run(system_tracking_interval=None)
+        run.track_many('loss', np.arange(101), steps=np.array(list(range(100)) + [5]))
+        run_hash = run.hash
+        run.close()
+
+        run = Run(run_hash, read_only=True)
+        self.assertNotIn('lod_levels', run.meta_run_tree['traces', Context({}).idx, 'loss'])
@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from aim.storage.rockscontainer import RocksContainer, batched_writes
+
+
+class TestBatchedWrites(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = tempfile.mkdtemp()
+        self.containers = [RocksContainer(os.path.join(self.path, 'meta', 'chunks', name), read_only=False)
+                           for name in ('a', 'b')]
+
+    def tearDown(self) -> None:
+        for container in self.containers:
+            container.close()
+        del self.containers
+        shutil.rmtree(self.path)
+        super().tearDown()
+
+    def test_writes_are_deferred(self):
+        container, other_container = self.containers
+        container[b'x'] = b'0'
+        with batched_writes():
+            container[b'x'] = b'1'
+            container.delete_range(b'y', b'z')
+            container[b'y'] = b'2'
+            other_container[b'x'] = b'3'
+            with batched_writes():
+                tree = container.tree()
+                tree['tree'] = {'a': 1}
+            self.assertEqual(b'0', container[b'x'])
+            self.assertIsNone(container.get(b'y'))
+            self.assertIsNone(other_container.get(b'x'))
+            self.assertIsNone(tree.get('tree'))
+        self.assertEqual(b'1', container[b'x'])
+        self.assertEqual(b'2', container[b'y'])
+        self.assertEqual(b'3', other_container[b'x'])
+        self.assertEqual({'a': 1}, container.tree()['tree'])
+
+    def test_writes_are_applied_in_order(self):
+        container, _ = self.containers
+        tree = container.tree()
+        with batched_writes():
+            tree['tree'] = {'a': 1, 'b': 2}
+            del tree['tree', 'a']
+            tree['tree', 'c'] = 3
+        self.assertEqual({'b': 2, 'c': 3}, tree['tree'])
+
+        # explicit batches share the pending batch of the container
+        with batched_writes():
+            batch = container.batch()
+            self.assertIs(batch, container.batch())
+            container.set(b'z', b'1', store_batch=batch)
+            container.commit(batch)
+            self.assertIsNone(container.get(b'z'))
+        self.assertEqual(b'1', container[b'z'])
+        self.assertIsNot(container.batch(), container.batch())
+
+    def test_writes_are_discarded_on_error(self):
+        container, other_container = self.containers
+        container[b'x'] = b'0'
+        with self.assertRaises(RuntimeError):
+            with batched_writes():
+                container[b'x'] = b'1'
+                other_container[b'x'] = b'2'
+                raise RuntimeError
+        self.assertEqual(b'0', container[b'x'])
+        self.assertIsNone(other_container.get(b'x'))
+
+        # the writes made after the failed context are not batched
+        container[b'x'] = b'3'
+        self.assertEqual(b'3', container[b'x'])
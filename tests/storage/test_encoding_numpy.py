@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from aim.storage import encoding as E
+from aim.storage.encoding.encoding_numpy import decode_array_indices, decode_array_items
+from aim.storage.treeutils import encode_tree
+
+
+def encoded_items(obj):
+    return iter(list(encode_tree(obj)))
+
+
+class TestEncodingNumpy(unittest.TestCase):
+    def test_decode_array_items(self):
+        for values in ([1, 2, 3], [1.5, -2.0, 3.25], [1, 2.5, 3], list(range(5000))):
+            indices, decoded = decode_array_items(encoded_items(values))
+            expected = np.array(values)
+            self.assertEqual(expected.dtype, decoded.dtype)
+            self.assertTrue(np.array_equal(expected, decoded))
+            self.assertTrue(np.array_equal(np.arange(len(values)), indices))
+
+    def test_decode_array_items_with_dtype_and_none(self):
+        values = [1.0, None, 3]
+        _, decoded = decode_array_items(encoded_items(values), 'float64')
+        self.assertTrue(np.array_equal(np.array(values, dtype='float64'), decoded, equal_nan=True))
+        # `None` values can not be represented without an explicit floating-point dtype
+        self.assertIsNone(decode_array_items(encoded_items(values)))
+
+    def test_decode_array_items_limit(self):
+        indices, decoded = decode_array_items(encoded_items([4, 5, 6, 7]), n_items=2)
+        self.assertListEqual([0, 1], indices.tolist())
+        self.assertListEqual([4, 5], decoded.tolist())
+
+    def test_fallback_for_non_primitive_values(self):
+        items = [[1, 2], [3]]
+        self.assertIsNone(decode_array_items(encoded_items(items)))
+        self.assertIsNone(decode_array_indices(encoded_items(items)))
+        self.assertIsNone(decode_array_items(encoded_items(['a', 'b'])))
+        self.assertIsNone(decode_array_items(encoded_items({'a': 1})))
+
+    def test_decode_array_indices(self):
+        sparse = [(E.encode_path(idx), E.encode(idx * 0.5)) for idx in (-3, 7, 2 ** 40)]
+        indices = decode_array_indices(iter(sparse))
+        self.assertListEqual([-3, 7, 2 ** 40], indices.tolist())
@@ -3,8 +3,13 @@ from parameterized import parameterized
 from tests.base import PrefilledDataTestBase
 from tests.utils import full_class_name
 
+from aim.sdk.index_manager import RepoIndexManager
+from aim.sdk.params_index import params_run_filter, params_run_hashes
+from aim.sdk.query_utils import RunView
+from aim.sdk.run import Run
 from aim.sdk.types import QueryReportMode
-from aim.storage.query import syntax_error_check
+from aim.storage.query import RestrictedPythonQuery, syntax_error_check
+from aim.storage.structured.sql_engine.query import structured_run_filter
 
 
 class TestQuery(PrefilledDataTestBase):
@@ -125,3 +130,153 @@ class TestQueryDefaultExpression(PrefilledDataTestBase):
             run_hashes.append(metric.run.hash)
             self.assertFalse(metric.run.archived)
         self.assertNotIn(self.run_hash, run_hashes)
+
+
+class TestStructuredQueryPushdown(PrefilledDataTestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        runs = sorted((run for run in cls.repo.iter_runs() if run.get('testcase') == full_class_name(cls)),
+                      key=lambda run: run['run_index'])
+        with cls.repo.structured_db:
+            runs[0].add_tag('best')
+            runs[1].add_tag('best')
+            runs[1].experiment = 'pushdown'
+            runs[2].experiment = 'pushdown'
+            runs[3].description = 'baseline run'
+
+    def _check_all_runs(self, q):
+        self.repo._prepare_runs_cache()
+        query = RestrictedPythonQuery(q)
+        return {run.hash for run in self.repo.iter_runs() if query.check(run=RunView(run))}
+
+    @parameterized.expand([
+        ('name equality', 'run.name == "Run # 2"'),
+        ('name inequality', 'run.name != "Run # 2"'),
+        ('name substring', '"# 1" in run.name'),
+        ('name prefix', 'run.name.startswith("Run # ")'),
+        ('name one of', 'run.name in ("Run # 1", "Run # 7")'),
+        ('negation', 'not run.name.endswith("3")'),
+        ('tags', '"best" in run.tags'),
+        ('tags negation', '"best" not in run.tags and run.experiment != "pushdown"'),
+        ('experiment', 'run.experiment == "pushdown" or run.name == "Run # 5"'),
+        ('description', '"baseline" in run.description'),
+        ('archived', 'not run.archived'),
+        ('mixed', 'run.experiment == "pushdown" and run.hparams.lr < 1'),
+        ('mixed disjunction', 'run.name == "Run # 3" or run.run_index == 4'),
+    ])
+    def test_query_runs_with_structured_filter(self, name, q):
+        q = self.isolated_query_patch(q)
+        run_hashes = {run.run.hash for run in self.repo.query_runs(q, report_mode=QueryReportMode.DISABLED).iter_runs()}
+        self.assertSetEqual(self._check_all_runs(q), run_hashes)
+
+        metrics = self.repo.query_metrics(q, report_mode=QueryReportMode.DISABLED)
+        metric_run_hashes = {metric.run.hash for metric in metrics}
+        self.assertSetEqual(run_hashes, metric_run_hashes)
+
+    def test_structured_filter(self):
+        self.assertIsNone(structured_run_filter('run.hparams.lr < 0.01'))
+        self.assertIsNone(structured_run_filter('run.name == "Run # 1" or run.run_index == 1'))
+        self.assertIsNone(structured_run_filter('run.archived == 0'))
+
+        run_filter = structured_run_filter('run.hparams.lr < 0.01 and run.experiment == "pushdown"')
+        run_hashes = self.repo.structured_db.filter_run_hashes(run_filter)
+        self.assertEqual(2, len(run_hashes))
+        self.assertTrue(all(self.repo.get_run(run_hash).experiment == 'pushdown' for run_hash in run_hashes))
+
+
+class TestParallelQuery(PrefilledDataTestBase):
+    def test_query_runs_in_pool(self):
+        q = self.isolated_query_patch('run.hparams.lr < 0.01 or run.name == "Run # 1"')
+        expected = [run.run.hash for run in self.repo.query_runs(q, report_mode=QueryReportMode.DISABLED).iter_runs()]
+        runs = self.repo.query_runs(q, report_mode=QueryReportMode.DISABLED, workers=2).iter_runs()
+        self.assertListEqual(expected, [run.run.hash for run in runs])
+
+        collection = self.repo.query_runs(q, report_mode=QueryReportMode.PROGRESS_TUPLE, workers=2)
+        progress = [progress for _, progress in collection.iter_runs()]
+        total_runs = self.repo.total_runs_count()
+        self.assertListEqual([(idx, total_runs) for idx in range(1, total_runs + 1)], progress)
+
+    def test_query_metrics_in_pool(self):
+        q = self.isolated_query_patch('metric.context.is_training == True and run.run_index < 7')
+
+        def traces(workers):
+            metrics = self.repo.query_metrics(q, report_mode=QueryReportMode.DISABLED, workers=workers)
+            return [(metric.run.hash, metric.name, metric.context.idx) for metric in metrics]
+
+        expected = traces(workers=1)
+        self.assertEqual(14, len(expected))
+        self.assertListEqual(expected, traces(workers=2))
+
+
+class TestParamsIndexPruning(PrefilledDataTestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        runs = sorted((run for run in cls.repo.iter_runs() if run.get('testcase') == full_class_name(cls)),
+                      key=lambda run: run['run_index'])
+        cls.run_hashes = [run.hash for run in runs]
+        for idx, run_hash in enumerate(cls.run_hashes):
+            run = Run(run_hash, system_tracking_interval=None)
+            run['hparams'] = {'lr': 10 ** -idx, 'batch_size': 2 ** idx, 'optimizer': 'adam' if idx % 2 else 'sgd',
+                              'warmup': idx < 3, 'shift': -idx, 'note': 'x' * 300 if idx == 9 else f'note {idx}'}
+            run.close()
+        index_manager = RepoIndexManager.get_index_manager(cls.repo)
+        for run_hash in cls.run_hashes:
+            index_manager.index(run_hash)
+
+    def _check_all_runs(self, q):
+        self.repo._prepare_runs_cache()
+        query = RestrictedPythonQuery(q)
+        return {run.hash for run in self.repo.iter_runs() if query.check(run=RunView(run))}
+
+    @parameterized.expand([
+        ('range', 'run.hparams.lr < 0.01 and run.hparams.batch_size >= 4'),
+        ('chained range', '1e-5 <= run["hparams", "lr"] < 0.01'),
+        ('flipped', '64 == run["hparams"]["batch_size"] or 0.1 < run.hparams.lr'),
+        ('one of', 'run.hparams.optimizer in ["sgd", "rmsprop"] and run.hparams.batch_size > 2'),
+        ('strings range', 'run.hparams.optimizer >= "b"'),
+        ('bool as number', 'run.hparams.warmup == 1'),
+        ('number as bool', 'run.hparams.batch_size == True'),
+        ('negative', 'run.hparams.shift < -5 or run.hparams.shift == -0.0'),
+        ('long string', 'run.hparams.note > "note 5" or run.hparams.note == "note 1"'),
+        ('not indexed', 'run.hparams.lr != 0.1 and not run.hparams.batch_size > 4'),
+        ('missing param', 'run.hparams.momentum < 1 or run.hparams.momentum == None'),
+        ('type mismatch', 'run.hparams.optimizer < 1 or run.hparams.lr == "0.1"'),
+    ])
+    def test_query_runs_with_params_index(self, name, q):
+        q = self.isolated_query_patch(q)
+        run_hashes = {run.run.hash for run in self.repo.query_runs(q, report_mode=QueryReportMode.DISABLED).iter_runs()}
+        self.assertSetEqual(self._check_all_runs(q), run_hashes)
+
+        metrics = self.repo.query_metrics(q, report_mode=QueryReportMode.DISABLED)
+        self.assertSetEqual(run_hashes, {metric.run.hash for metric in metrics})
+
+    def test_params_run_hashes(self):
+        self.assertIsNone(params_run_filter('run.hparams.lr != 0.01'))
+        self.assertIsNone(params_run_filter('run.name == "Run # 1" or run.hparams.lr < 0.01'))
+        self.assertIsNone(params_run_filter('run["__system_params"]["arch"] == "x86_64"'))
+
+        q = RestrictedPythonQuery(self.isolated_query_patch('run.hparams.lr < 0.005 and run.hparams.batch_size <= 16'))
+        candidates = params_run_hashes(self.repo, q)
+        self.assertSetEqual(set(self.run_hashes[3:5]), candidates.intersection(self.run_hashes))
+
+    def test_resumed_run(self):
+        run = self.create_run(system_tracking_interval=None)
+        run['hparams'] = {'lr': 1}
+        run_hash = run.hash
+        run.close()
+        del run
+        RepoIndexManager.get_index_manager(self.repo).index(run_hash)
+
+        run = Run(run_hash, system_tracking_interval=None)
+        run['hparams', 'lr'] = 0.5
+        q = RestrictedPythonQuery(self.isolated_query_patch('run.hparams.lr == 0.5'))
+        self.assertIn(run_hash, params_run_hashes(self.repo, q))
+        run.close()
+        del run
+
+        RepoIndexManager.get_index_manager(self.repo).index(run_hash)
+        self.assertIn(run_hash, params_run_hashes(self.repo, q))
+        q = RestrictedPythonQuery(self.isolated_query_patch('run.hparams.lr == 1'))
+        self.assertNotIn(run_hash, params_run_hashes(self.repo, q))
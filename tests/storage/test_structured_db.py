@@ -1,6 +1,12 @@
+import datetime
+import gc
+import weakref
+
 from tests.base import PrefilledDataTestBase
 
 from aim.sdk.utils import generate_run_hash
+from aim.storage.structured.db import DB
+from aim.storage.structured.sql_engine.models import Run as RunModel
 
 class TestStructuredDatabase(PrefilledDataTestBase):
     def test_entity_chaining_syntax(self):
@@ -31,3 +37,79 @@ class TestStructuredDatabase(PrefilledDataTestBase):
         experiment_names = set((exp.name for exp in self.repo.structured_db.experiments()))
         expected_names = set(('exp 1', 'exp 2'))
         self.assertTrue(experiment_names.issuperset(expected_names))
+
+    def test_runs_activity(self):
+        created_at = datetime.datetime(2022, 1, 1, 10, 30)
+        with self.repo.structured_db as db:
+            exp = db.create_experiment('activity experiment')
+            runs = [db.create_run(generate_run_hash(), created_at=created_at) for _ in range(3)]
+            for run in runs:
+                run.experiment = 'activity experiment'
+            runs[0].archived = True
+
+        activity = self.repo.structured_db.runs_activity(60, exp.uuid, [runs[1].hash, generate_run_hash()])
+        self.assertEqual(3, activity['num_runs'])
+        self.assertEqual(1, activity['num_archived_runs'])
+        self.assertEqual(1, activity['num_active_runs'])
+        self.assertDictEqual({'2022-01-01T09:00:00': 3}, activity['activity_map'])
+
+        activity = self.repo.structured_db.runs_activity(-120)
+        self.assertEqual(len(self.repo.structured_db.runs()), activity['num_runs'])
+        self.assertEqual(3, activity['activity_map']['2022-01-01T12:00:00'])
+        self.assertNotIn('num_active_runs', activity)
+
+        self.assertIsNone(self.repo.structured_db.runs_activity(0, 'missing_experiment_uuid'))
+
+    def test_runs_cache_refresh(self):
+        db = self.repo.structured_db
+        db.init_runs_cache()
+        cache = db.runs_cache
+        run_hash = generate_run_hash()
+        with db:
+            db.create_run(run_hash)
+        db.init_runs_cache()
+        self.assertEqual(run_hash, cache.keys()[0])
+        self.assertEqual('default', cache[run_hash].experiment)
+
+        # the props set on the cached row are written to the database
+        cache[run_hash].name = 'cached run'
+        self.assertEqual('cached run', db.find_run(run_hash).name)
+        self.assertEqual('cached run', cache[run_hash].name)
+
+        db.find_run(run_hash).add_tag('cached tag')
+        cache.invalidate(run_hash)
+        self.assertListEqual(['cached tag'], cache[run_hash].tags)
+
+        with db:
+            db.delete_run(run_hash)
+        db.init_runs_cache()
+        self.assertNotIn(run_hash, cache.keys())
+        self.assertFalse(cache[run_hash])
+
+    def test_runs_cache_late_commit(self):
+        db = self.repo.structured_db
+        run_hash = generate_run_hash()
+        with db:
+            db.create_run(run_hash)
+        db.init_runs_cache()
+        cache = db.runs_cache
+
+        # an update committed after the refresh, although flushed before it
+        session = db.get_session(autocommit=False)
+        session.query(RunModel).filter(RunModel.hash == run_hash).update({
+            'name': 'late run', 'updated_at': cache._watermark - datetime.timedelta(seconds=10)
+        })
+        session.commit()
+        db.init_runs_cache()
+        self.assertEqual('late run', cache[run_hash].name)
+
+    def test_runs_cache_does_not_keep_db_alive(self):
+        db = DB(self.repo.structured_db.path)
+        try:
+            db.init_runs_cache()
+            db_ref = weakref.ref(db)
+            del db
+            gc.collect()
+            self.assertIsNone(db_ref())
+        finally:
+            self.repo.structured_db.init_runs_cache()
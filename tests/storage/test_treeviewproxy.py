@@ -0,0 +1,89 @@
+from tests.base import TestBase
+
+from aim.storage.treeviewproxy import ProxyTree
+
+
+class LocalClient:
+    """Runs the instructions of `ProxyTree` against a local tree, counting the reads."""
+    def __init__(self, tree):
+        self.tree = tree
+        self.reads = []
+
+    def get_resource_handler(self, resource, resource_type, handler='', args=()):
+        return 'handler'
+
+    def release_resource(self, queue_id, resource_handler):
+        pass
+
+    def run_instruction(self, queue_id, resource, method, args=(), is_write_only=False):
+        if not is_write_only:
+            self.reads.append(method)
+        return getattr(self.tree, method)(*args)
+
+
+class TestProxyTreePrefetch(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        run = self.create_run(system_tracking_interval=None)
+        run['hparams'] = {'lr': 0.1, 'opt': {'name': 'adam', 'betas': [0.9, 0.99]}, 'none': None}
+        self.run = run
+        self.client = LocalClient(run.meta_run_tree)
+        self.tree = ProxyTree(self.client, 'meta', run.hash, read_only=True)
+
+    def tearDown(self) -> None:
+        self.run.close()
+        del self.run
+        super().tearDown()
+
+    def test_collect_many(self):
+        self.assertListEqual([0.1, 'adam', None, -1],
+                             self.tree.collect_many([('attrs', 'hparams', 'lr'),
+                                                     ('attrs', 'hparams', 'opt', 'name'),
+                                                     ('attrs', 'hparams', 'none'),
+                                                     ('attrs', 'missing')], default=-1))
+        self.assertListEqual(['collect_many'], self.client.reads)
+
+    def test_prefetch(self):
+        attrs = self.tree.subtree('attrs')
+        attrs.prefetch()
+        attrs.prefetch('hparams')  # already fetched
+        self.assertListEqual(['collect_many'], self.client.reads)
+
+        self.assertEqual(0.1, attrs['hparams', 'lr'])
+        self.assertEqual(0.99, attrs.subtree(('hparams', 'opt')).collect(('betas', 1)))
+        self.assertListEqual(['betas', 'name'], sorted(attrs.subtree(('hparams', 'opt')).keys()))
+        self.assertIsNone(attrs.get(('hparams', 'missing')))
+        with self.assertRaises(KeyError):
+            attrs.collect(('hparams', 'lr', 'x'))
+        self.assertListEqual(['collect_many'], self.client.reads)
+
+        # the collected objects are copies
+        attrs['hparams', 'opt']['name'] = 'sgd'
+        self.assertEqual('adam', attrs['hparams', 'opt', 'name'])
+
+        # writes drop the overlapping subtrees
+        attrs['hparams', 'lr'] = 0.2
+        self.assertEqual(0.2, attrs['hparams', 'lr'])
+        self.assertListEqual(['collect_many', 'collect'], self.client.reads)
+
+    def test_prefetch_none(self):
+        self.tree.prefetch(('attrs', 'missing'), ('attrs', 'hparams', 'none'))
+        self.tree.prefetch(('attrs', 'missing'))  # already fetched
+        with self.assertRaises(KeyError):
+            self.tree.collect(('attrs', 'missing', 'x'))
+        with self.assertRaises(KeyError):
+            self.tree.collect(('attrs', 'hparams', 'none', 'x'))
+        self.assertListEqual(['collect_many'], self.client.reads)
+
+        # missing paths are not told apart from `None` values, those are read from the server
+        self.assertIsNone(self.tree.collect(('attrs', 'hparams', 'none')))
+        with self.assertRaises(KeyError):
+            self.tree.collect(('attrs', 'missing'))
+        self.assertListEqual(['collect_many', 'collect', 'collect'], self.client.reads)
+
+    def test_drop_prefetched(self):
+        self.tree.prefetch(('attrs', 'hparams'))
+        self.run['hparams', 'lr'] = 0.3
+        self.assertEqual(0.1, self.tree['attrs', 'hparams', 'lr'])
+        self.tree.drop_prefetched()
+        self.assertEqual(0.3, self.tree['attrs', 'hparams', 'lr'])
@@ -0,0 +1,61 @@
+from tests.base import TestBase
+
+from aim.sdk.index_manager import RepoIndexManager
+from aim.sdk.run import Run
+from aim.storage.encoding import encode_path
+
+
+class TestUnionRouting(TestBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        run = cls.create_run(system_tracking_interval=None)
+        run['hparams'] = {'lr': 0.1}
+        run['finished_only'] = 1
+        cls.finished_run_hash = run.hash
+        run.close()
+        del run
+        RepoIndexManager.get_index_manager(cls.repo).index(cls.finished_run_hash)
+
+        cls.active_run = cls.create_run(system_tracking_interval=None)
+        cls.active_run['hparams'] = {'lr': 0.2, 'momentum': 0.9}
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.active_run.close()
+        del cls.active_run
+        super().tearDownClass()
+
+    def test_route(self):
+        db = self.repo._get_container('meta', read_only=True, from_union=True).db
+        active_prefix = encode_path(('meta', 'chunks', self.active_run.hash))
+        finished_prefix = encode_path(('meta', 'chunks', self.finished_run_hash))
+
+        self.assertIs(db.dbs[active_prefix], db.route(active_prefix))
+        self.assertIs(db.dbs[active_prefix], db.route(active_prefix + encode_path(('attrs', 'hparams'))))
+        self.assertIs(db.dbs[b''], db.route(finished_prefix))
+        self.assertIs(db.dbs[b''], db.route(finished_prefix + encode_path(('attrs', 'hparams'))))
+        # key ranges spanning multiple Runs are merged
+        self.assertIsNone(db.route(encode_path(('meta', 'chunks'))))
+        self.assertIsNone(db.route(encode_path(('meta', 'chunks'))[:-1] + self.active_run.hash[:4].encode()))
+        self.assertIsNone(db.route(encode_path(('meta', 'attrs'))))
+
+    def test_read_run_trees(self):
+        meta_tree = self.repo._get_meta_tree()
+        self.assertEqual(0.1, meta_tree['chunks', self.finished_run_hash, 'attrs', 'hparams', 'lr'])
+        self.assertEqual(0.2, meta_tree['chunks', self.active_run.hash, 'attrs', 'hparams', 'lr'])
+        self.assertEqual({'lr': 0.2, 'momentum': 0.9},
+                         meta_tree.subtree(('chunks', self.active_run.hash, 'attrs', 'hparams')).collect())
+        self.assertEqual(0.1, Run(self.finished_run_hash, read_only=True)['hparams', 'lr'])
+
+        run_hashes = set(meta_tree.subtree('chunks').keys())
+        self.assertIn(self.finished_run_hash, run_hashes)
+        self.assertIn(self.active_run.hash, run_hashes)
+
+    def test_merge_chunks_with_index(self):
+        # the keys of the Runs in progress following the keys found in the index only are not skipped
+        params = self.repo.collect_params_info()
+        self.assertIn('finished_only', params)
+        self.assertIn('lr', params['hparams'])
+        self.assertIn('momentum', params['hparams'])
+        self.assertIn('testcase', params)
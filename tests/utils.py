@@ -12,6 +12,7 @@ from sqlalchemy import text as sa_text
 from aim.sdk.repo import Repo
 from aim.sdk.run import Run
 from aim.sdk.objects.image import Image as AimImage
+from aim.storage.treeutils import decode_tree
 from aim.storage.structured.sql_engine.models import Base as StructuredBase
 from aim.web.api.db import get_contexted_session
 from aim.web.api.db import Base as ApiBase
@@ -54,6 +55,29 @@ def decode_encoded_tree_stream(stream: Iterator[bytes], concat_chunks=False) ->
         assert prev_chunk_tail == b''
 
 
+def decode_columnar_stream(stream: Iterator[bytes]) -> Iterator[dict]:
+    data = b''.join(stream)
+    while data:
+        header_size, columns_size = struct.unpack('<II', data[:8])
+        columns_start = 8 + header_size + (-header_size % 8)
+        header, columns = data[8:8 + header_size], data[columns_start:columns_start + columns_size]
+        data = data[columns_start + columns_size:]
+
+        tree = decode_tree(decode_encoded_tree_stream([header]))
+        yield _resolve_columns(tree, memoryview(columns))
+
+
+def _resolve_columns(tree, columns: memoryview):
+    if isinstance(tree, dict):
+        if tree.get('type') == 'column':
+            dtype = numpy.dtype('<f8' if tree['dtype'] == 'float64' else '<i8')
+            return numpy.frombuffer(columns, dtype=dtype, count=tree['shape'], offset=tree['offset'])
+        return {key: _resolve_columns(val, columns) for key, val in tree.items()}
+    if isinstance(tree, list):
+        return [_resolve_columns(val, columns) for val in tree]
+    return tree
+
+
 def generate_image_set(img_count, caption_prefix='Image', img_size=(16, 16)):
     return [
         AimImage(